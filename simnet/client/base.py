@@ -1,6 +1,7 @@
 import logging
 import typing
 import uuid
+from collections.abc import Awaitable, Hashable
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 
@@ -16,6 +17,7 @@ from simnet.errors import (
     TimedOut,
     raise_for_ret_code,
 )
+from simnet.utils.cache import TTL, BaseCache
 from simnet.utils.ds import DSType, generate_dynamic_secret, hex_digest
 from simnet.utils.enums import Game, Region
 from simnet.utils.types import (
@@ -30,6 +32,8 @@ from simnet.utils.types import (
 
 _LOGGER = logging.getLogger("SIMNet.BaseClient")
 
+T = typing.TypeVar("T")
+
 __all__ = ("BaseClient",)
 
 
@@ -53,10 +57,17 @@ class BaseClient(AbstractAsyncContextManager["BaseClient"]):
         region (Region): The region used for the client.
         lang (str): The language used for the client.
         game (typing.Optional[Game]): The game used for the client.
+        shared_cache (typing.Optional[BaseCache]): The process-wide cache of the responses that are the same
+            for every player of a server and language, such as announcements and calculator data, shared by every
+            client. None, the default, disables it, set it to a cache such as `MemoryCache(maxsize=256)` to
+            enable it.
+        shared_ttl (float): The time to live of the shared responses, in seconds.
 
     """
 
     game: typing.Optional[Game] = None
+    shared_cache: typing.Optional[BaseCache] = None
+    shared_ttl: float = 60 * 60
     __device_id = str(uuid.uuid3(uuid.NAMESPACE_URL, "SIMNet"))
 
     def __init__(
@@ -89,6 +100,28 @@ class BaseClient(AbstractAsyncContextManager["BaseClient"]):
         self.device_id = device_id or cookies.get("x-rpc-device_id", None)
         self.device_fp = device_fp or cookies.get("x-rpc-device_fp", None)
 
+    async def _get_shared(
+        self,
+        key: tuple[Hashable, ...],
+        factory: typing.Callable[[], Awaitable[T]],
+        ttl: TTL = None,
+    ) -> T:
+        """Get a response that is the same for every player of a server and language through `shared_cache`,
+        when enabled.
+
+        Args:
+            key (Tuple[Hashable, ...]): The key of the response, made of the endpoint, the game, the server
+                and the language, never of the account.
+            factory (Callable[[], Awaitable[T]]): The coroutine function requesting the response.
+            ttl (TTL, optional): The time to live or expiry policy of the response. Defaults to `shared_ttl`.
+
+        Returns:
+            T: The cached or freshly requested response.
+        """
+        if self.shared_cache is None:
+            return await factory()
+        return await self.shared_cache.get_or_set(key, factory, self.shared_ttl if ttl is None else ttl)
+
     @property
     def cookies(self) -> Cookies:
         """Get the cookies used for the client."""
@@ -12,12 +12,22 @@ from simnet.models.genshin.calculator import (
     CalculatorTalent,
     CalculatorWeapon,
 )
+from simnet.utils.catalogue import CalculatorCatalogue, CatalogueEntry
 from simnet.utils.enums import Region
 from simnet.utils.player import recognize_genshin_server
 
 
 class CalculatorClient(BaseClient):
-    """A client for retrieving data from Genshin's calculator component."""
+    """A client for retrieving data from Genshin's calculator component.
+
+    Attributes:
+        calculator_catalogue (Optional[CalculatorCatalogue]): The process-wide catalogue of the calculator items,
+            shared by every client. It answers the unsynced character, weapon and furnishing queries locally.
+            None, the default, disables it, set it to `CalculatorCatalogue()` to keep it in memory or to
+            `CalculatorCatalogue(path)` to persist it to disk.
+    """
+
+    calculator_catalogue: Optional[CalculatorCatalogue] = None
 
     async def request_calculator(
         self,
@@ -131,6 +141,18 @@ class CalculatorClient(BaseClient):
             player_id = player_id or self.player_id
             payload["uid"] = player_id
             payload["region"] = recognize_genshin_server(player_id)
+        elif not query:
+            # the catalogue is the same for every player of the region, see `shared_cache`,
+            # free-text searches are always requested
+            key = ("calculator_items", self.game, self.region, lang or self.lang, slug) + tuple(
+                (name, tuple(value) if isinstance(value, list) else value) for name, value in payload.items()
+            )
+
+            async def fetch() -> list[dict[str, Any]]:
+                data = await self.request_calculator(endpoint, lang=lang, data=payload)
+                return data["list"]
+
+            return list(await self._get_shared(key, fetch))
 
         try:
             data = await self.request_calculator(endpoint, lang=lang, data=payload)
@@ -145,6 +167,39 @@ class CalculatorClient(BaseClient):
 
         return data["list"]
 
+    async def _get_calculator_catalogue(
+        self,
+        slug: str,
+        filters: dict[str, Any],
+        *,
+        is_all: bool = False,
+        lang: Optional[str] = None,
+    ) -> CatalogueEntry:
+        """Get every item of a slug from `calculator_catalogue`, fetching them when missing or outdated.
+
+        Args:
+            slug (str): The slug to get the items for.
+            filters (dict): The empty filters expected by the endpoint.
+            is_all (bool): Whether to include Traveler items (default False).
+            lang (str): The language to use for the request (default None).
+
+        Returns:
+            CatalogueEntry: The catalogue of the items.
+
+        Raises:
+            RuntimeError: If `calculator_catalogue` is not set.
+        """
+        if self.calculator_catalogue is None:
+            raise RuntimeError("The calculator catalogue is disabled")
+
+        async def fetch() -> list[dict[str, Any]]:
+            payload = dict(page=1, size=69420, is_all=is_all, **filters)
+            data = await self.request_calculator(f"{slug}/list", lang=lang, data=payload)
+            return data["list"]
+
+        key = (self.game, self.region, lang or self.lang, slug, is_all)
+        return await self.calculator_catalogue.get(key, fetch)
+
     async def get_calculator_characters(
         self,
         *,
@@ -170,6 +225,16 @@ class CalculatorClient(BaseClient):
         Returns:
             list: A list of CalculatorCharacter objects representing the characters retrieved from the calculator.
         """
+        if self.calculator_catalogue is not None and not sync and not query:
+            catalogue = await self._get_calculator_catalogue(
+                "avatar",
+                {"element_attr_ids": [], "weapon_cat_ids": []},
+                is_all=include_traveler,
+                lang=lang,
+            )
+            data = catalogue.filter(element_attr_id=elements, weapon_cat_id=weapon_types)
+            return [CalculatorCharacter(**i) for i in data]
+
         data = await self._get_calculator_items(
             "avatar",
             lang=lang,
@@ -204,6 +269,15 @@ class CalculatorClient(BaseClient):
         Returns:
             List[CalculatorWeapon]: A list of weapons provided by the Enhancement Progression Calculator.
         """
+        if self.calculator_catalogue is not None and not query:
+            catalogue = await self._get_calculator_catalogue(
+                "weapon",
+                {"weapon_cat_ids": [], "weapon_levels": []},
+                lang=lang,
+            )
+            data = catalogue.filter(weapon_cat_id=types, weapon_level=rarities)
+            return [CalculatorWeapon(**i) for i in data]
+
         data = await self._get_calculator_items(
             "weapon",
             lang=lang,
@@ -233,6 +307,12 @@ class CalculatorClient(BaseClient):
         Returns:
             List[CalculatorFurnishing]: A list of furnishings provided by the Enhancement Progression Calculator.
         """
+        if self.calculator_catalogue is not None and not types:
+            # the items do not carry their furnishing type, only the rarity filter is answered locally
+            catalogue = await self._get_calculator_catalogue("furniture", {"cat_id": 0, "weapon_levels": 0}, lang=lang)
+            data = catalogue.filter(level=[rarities] if rarities else None)
+            return [CalculatorFurnishing(**i) for i in data]
+
         data = await self._get_calculator_items(
             "furniture",
             lang=lang,
@@ -290,13 +370,18 @@ class CalculatorClient(BaseClient):
         Returns:
             List[CalculatorTalent]: A list of talents for the specified character.
         """
-        data = await self.request_calculator(
-            "avatar/skill_list",
-            method="GET",
-            lang=lang,
-            params={"avatar_id": int(character)},
-        )
-        return [CalculatorTalent(**i) for i in data["list"]]
+
+        async def fetch() -> list[CalculatorTalent]:
+            data = await self.request_calculator(
+                "avatar/skill_list",
+                method="GET",
+                lang=lang,
+                params={"avatar_id": int(character)},
+            )
+            return [CalculatorTalent(**i) for i in data["list"]]
+
+        key = ("calculator_talents", self.game, self.region, lang or self.lang, int(character))
+        return list(await self._get_shared(key, fetch))
 
     async def get_complete_artifact_set(
         self,
@@ -314,13 +399,18 @@ class CalculatorClient(BaseClient):
         Returns:
             List[CalculatorArtifact]: A list of artifacts that share a set with the specified artifact.
         """
-        data = await self.request_calculator(
-            "reliquary/set",
-            method="GET",
-            lang=lang,
-            params={"reliquary_id": int(artifact)},
-        )
-        return [CalculatorArtifact(**i) for i in data["reliquary_list"]]
+
+        async def fetch() -> list[CalculatorArtifact]:
+            data = await self.request_calculator(
+                "reliquary/set",
+                method="GET",
+                lang=lang,
+                params={"reliquary_id": int(artifact)},
+            )
+            return [CalculatorArtifact(**i) for i in data["reliquary_list"]]
+
+        key = ("calculator_artifact_set", self.game, self.region, lang or self.lang, int(artifact))
+        return list(await self._get_shared(key, fetch))
 
     async def _get_all_artifact_ids(self, artifact_id: int) -> list[int]:
         """Get all artifact IDs in the same set as a given artifact ID.
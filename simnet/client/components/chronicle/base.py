@@ -1,14 +1,21 @@
-from typing import Any, Optional
+import asyncio
+from collections.abc import Awaitable, Collection, Hashable, Mapping
+from typing import Any, Callable, Optional, TypeVar
 
 from simnet.client.base import BaseClient
 from simnet.client.routes import RECORD_URL
-from simnet.errors import DataNotPublic
+from simnet.errors import DataNotPublic, TimedOut
 from simnet.models.lab.record import RecordCard
+from simnet.models.snapshot import ProfileSnapshot
+from simnet.utils.cache import TTL, BaseCache
 from simnet.utils.enums import Game, Region
+from simnet.utils.expiry import DailyResetExpiry
 from simnet.utils.types import QueryParamTypes
 
 __all__ = ("BaseChronicleClient",)
 
+T = TypeVar("T")
+
 
 class BaseChronicleClient(BaseClient):
     """The base class for the Chronicle API client.
@@ -19,8 +26,93 @@ class BaseChronicleClient(BaseClient):
 
     Attributes:
         region (Region): The region associated with the API client.
+        chronicle_cache (Optional[BaseCache]): The process-wide cache of the battle chronicle responses that
+            follow the daily reset and the schedules of the servers, shared by every client. None, the default,
+            disables it, set it to a cache such as `MemoryCache(maxsize=1024)` to enable it.
+        endgame_archive (Optional[BaseCache]): The process-wide cache of the endgame results of closed seasons,
+            by account and schedule ID, shared by every client. The results of a closed season never change, so
+            they never expire, and an account only reads back the results it requested itself. None, the default,
+            disables it, set it to a cache such as `MemoryCache(maxsize=4096)` to enable it.
     """
 
+    chronicle_cache: Optional[BaseCache] = None
+    endgame_archive: Optional[BaseCache] = None
+
+    async def _get_cached_record(self, key: Hashable, factory: Callable[[], Awaitable[T]], ttl: TTL) -> T:
+        """Get a battle chronicle response through `chronicle_cache`, when enabled.
+
+        Args:
+            key (Hashable): The key of the response, identifying the player and the request.
+            factory (Callable[[], Awaitable[T]]): The coroutine function requesting the response.
+            ttl (TTL): The time to live or expiry policy of the response, such as a `ScheduleExpiry`.
+
+        Returns:
+            T: The cached or freshly requested response.
+        """
+        if self.chronicle_cache is None:
+            return await factory()
+        return await self.chronicle_cache.get_or_set(key, factory, ttl)
+
+    async def _get_previous_season(
+        self,
+        game: Game,
+        endpoint: str,
+        player_id: Optional[int],
+        key: tuple[Hashable, ...],
+        factory: Callable[[], Awaitable[T]],
+        season_of: Callable[[T], Hashable],
+    ) -> T:
+        """Get the endgame results of the previous season of a player through `endgame_archive`.
+
+        The results are archived permanently under their schedule ID. Which schedule is the previous one
+        only changes when a new season opens, at a daily reset, so the schedule ID of the previous season
+        of the player is remembered until the next daily reset of their server. Both are keyed by the account
+        ID of the client, so the results are never shared between accounts. Nothing is cached when the
+        archive is disabled, the account or player ID is unknown or the results have no schedule ID.
+
+        Args:
+            game (Game): The game of the endgame mode.
+            endpoint (str): The endpoint of the endgame mode.
+            player_id (Optional[int]): The player ID.
+            key (Tuple[Hashable, ...]): The other parameters of the request, such as the language.
+            factory (Callable[[], Awaitable[T]]): The coroutine function requesting the previous season.
+            season_of (Callable[[T], Hashable]): A function getting the schedule ID of the results.
+
+        Returns:
+            T: The archived or freshly requested results.
+        """
+
+        if self.endgame_archive is None or self.account_id is None or player_id is None:
+            return await factory()
+
+        fetched: list[T] = []
+
+        async def archive() -> Optional[tuple[Hashable, ...]]:
+            value = await factory()
+            fetched.append(value)
+            season_id = season_of(value)
+            ids = season_id if isinstance(season_id, tuple) else (season_id,)
+            if not ids or not all(ids):
+                # no closed season, such as for a player who did not take part in it, nothing to archive
+                return None
+            season = (game, endpoint, self.account_id, player_id, season_id, *key)
+            await self.endgame_archive.set(season, value)
+            return season
+
+        expiry = DailyResetExpiry(player_id, game)
+        previous = ("previous_season", game, endpoint, self.account_id, player_id, *key)
+        season = await self.endgame_archive.get_or_set(previous, archive, expiry)
+        if fetched:
+            return fetched[0]
+        if season is not None:
+            value = await self.endgame_archive.get(season)
+            if value is not None:
+                return value
+        # the season has no schedule ID or its archived results were evicted since, request them again
+        season = await archive()
+        await self.endgame_archive.set(previous, season, expiry(season))
+        return fetched[0]
+
     async def request_game_record(
         self,
         endpoint: str,
@@ -60,6 +152,62 @@ class BaseChronicleClient(BaseClient):
 
         return await self.request_lab(url, data=data, params=params, lang=lang, new_ds=new_ds)
 
+    async def _get_profile_snapshot(
+        self,
+        game: Game,
+        player_id: Optional[int],
+        fetchers: Mapping[str, Callable[[], Awaitable[Any]]],
+        sections: Optional[Collection[str]] = None,
+        *,
+        timeout: Optional[float] = None,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ) -> ProfileSnapshot:
+        """Fetch several battle chronicle sections concurrently, tolerating the failure of some of them.
+
+        Any exception raised by a section, such as an API error or an unexpected payload, is recorded
+        in the errors of the snapshot instead of failing the other sections.
+
+        Args:
+            game (Game): The game of the sections.
+            player_id (Optional[int]): The player ID.
+            fetchers (Mapping[str, Callable[[], Awaitable[Any]]]): The coroutine functions fetching each
+                available section, by section name.
+            sections (Optional[Collection[str]], optional): The names of the sections to fetch.
+                Defaults to every available section.
+            timeout (Optional[float], optional): The time limit of a section, in seconds. None means no limit.
+            timeouts (Optional[Mapping[str, float]], optional): The time limits of specific sections, in seconds.
+
+        Returns:
+            ProfileSnapshot: The fetched sections and the errors of the other ones.
+
+        Raises:
+            ValueError: If a section is not available for the game.
+        """
+        names = list(fetchers) if sections is None else list(sections)
+        unknown = [name for name in names if name not in fetchers]
+        if unknown:
+            raise ValueError(f"Unknown {game.name} sections: {', '.join(unknown)}")
+        timeouts = timeouts or {}
+
+        async def fetch(name: str) -> Any:
+            try:
+                return await asyncio.wait_for(fetchers[name](), timeouts.get(name, timeout))
+            except asyncio.TimeoutError as exc:
+                raise TimedOut(f"The {name} section took too long to be fetched") from exc
+
+        results = await asyncio.gather(*(fetch(name) for name in names), return_exceptions=True)
+        sections: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                errors[name] = result
+            elif isinstance(result, BaseException):
+                # cancellation and interpreter exits are not failures of a section
+                raise result
+            else:
+                sections[name] = result
+        return ProfileSnapshot(game=game, player_id=player_id or self.player_id, sections=sections, errors=errors)
+
     async def update_settings(
         self,
         switch_id: int,
@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import AsyncIterator, Collection, Mapping, Sequence
+from functools import partial
 from typing import Any, Optional, Union
 
 from simnet.client.components.chronicle.base import BaseChronicleClient
@@ -21,12 +23,35 @@ from simnet.models.genshin.chronicle.stats import (
     PartialGenshinUserStats,
 )
 from simnet.models.lab.record import RecordCard
+from simnet.models.snapshot import ProfileSnapshot
+from simnet.utils.concurrency import iter_chunked
 from simnet.utils.enums import Game, Region
+from simnet.utils.expiry import ScheduleExpiry
 from simnet.utils.player import recognize_genshin_server, recognize_region
 
 __all__ = ("GenshinBattleChronicleClient",)
 
 
+def _character_summary(character: Union[GenshinCharacterListInfo, Character]) -> tuple[Any, ...]:
+    """Get the fields of a character shared by the character list and the character details."""
+    weapon = character.weapon
+    refinement = weapon.affix_level if isinstance(character, GenshinCharacterListInfo) else weapon.refinement
+    return (
+        character.level,
+        character.constellation,
+        character.friendship,
+        character.rarity,
+        weapon.id,
+        weapon.level,
+        refinement,
+    )
+
+
+def _schedule_ids(value: Union[ImgTheater, GenshinHardChallenge]) -> tuple[int, ...]:
+    """Get the schedule IDs of the seasons of an endgame mode."""
+    return tuple(season.schedule.id for season in value.data)
+
+
 class GenshinBattleChronicleClient(BaseChronicleClient):
     """A client for retrieving data from Genshin's battle chronicle component.
 
@@ -127,6 +152,45 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         details = await self.get_genshin_character_detail([char.id for char in characters], player_id, lang=lang)
         return [Character.from_detail(d) for d in details.characters]
 
+    async def refresh_genshin_characters(
+        self,
+        cached: Sequence[Character],
+        player_id: Optional[int] = None,
+        *,
+        lang: Optional[str] = None,
+    ) -> list[Character]:
+        """Refresh previously fetched genshin user characters.
+
+        Only the character list is fetched, and the details are requested for the characters whose
+        level, constellation, friendship, rarity or weapon changed, and for new characters. The other
+        characters are taken from the cached ones. Changes of artifacts alone are not listed, use
+        `get_genshin_characters` to fetch every detail again.
+
+        Args:
+            cached (Sequence[Character]): The characters fetched previously.
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+
+        Returns:
+            List[Character]: The refreshed genshin user characters, in the order of the character list.
+        """
+        known = {character.id: character for character in cached}
+        characters = await self.get_genshin_character_list(player_id, lang=lang)
+        changed = [
+            character.id
+            for character in characters
+            if character.id not in known or _character_summary(character) != _character_summary(known[character.id])
+        ]
+        refreshed: dict[int, Character] = {}
+        if changed:
+            details = await self.get_genshin_character_detail(changed, player_id, lang=lang)
+            refreshed = {detail.base.id: Character.from_detail(detail) for detail in details.characters}
+        return [
+            refreshed.get(character.id) or known[character.id]
+            for character in characters
+            if character.id in refreshed or character.id in known
+        ]
+
     async def get_genshin_user(
         self,
         player_id: Optional[int] = None,
@@ -163,10 +227,23 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         Returns:
             SpiralAbyss: genshin spiral abyss runs.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1}
-        data = await self._request_genshin_record("spiralAbyss", player_id, lang=lang, payload=payload)
 
-        return SpiralAbyss(**data)
+        async def fetch() -> SpiralAbyss:
+            data = await self._request_genshin_record("spiralAbyss", player_id, lang=lang, payload=payload)
+            return SpiralAbyss(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.GENSHIN, "spiralAbyss", player_id, key, fetch, lambda abyss: abyss.season
+            )
+        return await self._get_cached_record(
+            ("genshin_spiral_abyss", player_id, lang or self.lang),
+            fetch,
+            ScheduleExpiry(player_id, Game.GENSHIN),
+        )
 
     async def get_genshin_imaginarium_theater(
         self,
@@ -187,13 +264,24 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         Returns:
             ImgTheater: genshin imaginarium theater runs.
         """
+        player_id = player_id or self.player_id
         payload = {
             "need_detail": need_detail,
             "schedule_type": 2 if previous else 1,
         }
-        data = await self._request_genshin_record("role_combat", player_id, lang=lang, payload=payload)
 
-        return ImgTheater(**data)
+        async def fetch() -> ImgTheater:
+            data = await self._request_genshin_record("role_combat", player_id, lang=lang, payload=payload)
+            return ImgTheater(**data)
+
+        if previous:
+            key = (need_detail, lang or self.lang)
+            return await self._get_previous_season(Game.GENSHIN, "role_combat", player_id, key, fetch, _schedule_ids)
+        return await self._get_cached_record(
+            ("genshin_imaginarium_theater", player_id, need_detail, lang or self.lang),
+            fetch,
+            ScheduleExpiry(player_id, Game.GENSHIN),
+        )
 
     async def get_genshin_hard_challenge(
         self,
@@ -214,13 +302,24 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         Returns:
             GenshinHardChallenge: genshin hard challenge runs.
         """
+        player_id = player_id or self.player_id
         payload = {
             "need_detail": need_detail,
             "schedule_type": 2 if previous else 1,
         }
-        data = await self._request_genshin_record("hard_challenge", player_id, lang=lang, payload=payload)
 
-        return GenshinHardChallenge(**data)
+        async def fetch() -> GenshinHardChallenge:
+            data = await self._request_genshin_record("hard_challenge", player_id, lang=lang, payload=payload)
+            return GenshinHardChallenge(**data)
+
+        if previous:
+            key = (need_detail, lang or self.lang)
+            return await self._get_previous_season(Game.GENSHIN, "hard_challenge", player_id, key, fetch, _schedule_ids)
+        return await self._get_cached_record(
+            ("genshin_hard_challenge", player_id, need_detail, lang or self.lang),
+            fetch,
+            ScheduleExpiry(player_id, Game.GENSHIN),
+        )
 
     async def get_genshin_notes(
         self,
@@ -380,6 +479,8 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         player_id: Optional[int] = None,
         *,
         lang: Optional[str] = None,
+        chunk_size: int = 20,
+        concurrency: int = 4,
     ) -> GenshinDetailCharacters:
         """Retrieve detailed information about Genshin Impact characters.
 
@@ -387,17 +488,65 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
             characters (List[int]): The IDs of the characters to retrieve details for.
             player_id (Optional[int]): The ID of the player. Defaults to None.
             lang (Optional[str]): The language for the character information. Defaults to None.
+            chunk_size (int): The maximum number of characters requested at once. Defaults to 20.
+            concurrency (int): The maximum number of requests issued at once. Defaults to 4.
 
         Returns:
             GenshinDetailCharacters: An object containing detailed information.
         """
+        data: dict[str, Any] = {"list": [], "property_map": {}, "relic_property_options": {}}
+        async for chunk in self._iter_genshin_character_detail_data(
+            characters, player_id, lang=lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            data["list"].extend(chunk["list"])
+            data["property_map"].update(chunk["property_map"])
+            data["relic_property_options"].update(chunk["relic_property_options"])
+        return GenshinDetailCharacters(**data)
+
+    async def iter_genshin_character_detail(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        *,
+        lang: Optional[str] = None,
+        chunk_size: int = 20,
+        concurrency: int = 4,
+    ) -> AsyncIterator[GenshinDetailCharacters]:
+        """Retrieve detailed information about Genshin Impact characters, chunk by chunk.
+
+        Args:
+            characters (List[int]): The IDs of the characters to retrieve details for.
+            player_id (Optional[int]): The ID of the player. Defaults to None.
+            lang (Optional[str]): The language for the character information. Defaults to None.
+            chunk_size (int): The maximum number of characters requested at once. Defaults to 20.
+            concurrency (int): The maximum number of requests issued at once. Defaults to 4.
+
+        Yields:
+            GenshinDetailCharacters: The detailed information of each chunk of characters, in order.
+        """
+        async for chunk in self._iter_genshin_character_detail_data(
+            characters, player_id, lang=lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            yield GenshinDetailCharacters(**chunk)
 
+    def _iter_genshin_character_detail_data(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        *,
+        lang: Optional[str] = None,
+        chunk_size: int = 20,
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict[str, Any]]:
         ids = [characters] if isinstance(characters, int) else characters
-        payload = {"character_ids": ids}
-        data = await self._request_genshin_record(
-            "character/detail", player_id, method="POST", lang=lang, payload=payload
-        )
-        return GenshinDetailCharacters(**data)
+
+        async def fetch_chunk(chunk: list[int]) -> dict[str, Any]:
+            payload = {"character_ids": chunk}
+            return await self._request_genshin_record(
+                "character/detail", player_id, method="POST", lang=lang, payload=payload
+            )
+
+        return iter_chunked(ids, fetch_chunk, chunk_size=chunk_size, concurrency=concurrency)
 
     async def get_genshin_achievement_info(
         self, player_id: Optional[int] = None, *, lang: Optional[str] = None
@@ -415,16 +564,72 @@ class GenshinBattleChronicleClient(BaseChronicleClient):
         return GenshinAchievementInfo(**data)
 
     async def get_genshin_act_calendar(
-        self, player_id: Optional[int] = None, *, lang: Optional[str] = None
+        self, player_id: Optional[int] = None, *, lang: Optional[str] = None, shared: bool = False
     ) -> GenshinActCalendar:
         """Get genshin act calendar.
 
         Args:
             player_id (Optional[int], optional): The player ID. Defaults to None.
             lang (Optional[str], optional): The language of the data. Defaults to None.
+            shared (bool, optional): Whether to share the calendar with every player of the server through
+                `shared_cache`. The `is_finished` flags of the events then reflect the player whose request
+                populated the cache. Defaults to False.
 
         Returns:
             GenshinActCalendar: The requested act calendar info.
         """
-        data = await self._request_genshin_record("act_calendar", player_id, method="POST", lang=lang)
-        return GenshinActCalendar(**data)
+        player_id = player_id or self.player_id
+
+        async def fetch() -> GenshinActCalendar:
+            data = await self._request_genshin_record("act_calendar", player_id, method="POST", lang=lang)
+            return GenshinActCalendar(**data)
+
+        if not shared or player_id is None:
+            return await fetch()
+        key = ("genshin_act_calendar", recognize_genshin_server(player_id), lang or self.lang)
+        return await self._get_shared(key, fetch)
+
+    async def get_genshin_snapshot(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        sections: Optional[Collection[str]] = None,
+        lang: Optional[str] = None,
+        timeout: Optional[float] = 10.0,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ) -> ProfileSnapshot:
+        """Get a snapshot of several Genshin battle chronicle sections.
+
+        Every section is fetched concurrently, within its own time limit. A section that fails, such as
+        a mode that is not public, does not fail the snapshot, its error is reported instead.
+
+        Args:
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            sections (Optional[Collection[str]], optional): The names of the sections to fetch.
+                Defaults to every section:
+                "user", "characters", "notes", "spiral_abyss", "imaginarium_theater", "hard_challenge".
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+            timeout (Optional[float], optional): The time limit of a section, in seconds. Defaults to 10.
+            timeouts (Optional[Mapping[str, float]], optional): The time limits of specific sections, in seconds.
+
+        Returns:
+            ProfileSnapshot: The fetched sections and the errors of the other ones.
+
+        Raises:
+            ValueError: If a section is unknown.
+        """
+        return await self._get_profile_snapshot(
+            Game.GENSHIN,
+            player_id,
+            {
+                "user": partial(self.get_partial_genshin_user, player_id, lang=lang),
+                "characters": partial(self.get_genshin_characters, player_id, lang=lang),
+                "notes": partial(self.get_genshin_notes, player_id, lang=lang),
+                "spiral_abyss": partial(self.get_genshin_spiral_abyss, player_id, lang=lang),
+                "imaginarium_theater": partial(self.get_genshin_imaginarium_theater, player_id, lang=lang),
+                "hard_challenge": partial(self.get_genshin_hard_challenge, player_id, lang=lang),
+            },
+            sections,
+            timeout=timeout,
+            timeouts=timeouts,
+        )
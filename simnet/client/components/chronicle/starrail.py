@@ -1,11 +1,13 @@
 import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Collection, Mapping
+from functools import partial
 from typing import Any, Optional, Union
 
 from simnet.client.components.chronicle.base import BaseChronicleClient
 from simnet.client.routes import RECORD_URL
 from simnet.errors import BadRequest, DataNotPublic, InvalidCookies
 from simnet.models.lab.record import RecordCard
+from simnet.models.snapshot import ProfileSnapshot
 from simnet.models.starrail.chronicle.achievement import StarRailAchievementInfo
 from simnet.models.starrail.chronicle.act_calendar import StarRailActCalendar
 from simnet.models.starrail.chronicle.challenge import StarRailChallenge
@@ -26,12 +28,23 @@ from simnet.models.starrail.chronicle.rogue import (
 from simnet.models.starrail.chronicle.rogue_tourn import StarRailRogueTourn
 from simnet.models.starrail.chronicle.stats import StarRailUserInfo, StarRailUserStats
 from simnet.models.starrail.diary import StarRailLedgerMonthInfo
+from simnet.utils.concurrency import iter_chunked
 from simnet.utils.enums import Game, Region
 from simnet.utils.player import recognize_region, recognize_starrail_server
 
 __all__ = ("StarRailBattleChronicleClient",)
 
 
+def _group_seasons(value: Union[StarRailChallengeStory, StarRailChallengeBoss]) -> tuple[int, ...]:
+    """Get the schedule IDs of the groups of an endgame mode."""
+    return tuple(group.season for group in value.groups)
+
+
+def _peak_seasons(value: StarRailChallengePeak) -> tuple[int, ...]:
+    """Get the schedule IDs of the groups of the challenge peak."""
+    return tuple(record.group.season for record in value.challenge_peak_records)
+
+
 class StarRailBattleChronicleClient(BaseChronicleClient):
     """A client for retrieving data from StarRail's battle chronicle component.
 
@@ -148,12 +161,21 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
         self,
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
+        *,
+        characters: Optional[list[int]] = None,
+        chunk_size: int = 10,
+        concurrency: int = 4,
     ) -> StarRailDetailCharacters:
         """Get StarRail character information.
 
         Args:
             player_id (Optional[int], optional): The player ID. Defaults to None.
             lang (Optional[str], optional): The language of the data. Defaults to None.
+            characters (Optional[List[int]], optional): The IDs of the characters to get, requested in chunks.
+                Defaults to None, which gets every character in a single request: the IDs of the characters
+                of the player are not known before that request, so this default is never chunked.
+            chunk_size (int, optional): The maximum number of characters requested at once. Defaults to 10.
+            concurrency (int, optional): The maximum number of requests issued at once. Defaults to 4.
 
         Returns:
             StarRailDetailCharacters: The requested character information.
@@ -162,10 +184,70 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
-        payload = {"need_wiki": "true"}
-        data = await self._request_starrail_record("avatar/info", player_id, lang=lang, payload=payload)
+        if characters is None:
+            payload = {"need_wiki": "true"}
+            data = await self._request_starrail_record("avatar/info", player_id, lang=lang, payload=payload)
+            return StarRailDetailCharacters(**data)
+
+        data: dict[str, Any] = {}
+        async for chunk in self._iter_starrail_characters_data(
+            characters, player_id, lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            for key, value in chunk.items():
+                if key not in data:
+                    data[key] = value
+                elif isinstance(value, Mapping):
+                    data[key] = {**data[key], **value}
+                elif isinstance(value, list):
+                    data[key] = [*data[key], *value]
         return StarRailDetailCharacters(**data)
 
+    async def iter_starrail_characters(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        *,
+        chunk_size: int = 10,
+        concurrency: int = 4,
+    ) -> AsyncIterator[StarRailDetailCharacters]:
+        """Get StarRail character information, chunk by chunk.
+
+        Args:
+            characters (List[int]): The IDs of the characters to get.
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+            chunk_size (int, optional): The maximum number of characters requested at once. Defaults to 10.
+            concurrency (int, optional): The maximum number of requests issued at once. Defaults to 4.
+
+        Yields:
+            StarRailDetailCharacters: The character information of each chunk of characters, in order.
+
+        Raises:
+            BadRequest: If the request is invalid.
+            DataNotPublic: If the requested data is not public.
+        """
+        async for chunk in self._iter_starrail_characters_data(
+            characters, player_id, lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            yield StarRailDetailCharacters(**chunk)
+
+    def _iter_starrail_characters_data(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        *,
+        chunk_size: int = 10,
+        concurrency: int = 4,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async def fetch_chunk(chunk: list[int]) -> dict[str, Any]:
+            # a single ID is sent as a scalar, like the requests of a single character
+            payload = {"need_wiki": "true", "id_list[]": chunk[0] if len(chunk) == 1 else chunk}
+            return await self._request_starrail_record("avatar/info", player_id, lang=lang, payload=payload)
+
+        return iter_chunked(characters, fetch_chunk, chunk_size=chunk_size, concurrency=concurrency)
+
     async def get_record_card(
         self,
         account_id: Optional[int] = None,
@@ -214,9 +296,19 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1, "need_all": "true"}
-        data = await self._request_starrail_record("challenge", player_id, lang=lang, payload=payload)
-        return StarRailChallenge(**data)
+
+        async def fetch() -> StarRailChallenge:
+            data = await self._request_starrail_record("challenge", player_id, lang=lang, payload=payload)
+            return StarRailChallenge(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.STARRAIL, "challenge", player_id, key, fetch, lambda challenge: challenge.season
+            )
+        return await fetch()
 
     async def get_starrail_challenge_story(
         self,
@@ -238,13 +330,23 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {
             "schedule_type": 2 if previous else 1,
             "need_all": "true",
             "type": "story",
         }
-        data = await self._request_starrail_record("challenge_story", player_id, lang=lang, payload=payload)
-        return StarRailChallengeStory(**data)
+
+        async def fetch() -> StarRailChallengeStory:
+            data = await self._request_starrail_record("challenge_story", player_id, lang=lang, payload=payload)
+            return StarRailChallengeStory(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.STARRAIL, "challenge_story", player_id, key, fetch, _group_seasons
+            )
+        return await fetch()
 
     async def get_starrail_challenge_boss(
         self,
@@ -266,13 +368,23 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {
             "schedule_type": 2 if previous else 1,
             "need_all": "true",
             "type": "boss",
         }
-        data = await self._request_starrail_record("challenge_boss", player_id, lang=lang, payload=payload)
-        return StarRailChallengeBoss(**data)
+
+        async def fetch() -> StarRailChallengeBoss:
+            data = await self._request_starrail_record("challenge_boss", player_id, lang=lang, payload=payload)
+            return StarRailChallengeBoss(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.STARRAIL, "challenge_boss", player_id, key, fetch, _group_seasons
+            )
+        return await fetch()
 
     async def get_starrail_challenge_peak(
         self,
@@ -294,13 +406,23 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {
             "schedule_type": 2 if previous else 1,
             "need_all": "true",
             "type": "peak",
         }
-        data = await self._request_starrail_record("challenge_peak", player_id, lang=lang, payload=payload)
-        return StarRailChallengePeak(**data)
+
+        async def fetch() -> StarRailChallengePeak:
+            data = await self._request_starrail_record("challenge_peak", player_id, lang=lang, payload=payload)
+            return StarRailChallengePeak(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.STARRAIL, "challenge_peak", player_id, key, fetch, _peak_seasons
+            )
+        return await fetch()
 
     async def get_starrail_rogue(
         self,
@@ -396,12 +518,16 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
         self,
         uid: Optional[int] = None,
         lang: Optional[str] = None,
+        shared: bool = False,
     ) -> StarRailActCalendar:
         """Get starrail act calendar.
 
         Args:
             uid (Optional[int], optional): The player ID. Defaults to None.
             lang (Optional[str], optional): The language of the data. Defaults to None.
+            shared (bool, optional): Whether to share the calendar with every player of the server through
+                `shared_cache`. The progress of the events then reflects the player whose request populated
+                the cache. Defaults to False.
 
         Returns:
             StarRailActCalendar: The requested act calendar info.
@@ -410,8 +536,16 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
-        data = await self._request_starrail_record("get_act_calender", uid, lang=lang)
-        return StarRailActCalendar(**data)
+        uid = uid or self.player_id
+
+        async def fetch() -> StarRailActCalendar:
+            data = await self._request_starrail_record("get_act_calender", uid, lang=lang)
+            return StarRailActCalendar(**data)
+
+        if not shared or uid is None:
+            return await fetch()
+        key = ("starrail_act_calendar", recognize_starrail_server(uid), lang or self.lang)
+        return await self._get_shared(key, fetch)
 
     async def get_starrail_notes_by_stoken(
         self,
@@ -506,3 +640,49 @@ class StarRailBattleChronicleClient(BaseChronicleClient):
         """
         data = await self._request_starrail_record("achievement_info", uid, lang=lang)
         return StarRailAchievementInfo(**data)
+
+    async def get_starrail_snapshot(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        sections: Optional[Collection[str]] = None,
+        lang: Optional[str] = None,
+        timeout: Optional[float] = 10.0,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ) -> ProfileSnapshot:
+        """Get a snapshot of several StarRail battle chronicle sections.
+
+        Every section is fetched concurrently, within its own time limit. A section that fails, such as
+        a mode that is not public, does not fail the snapshot, its error is reported instead.
+
+        Args:
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            sections (Optional[Collection[str]], optional): The names of the sections to fetch.
+                Defaults to every section:
+                "user", "characters", "notes", "forgotten_hall", "pure_fiction", "apocalyptic_shadow", "peak".
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+            timeout (Optional[float], optional): The time limit of a section, in seconds. Defaults to 10.
+            timeouts (Optional[Mapping[str, float]], optional): The time limits of specific sections, in seconds.
+
+        Returns:
+            ProfileSnapshot: The fetched sections and the errors of the other ones.
+
+        Raises:
+            ValueError: If a section is unknown.
+        """
+        return await self._get_profile_snapshot(
+            Game.STARRAIL,
+            player_id,
+            {
+                "user": partial(self.get_starrail_user, player_id, lang=lang),
+                "characters": partial(self.get_starrail_characters, player_id, lang=lang),
+                "notes": partial(self.get_starrail_notes, player_id, lang=lang),
+                "forgotten_hall": partial(self.get_starrail_challenge, player_id, lang=lang),
+                "pure_fiction": partial(self.get_starrail_challenge_story, player_id, lang=lang),
+                "apocalyptic_shadow": partial(self.get_starrail_challenge_boss, player_id, lang=lang),
+                "peak": partial(self.get_starrail_challenge_peak, player_id, lang=lang),
+            },
+            sections,
+            timeout=timeout,
+            timeouts=timeouts,
+        )
@@ -1,10 +1,11 @@
-import asyncio
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Collection, Mapping
+from functools import partial
 from typing import Any, Optional
 
 from simnet.client.components.chronicle.base import BaseChronicleClient
 from simnet.errors import BadRequest, DataNotPublic, InvalidCookies
 from simnet.models.lab.record import RecordCard
+from simnet.models.snapshot import ProfileSnapshot
 from simnet.models.zzz.calculator import ZZZCalculatorCharacterDetails
 from simnet.models.zzz.chronicle.abyss_abstract import ZZZAbyssAbstract
 from simnet.models.zzz.chronicle.abysss2_abstract import ZZZAbysss2Abstract
@@ -19,6 +20,7 @@ from simnet.models.zzz.chronicle.stats import (
     ZZZBuddyBasic,
     ZZZUserStats,
 )
+from simnet.utils.concurrency import iter_chunked
 from simnet.utils.enums import Game
 from simnet.utils.player import recognize_region, recognize_zzz_server
 
@@ -235,6 +237,9 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
         characters: list[int],
         player_id: Optional[int] = None,
         lang: Optional[str] = None,
+        *,
+        chunk_size: int = 1,
+        concurrency: int = 4,
     ) -> "ZZZCalculatorCharacterDetails":
         """Get ZZZ character detail information.
 
@@ -242,6 +247,8 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             characters (List[int]): A list of character IDs.
             player_id (Optional[int], optional): The player ID. Defaults to None.
             lang (Optional[str], optional): The language of the data. Defaults to None.
+            chunk_size (int, optional): The maximum number of characters requested at once. Defaults to 1.
+            concurrency (int, optional): The maximum number of requests issued at once. Defaults to 4.
 
         Returns:
             ZZZCalculatorCharacterDetails: The requested character information.
@@ -250,30 +257,62 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
-
-        def _get_payload(cid: int) -> dict:
-            """
-            Creates a payload dictionary for a given character ID.
-
-            Args:
-                cid (int): The character ID.
-
-            Returns:
-                dict: A dictionary containing the payload with the character ID.
-            """
-            return {"need_wiki": "true", "id_list[]": cid}
-
-        ch = characters
-        if isinstance(characters, int):
-            ch = [characters]
-        tasks = [
-            self._request_zzz_record("avatar/info", player_id, lang=lang, payload=_get_payload(character_id_))
-            for character_id_ in ch
-        ]
-        results = await asyncio.gather(*tasks)
-        data = [data["avatar_list"][0] for data in results]
+        data: list[dict[str, Any]] = []
+        async for chunk in self._iter_zzz_character_info_data(
+            characters, player_id, lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            data.extend(chunk)
         return ZZZCalculatorCharacterDetails(avatar_list=data)
 
+    async def iter_zzz_character_info(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        *,
+        chunk_size: int = 1,
+        concurrency: int = 4,
+    ) -> AsyncIterator["ZZZCalculatorCharacterDetails"]:
+        """Get ZZZ character detail information, chunk by chunk.
+
+        Args:
+            characters (List[int]): A list of character IDs.
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+            chunk_size (int, optional): The maximum number of characters requested at once. Defaults to 1.
+            concurrency (int, optional): The maximum number of requests issued at once. Defaults to 4.
+
+        Yields:
+            ZZZCalculatorCharacterDetails: The character information of each chunk of characters, in order.
+
+        Raises:
+            BadRequest: If the request is invalid.
+            DataNotPublic: If the requested data is not public.
+        """
+        async for chunk in self._iter_zzz_character_info_data(
+            characters, player_id, lang, chunk_size=chunk_size, concurrency=concurrency
+        ):
+            yield ZZZCalculatorCharacterDetails(avatar_list=chunk)
+
+    def _iter_zzz_character_info_data(
+        self,
+        characters: list[int],
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        *,
+        chunk_size: int = 1,
+        concurrency: int = 4,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        ch = [characters] if isinstance(characters, int) else characters
+
+        async def fetch_chunk(chunk: list[int]) -> list[dict[str, Any]]:
+            # a single ID is sent as a scalar, like the requests of a single character
+            payload = {"need_wiki": "true", "id_list[]": chunk[0] if len(chunk) == 1 else chunk}
+            data = await self._request_zzz_record("avatar/info", player_id, lang=lang, payload=payload)
+            return data["avatar_list"]
+
+        return iter_chunked(ch, fetch_chunk, chunk_size=chunk_size, concurrency=concurrency)
+
     async def get_zzz_buddy_list(
         self,
         player_id: Optional[int] = None,
@@ -315,9 +354,19 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1, "need_all": "true"}
-        data = await self._request_zzz_record("challenge", player_id, lang=lang, payload=payload)
-        return ZZZChallenge(**data)
+
+        async def fetch() -> ZZZChallenge:
+            data = await self._request_zzz_record("challenge", player_id, lang=lang, payload=payload)
+            return ZZZChallenge(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.ZZZ, "challenge", player_id, key, fetch, lambda challenge: challenge.season
+            )
+        return await fetch()
 
     async def get_zzz_hadal_info_v2(
         self,
@@ -339,9 +388,19 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request parameters are invalid or the request fails.
             DataNotPublic: If the requested data is not publicly available.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1, "need_all": "true"}
-        data = await self._request_zzz_record("hadal_info_v2", player_id, lang=lang, payload=payload)
-        return ZZZHadalInfo(**data)
+
+        async def fetch() -> ZZZHadalInfo:
+            data = await self._request_zzz_record("hadal_info_v2", player_id, lang=lang, payload=payload)
+            return ZZZHadalInfo(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.ZZZ, "hadal_info_v2", player_id, key, fetch, lambda hadal: hadal.hadal_info_v2.season
+            )
+        return await fetch()
 
     async def get_zzz_challenge_mem(
         self,
@@ -363,9 +422,19 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1}
-        data = await self._request_zzz_record("mem_detail", player_id, lang=lang, payload=payload)
-        return ZZZChallengeMem(**data)
+
+        async def fetch() -> ZZZChallengeMem:
+            data = await self._request_zzz_record("mem_detail", player_id, lang=lang, payload=payload)
+            return ZZZChallengeMem(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.ZZZ, "mem_detail", player_id, key, fetch, lambda challenge: challenge.season
+            )
+        return await fetch()
 
     async def get_zzz_challenge_holo(
         self,
@@ -387,9 +456,19 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
             BadRequest: If the request is invalid.
             DataNotPublic: If the requested data is not public.
         """
+        player_id = player_id or self.player_id
         payload = {"schedule_type": 2 if previous else 1}
-        data = await self._request_zzz_record("holo_boss_detail", player_id, lang=lang, payload=payload)
-        return ZZZHoloBossDetail(**data)
+
+        async def fetch() -> ZZZHoloBossDetail:
+            data = await self._request_zzz_record("holo_boss_detail", player_id, lang=lang, payload=payload)
+            return ZZZHoloBossDetail(**data)
+
+        if previous:
+            key = (lang or self.lang,)
+            return await self._get_previous_season(
+                Game.ZZZ, "holo_boss_detail", player_id, key, fetch, lambda challenge: challenge.season
+            )
+        return await fetch()
 
     async def get_zzz_cur_gacha_detail(
         self,
@@ -457,3 +536,48 @@ class ZZZBattleChronicleClient(BaseChronicleClient):
                 return record_card
 
         return None
+
+    async def get_zzz_snapshot(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        sections: Optional[Collection[str]] = None,
+        lang: Optional[str] = None,
+        timeout: Optional[float] = 10.0,
+        timeouts: Optional[Mapping[str, float]] = None,
+    ) -> ProfileSnapshot:
+        """Get a snapshot of several ZZZ battle chronicle sections.
+
+        Every section is fetched concurrently, within its own time limit. A section that fails, such as
+        a mode that is not public, does not fail the snapshot, its error is reported instead.
+
+        Args:
+            player_id (Optional[int], optional): The player ID. Defaults to None.
+            sections (Optional[Collection[str]], optional): The names of the sections to fetch.
+                Defaults to every section:
+                "user", "characters", "notes", "shiyu_defense", "deadly_assault", "hadal".
+            lang (Optional[str], optional): The language of the data. Defaults to None.
+            timeout (Optional[float], optional): The time limit of a section, in seconds. Defaults to 10.
+            timeouts (Optional[Mapping[str, float]], optional): The time limits of specific sections, in seconds.
+
+        Returns:
+            ProfileSnapshot: The fetched sections and the errors of the other ones.
+
+        Raises:
+            ValueError: If a section is unknown.
+        """
+        return await self._get_profile_snapshot(
+            Game.ZZZ,
+            player_id,
+            {
+                "user": partial(self.get_zzz_user, player_id, lang=lang),
+                "characters": partial(self.get_zzz_characters, player_id, lang=lang),
+                "notes": partial(self.get_zzz_notes, player_id, lang=lang),
+                "shiyu_defense": partial(self.get_zzz_challenge, player_id, lang=lang),
+                "deadly_assault": partial(self.get_zzz_challenge_mem, player_id, lang=lang),
+                "hadal": partial(self.get_zzz_hadal_info_v2, player_id, lang=lang),
+            },
+            sections,
+            timeout=timeout,
+            timeouts=timeouts,
+        )
@@ -1,15 +1,27 @@
 """Daily reward component."""
 
 import asyncio
+import math
+from collections.abc import AsyncIterator, Collection
+from datetime import datetime
+from functools import partial
 from typing import Any, Optional
 
 from httpx import QueryParams
 
-from simnet.client.base import BaseClient
+from simnet.client.components.lab import LabClient
 from simnet.client.routes import REWARD_URL
 from simnet.errors import GeetestTriggered
-from simnet.models.lab.daily import ClaimedDailyReward, DailyReward, DailyRewardInfo
+from simnet.models.base import CN_TIMEZONE
+from simnet.models.lab.daily import (
+    ClaimedDailyReward,
+    DailyReward,
+    DailyRewardInfo,
+    DailyRewardResult,
+)
+from simnet.utils.cache import BaseCache, MemoryCache
 from simnet.utils.enums import Game, Region
+from simnet.utils.paginator import PagePaginator
 from simnet.utils.player import (
     recognize_genshin_server,
     recognize_starrail_server,
@@ -18,9 +30,20 @@ from simnet.utils.player import (
 
 __all__ = ("DailyRewardClient",)
 
+CLAIMED_REWARDS_PAGE_SIZE = 10
+"""The number of claimed rewards of a full page of the award endpoint."""
+
+
+class DailyRewardClient(LabClient):
+    """A client for interacting with the daily reward system.
 
-class DailyRewardClient(BaseClient):
-    """A client for interacting with the daily reward system."""
+    Attributes:
+        monthly_rewards_cache (BaseCache): The process-wide cache of the monthly rewards, shared by every client.
+            The rewards are the same for every user of a game and region, and change when the month rolls over
+            in server time.
+    """
+
+    monthly_rewards_cache: BaseCache = MemoryCache()
 
     async def request_daily_reward(
         self,
@@ -32,6 +55,7 @@ class DailyRewardClient(BaseClient):
         game: Optional[Game] = None,
         lang: Optional[str] = None,
         params: Optional[dict[str, Any]] = None,
+        player_id: Optional[int] = None,
     ) -> dict[str, Any]:
         """
         Makes a request to the daily reward endpoint.
@@ -44,6 +68,7 @@ class DailyRewardClient(BaseClient):
             game (Game): The game to request data for. Defaults to None.
             lang (str): The language to use. Defaults to None.
             params (Dict[str, Any]): Any parameters to include in the request.
+            player_id (int): The player ID to request data for. Defaults to None.
 
         Returns:
             A dictionary containing the response data.
@@ -51,6 +76,7 @@ class DailyRewardClient(BaseClient):
         headers: dict[str, str] = {}
         params = QueryParams(params)
         game = game or self.game
+        player_id = player_id or self.player_id
 
         base_url = REWARD_URL.get_url(self.region, game)
         params = params.merge(base_url.params)
@@ -82,8 +108,8 @@ class DailyRewardClient(BaseClient):
                     "bbs_auth_required=true&bbs_presentation_style=fullscreen&"
                     "utm_source=bbs&utm_medium=mys&utm_campaign=icon"
                 )
-                params = params.set("uid", self.player_id)
-                params = params.set("region", recognize_genshin_server(self.player_id))
+                params = params.set("uid", player_id)
+                params = params.set("region", recognize_genshin_server(player_id))
             if game == Game.STARRAIL:
                 headers["referer"] = (
                     "https://webstatic.mihoyo.com/bbs/event/signin/hkrpg/index.html?"
@@ -91,16 +117,16 @@ class DailyRewardClient(BaseClient):
                     "bbs_auth_required=true&bbs_presentation_style=fullscreen&"
                     "utm_source=bbs&utm_medium=mys&utm_campaign=icon"
                 )
-                params = params.set("uid", self.player_id)
-                params = params.set("region", recognize_starrail_server(self.player_id))
+                params = params.set("uid", player_id)
+                params = params.set("region", recognize_starrail_server(player_id))
             if game == Game.ZZZ:
                 headers["referer"] = (
                     "https://act.mihoyo.com/bbs/event/signin/zzz/e202406242138391.html?"
                     "act_id=e202406242138391&mhy_auth_required=true&mhy_presentation_style=fullscreen&"
                     "utm_source=bbs&utm_medium=zzz&utm_campaign=icon"
                 )
-                params = params.set("uid", self.player_id)
-                params = params.set("region", recognize_zzz_server(self.player_id))
+                params = params.set("uid", player_id)
+                params = params.set("region", recognize_zzz_server(player_id))
 
         url = base_url / endpoint
 
@@ -117,17 +143,19 @@ class DailyRewardClient(BaseClient):
         *,
         game: Optional[Game] = None,
         lang: Optional[str] = None,
+        player_id: Optional[int] = None,
     ) -> DailyRewardInfo:
         """Gets the daily reward info for the current user.
 
         Args:
             game (Game): The game to request data for. Defaults to None.
             lang (str): The language to use. Defaults to None.
+            player_id (int): The player ID to request data for. Defaults to None.
 
         Returns:
             A DailyRewardInfo object containing information about the user's daily reward status.
         """
-        data = await self.request_daily_reward("info", game=game, lang=lang)
+        data = await self.request_daily_reward("info", game=game, lang=lang, player_id=player_id)
         return DailyRewardInfo(data["is_sign"], data["total_sign_day"])
 
     async def get_monthly_rewards(
@@ -135,22 +163,33 @@ class DailyRewardClient(BaseClient):
         *,
         game: Optional[Game] = None,
         lang: Optional[str] = None,
+        player_id: Optional[int] = None,
     ) -> list[DailyReward]:
         """Gets a list of all available rewards for the current month.
 
         Args:
             game (Game): The game to request data for. Defaults to None.
             lang (str): The language to use. Defaults to None.
+            player_id (int): The player ID to request data for, on the Chinese region. Defaults to None.
 
         Returns:
             A list of DailyReward objects representing the available rewards for the current month.
         """
-        data = await self.request_daily_reward(
-            "home",
-            game=game or self.game,
-            lang=lang,
+        game = game or self.game
+        lang = lang or self.lang
+        now = datetime.now(CN_TIMEZONE)
+        next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1, tzinfo=CN_TIMEZONE)
+
+        async def fetch() -> list[DailyReward]:
+            data = await self.request_daily_reward("home", game=game, lang=lang, player_id=player_id)
+            return [DailyReward(**i) for i in data["awards"]]
+
+        rewards = await self.monthly_rewards_cache.get_or_set(
+            ("monthly_rewards", game, self.region, lang, now.year, now.month),
+            fetch,
+            (next_month - now).total_seconds(),
         )
-        return [DailyReward(**i) for i in data["awards"]]
+        return list(rewards)
 
     async def _get_claimed_rewards_page(
         self,
@@ -175,6 +214,40 @@ class DailyRewardClient(BaseClient):
         )
         return [ClaimedDailyReward(**i) for i in data["list"]]
 
+    def iter_claimed_rewards(
+        self,
+        *,
+        limit: Optional[int] = None,
+        game: Optional[Game] = None,
+        lang: Optional[str] = None,
+        prefetch: int = 3,
+    ) -> AsyncIterator[ClaimedDailyReward]:
+        """Iterates over the claimed rewards for the current user, from the newest to the oldest.
+
+        The pages are requested concurrently in windows of `prefetch` pages, and no new window is
+        requested once an empty or incomplete page is found or the limit is reached. A window never
+        requests more pages than the limit needs.
+
+        Args:
+            limit (int): The maximum number of rewards to yield. Defaults to None.
+            game (Game): The game to request data for. Defaults to None.
+            lang (str): The language to use. Defaults to None.
+            prefetch (int): The number of pages requested concurrently. Defaults to 3.
+
+        Returns:
+            An asynchronous iterator of ClaimedDailyReward objects representing the claimed rewards for the current user.
+        """
+        if limit:
+            prefetch = min(prefetch, math.ceil(limit / CLAIMED_REWARDS_PAGE_SIZE))
+        paginator = PagePaginator(
+            partial(self._get_claimed_rewards_page, game=game or self.game, lang=lang),
+            page_size=CLAIMED_REWARDS_PAGE_SIZE,
+            max_page=9,
+            limit=limit,
+            prefetch=prefetch,
+        )
+        return paginator.iterate()
+
     async def claimed_rewards(
         self,
         *,
@@ -192,32 +265,7 @@ class DailyRewardClient(BaseClient):
         Returns:
             A list of ClaimedDailyReward objects representing the claimed rewards for the current user.
         """
-        result = []
-        index = 0
-        page = 1
-
-        while True:
-            if page >= 10:
-                break
-
-            fetched_items = await self._get_claimed_rewards_page(page, game=game or self.game, lang=lang)
-            if not fetched_items:
-                break
-
-            # Calculate how many items should be added
-            items_to_add = (
-                limit - index if limit is not None and limit - index < len(fetched_items) else len(fetched_items)
-            )
-
-            result.extend(fetched_items[:items_to_add])
-            index += items_to_add
-
-            if limit is not None and index >= limit:
-                break
-
-            page += 1
-
-        return result
+        return [reward async for reward in self.iter_claimed_rewards(limit=limit, game=game, lang=lang)]
 
     async def claim_daily_reward(
         self,
@@ -227,6 +275,7 @@ class DailyRewardClient(BaseClient):
         game: Optional[Game] = None,
         lang: Optional[str] = None,
         reward: bool = True,
+        player_id: Optional[int] = None,
     ) -> Optional[DailyReward]:
         """
         Signs into lab and claims the daily reward.
@@ -237,6 +286,7 @@ class DailyRewardClient(BaseClient):
             game (Game): The game to claim the reward for. Defaults to None.
             lang (str): The language to use. Defaults to None.
             reward (bool): Whether to return the claimed reward. Defaults to True.
+            player_id (int): The player ID to claim the reward for. Defaults to None.
 
         Returns:
             If `reward` is True, a DailyReward object representing the claimed reward. Otherwise, None.
@@ -248,6 +298,7 @@ class DailyRewardClient(BaseClient):
             lang=lang,
             challenge=challenge,
             validate=validate,
+            player_id=player_id,
         )
 
         if self.region == Region.CHINESE and daily_reward.get("success", 0) == 1:
@@ -265,7 +316,47 @@ class DailyRewardClient(BaseClient):
             return None
 
         info, rewards = await asyncio.gather(
-            self.get_reward_info(game=game or self.game, lang=lang),
-            self.get_monthly_rewards(game=game or self.game, lang=lang),
+            self.get_reward_info(game=game or self.game, lang=lang, player_id=player_id),
+            self.get_monthly_rewards(game=game or self.game, lang=lang, player_id=player_id),
         )
         return rewards[info.claimed_rewards - 1]
+
+    async def claim_daily_rewards(
+        self,
+        *,
+        games: Collection[Game] = (Game.GENSHIN, Game.STARRAIL, Game.ZZZ),
+        lang: Optional[str] = None,
+        reward: bool = True,
+    ) -> list[DailyRewardResult]:
+        """Signs into lab and claims the daily rewards of every game bound to the current user.
+
+        The bound game accounts are discovered once, then the rewards of every game are claimed
+        concurrently through the connections of this client. On the Chinese region the rewards
+        are claimed for each bound player, on the overseas region once per game.
+
+        Args:
+            games (Collection[Game]): The games to claim the rewards for. Defaults to Genshin, StarRail and ZZZ.
+            lang (str): The language to use. Defaults to None.
+            reward (bool): Whether to return the claimed rewards. Defaults to True.
+
+        Returns:
+            A list of DailyRewardResult objects, one per game account, in the order of the bound accounts.
+            A failed claim, including an already claimed reward, holds the raised error, whatever its type.
+        """
+        accounts = await self.get_game_accounts(lang=lang)
+        targets: list[tuple[Game, int]] = []
+        for account in accounts:
+            if account.game not in games:
+                continue
+            if self.region == Region.OVERSEAS and any(game == account.game for game, _ in targets):
+                continue
+            targets.append((account.game, account.uid))
+
+        async def claim(game: Game, player_id: int) -> DailyRewardResult:
+            try:
+                daily_reward = await self.claim_daily_reward(game=game, lang=lang, reward=reward, player_id=player_id)
+            except Exception as exc:  # skipcq: PYL-W0703
+                return DailyRewardResult(game, player_id, error=exc)
+            return DailyRewardResult(game, player_id, reward=daily_reward)
+
+        return list(await asyncio.gather(*(claim(game, player_id) for game, player_id in targets)))
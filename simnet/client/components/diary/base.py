@@ -1,20 +1,72 @@
-from datetime import datetime, timedelta, timezone
+import asyncio
+from collections.abc import AsyncIterator, Mapping, Sequence
+from datetime import datetime
 from typing import Any, Optional, Union
 
 from simnet.client.base import BaseClient
 from simnet.client.routes import DETAIL_LEDGER_URL, INFO_LEDGER_URL
-from simnet.models.diary import DiaryType
-from simnet.models.genshin.diary import DiaryPage
+from simnet.models.base import CN_TIMEZONE
+from simnet.models.diary import BaseDiary, DiaryMonth, DiaryType
+from simnet.models.genshin.diary import Diary, DiaryAction, DiaryPage
+from simnet.models.starrail.diary import StarRailDiary, StarRailDiaryAction, StarRailDiaryPage
+from simnet.models.zzz.diary import ZZZDiary, ZZZDiaryAction, ZZZDiaryPage
+from simnet.utils.cache import BaseCache
+from simnet.utils.concurrency import merge_sorted_async_iterators
 from simnet.utils.enums import Game, Region
+from simnet.utils.paginator import AdaptivePacing, PagePaginator
 from simnet.utils.player import recognize_server
 
 __all__ = ("BaseDiaryClient",)
 
-CN_TIMEZONE = timezone(timedelta(hours=8))
+AnyDiaryPage = Union[DiaryPage, StarRailDiaryPage, ZZZDiaryPage]
+AnyDiaryAction = Union[DiaryAction, StarRailDiaryAction, ZZZDiaryAction]
+
+DIARY_MODELS: dict[Game, type[BaseDiary]] = {
+    Game.GENSHIN: Diary,
+    Game.STARRAIL: StarRailDiary,
+    Game.ZZZ: ZZZDiary,
+}
+
+DIARY_PAGE_MODELS: dict[Game, type[AnyDiaryPage]] = {
+    Game.GENSHIN: DiaryPage,
+    Game.STARRAIL: StarRailDiaryPage,
+    Game.ZZZ: ZZZDiaryPage,
+}
+
+
+def _resolve_month(game: Game, month: Union[int, str], now: datetime) -> tuple[int, int]:
+    """Resolve the month of a ledger request to a (year, month) pair.
+
+    Genshin ledgers are requested with the month number only, which always refers to one of
+    the last months, so a month number after the current one belongs to the previous year.
+    """
+    if game == Game.GENSHIN:
+        number = int(month)
+        return (now.year if number <= now.month else now.year - 1), number
+    month = str(month)
+    return int(month[:4]), int(month[4:])
+
+
+def _format_month(game: Game, year: int, month: int) -> str:
+    """Format a month the way the ledger of a game expects it."""
+    if game == Game.GENSHIN:
+        return str(month)
+    return f"{year}{month:02d}"
 
 
 class BaseDiaryClient(BaseClient):
-    """Base diary component."""
+    """Base diary component.
+
+    Attributes:
+        diary_cache (Optional[BaseCache]): The process-wide cache of ledger responses, shared by every client
+            and keyed by the account ID of the client. Months that have ended in `CN_TIMEZONE` never change and
+            are stored without expiry, they are kept for as long as the cache keeps them. None, the default,
+            disables it, set it to a cache such as `MemoryCache(maxsize=1024)` to enable it.
+        diary_ttl (float): The time to live of the cached ledger of the current month, in seconds.
+    """
+
+    diary_cache: Optional[BaseCache] = None
+    diary_ttl: float = 5 * 60
 
     async def request_ledger(
         self,
@@ -54,14 +106,31 @@ class BaseDiaryClient(BaseClient):
             params["bind_region"] = recognize_server(player_id, game)
         else:
             raise TypeError(f"{self.region!r} is not a valid region.")
+        now = datetime.now(CN_TIMEZONE)
         if game in [Game.STARRAIL, Game.ZZZ]:
-            month = month or datetime.now(CN_TIMEZONE).strftime("%Y%m")
+            month = month or now.strftime("%Y%m")
         elif game == Game.GENSHIN:
-            month = month or str(datetime.now(CN_TIMEZONE).month)
+            month = month or str(now.month)
         params["month"] = month
         params["lang"] = lang or self.lang
 
-        return await self.request_lab(url, params=params)
+        if self.diary_cache is None or self.account_id is None:
+            return await self.request_lab(url, params=params)
+
+        year_month = _resolve_month(game, month, now)
+        ttl = None if year_month < (now.year, now.month) else self.diary_ttl
+        # the ledger is private, only the account that requested it may read it back
+        key = (
+            "ledger",
+            game,
+            self.region,
+            self.account_id,
+            player_id,
+            detail,
+            year_month,
+            tuple(sorted((name, str(value)) for name, value in params.items() if name != "month")),
+        )
+        return await self.diary_cache.get_or_set(key, lambda: self.request_lab(url, params=params), ttl)
 
     async def _get_diary_page(
         self,
@@ -69,23 +138,24 @@ class BaseDiaryClient(BaseClient):
         *,
         game: Optional[Game] = None,
         player_id: Optional[int] = None,
-        diary_type: int = DiaryType.PRIMOGEMS,
-        month: Optional[int] = None,
+        diary_type: Union[int, str] = DiaryType.PRIMOGEMS,
+        month: Union[int, str, None] = None,
         lang: Optional[str] = None,
-    ) -> DiaryPage:
+    ) -> AnyDiaryPage:
         """Get a diary page.
 
         Args:
             page (int): The page number to get.
             game (Optional[Game], optional): The game to get the diary page for.
             player_id (Optional[int], optional): The player ID to get the diary page for.
-            diary_type (int, optional): The diary type to get the diary page for.
-            month (Optional[int], optional): The month to get the diary page for.
+            diary_type (Union[int, str], optional): The diary type to get the diary page for.
+            month (Union[int, str, None], optional): The month to get the diary page for.
             lang (Optional[str], optional): The language code to use for the request.
 
         Returns:
-            DiaryPage: The diary page.
+            AnyDiaryPage: The diary page, of the page model of the game.
         """
+        game = game or self.game
         data = await self.request_ledger(
             player_id,
             game=game,
@@ -94,4 +164,147 @@ class BaseDiaryClient(BaseClient):
             lang=lang,
             params={"type": diary_type, "current_page": page, "page_size": 100},
         )
-        return DiaryPage(**data)
+        return DIARY_PAGE_MODELS[game](**data)
+
+    def _get_diary_paginator(
+        self,
+        *,
+        game: Optional[Game] = None,
+        player_id: Optional[int] = None,
+        diary_type: Union[int, str] = DiaryType.PRIMOGEMS,
+        month: Union[int, str, None] = None,
+        lang: Optional[str] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> PagePaginator[AnyDiaryAction]:
+        """Get a paginator over the actions of a diary.
+
+        Args:
+            game (Optional[Game], optional): The game to get the diary actions for.
+            player_id (Optional[int], optional): The player ID to get the diary actions for.
+            diary_type (Union[int, str], optional): The diary type to get the diary actions for.
+            month (Union[int, str, None], optional): The month to get the diary actions for.
+            lang (Optional[str], optional): The language code to use for the request.
+            limit (Optional[int], optional): The maximum number of actions to get.
+            prefetch (int, optional): The number of pages requested concurrently.
+            semaphore (Optional[asyncio.Semaphore], optional): A semaphore bounding the page requests,
+                shared with other paginators.
+
+        Returns:
+            PagePaginator[AnyDiaryAction]: The paginator over the diary actions.
+        """
+
+        async def request_page(page: int) -> list[AnyDiaryAction]:
+            diary_page = await self._get_diary_page(
+                page, game=game, player_id=player_id, diary_type=diary_type, month=month, lang=lang
+            )
+            return diary_page.actions
+
+        async def fetch_page(page: int) -> list[AnyDiaryAction]:
+            if semaphore is None:
+                return await request_page(page)
+            async with semaphore:
+                return await request_page(page)
+
+        return PagePaginator(fetch_page, page_size=100, limit=limit, prefetch=prefetch)
+
+    async def diary_log(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        game: Optional[Game] = None,
+        diary_types: Sequence[Union[int, str]] = (DiaryType.PRIMOGEMS,),
+        months: Sequence[Union[int, str, None]] = (None,),
+        lang: Optional[str] = None,
+        concurrency: int = 4,
+        prefetch: int = 3,
+    ) -> AsyncIterator[AnyDiaryAction]:
+        """Stream every diary action of several diary types and months.
+
+        The detail endpoint does not report its page count, so the pages of each diary type and
+        month are requested concurrently in windows of `prefetch` pages until an incomplete page
+        is found, with at most `concurrency` page requests at once. The actions of every diary type
+        and month are merged on their time as their pages arrive, so they are yielded newest first.
+
+        Args:
+            player_id (Optional[int], optional): The player ID to get the diary actions for.
+            game (Optional[Game], optional): The game to get the diary actions for.
+            diary_types (Sequence[Union[int, str]], optional): The diary types to get the diary actions for.
+            months (Sequence[Union[int, str, None]], optional): The months to get the diary actions for.
+                Defaults to the current month.
+            lang (Optional[str], optional): The language code to use for the request.
+            concurrency (int, optional): The maximum number of pages requested at once.
+            prefetch (int, optional): The number of pages of a diary type and month requested at once.
+
+        Yields:
+            AnyDiaryAction: The diary actions, of the action model of the game, newest first.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        iterators = [
+            self._get_diary_paginator(
+                game=game,
+                player_id=player_id,
+                diary_type=diary_type,
+                month=month,
+                lang=lang,
+                prefetch=prefetch,
+                semaphore=semaphore,
+            ).iterate()
+            for diary_type in diary_types
+            for month in months
+        ]
+        async for action in merge_sorted_async_iterators(iterators, lambda action: action.time, reverse=True):
+            yield action
+
+    async def get_diary_series(
+        self,
+        months: int = 3,
+        *,
+        games: Optional[Mapping[Game, Optional[int]]] = None,
+        lang: Optional[str] = None,
+        concurrency: int = 3,
+    ) -> list[DiaryMonth]:
+        """Get the diaries of the last months of several games of one account.
+
+        The ledger requests are issued concurrently, at most `concurrency` at once, and retried with
+        a growing delay while the API reports too frequent visits. A diary that cannot be fetched does
+        not fail the series, whatever the exception, its entry holds the exception instead.
+
+        Args:
+            months (int, optional): The number of months to get, the current one included.
+            games (Optional[Mapping[Game, Optional[int]]], optional): The games to get the diaries for,
+                mapped to the player ID of each game. Defaults to the game and player ID of the client.
+            lang (Optional[str], optional): The language code to use for the request.
+            concurrency (int, optional): The maximum number of ledger requests issued at once.
+
+        Returns:
+            List[DiaryMonth]: The diaries, grouped by game in the given order, from the oldest month to the newest.
+        """
+        now = datetime.now(CN_TIMEZONE)
+        games = games or {self.game: self.player_id}
+        year_months = [divmod(now.year * 12 + now.month - 1 - offset, 12) for offset in reversed(range(months))]
+        semaphore = asyncio.Semaphore(concurrency)
+        pacing = AdaptivePacing(0)
+
+        async def fetch(game: Game, player_id: Optional[int], year: int, month: int) -> DiaryMonth:
+            player_id = player_id or self.player_id
+            async with semaphore:
+                try:
+                    data = await pacing.call(
+                        self.request_ledger, player_id, game=game, month=_format_month(game, year, month), lang=lang
+                    )
+                    diary = DIARY_MODELS[game](**data)
+                except Exception as exc:  # skipcq: PYL-W0703
+                    return DiaryMonth(game=game, player_id=player_id, year=year, month=month, error=exc)
+            return DiaryMonth(game=game, player_id=player_id, year=year, month=month, diary=diary)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    fetch(game, player_id, year, index + 1)
+                    for game, player_id in games.items()
+                    for year, index in year_months
+                )
+            )
+        )
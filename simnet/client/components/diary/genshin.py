@@ -1,7 +1,9 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Optional
 
 from simnet.client.components.diary.base import BaseDiaryClient
-from simnet.models.genshin.diary import Diary
+from simnet.models.diary import DiaryType
+from simnet.models.genshin.diary import Diary, DiaryAction
 from simnet.utils.enums import Game
 
 
@@ -27,3 +29,36 @@ class GenshinDiaryClient(BaseDiaryClient):
         """
         data = await self.request_ledger(player_id, game=Game.GENSHIN, month=month, lang=lang)
         return Diary(**data)
+
+    def get_genshin_diary_log(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        diary_types: Sequence[int] = (DiaryType.PRIMOGEMS,),
+        months: Sequence[Optional[int]] = (None,),
+        lang: Optional[str] = None,
+        concurrency: int = 4,
+        prefetch: int = 3,
+    ) -> AsyncIterator[DiaryAction]:
+        """Get every Genshin diary action of several diary types and months.
+
+        Args:
+            player_id (int, optional): The player's ID. Defaults to None.
+            diary_types (Sequence[int], optional): The diary types to get. Defaults to primogems.
+            months (Sequence[Optional[int]], optional): The months to get. Defaults to the current month.
+            lang (str, optional): The language to get the diary in. Defaults to None.
+            concurrency (int, optional): The maximum number of pages requested at once.
+            prefetch (int, optional): The number of pages of a diary type and month requested at once.
+
+        Returns:
+            AsyncIterator[DiaryAction]: The diary actions of every diary type and month, newest first.
+        """
+        return self.diary_log(
+            player_id,
+            game=Game.GENSHIN,
+            diary_types=diary_types,
+            months=months,
+            lang=lang,
+            concurrency=concurrency,
+            prefetch=prefetch,
+        )
@@ -1,7 +1,8 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Optional
 
 from simnet.client.components.diary.base import BaseDiaryClient
-from simnet.models.starrail.diary import StarRailDiary
+from simnet.models.starrail.diary import StarRailDiary, StarRailDiaryAction, StarRailDiaryType
 from simnet.utils.enums import Game
 
 
@@ -27,3 +28,36 @@ class StarrailDiaryClient(BaseDiaryClient):
         """
         data = await self.request_ledger(player_id, game=Game.STARRAIL, month=month, lang=lang)
         return StarRailDiary(**data)
+
+    def get_starrail_diary_log(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        diary_types: Sequence[int] = (StarRailDiaryType.HCOIN,),
+        months: Sequence[Optional[str]] = (None,),
+        lang: Optional[str] = None,
+        concurrency: int = 4,
+        prefetch: int = 3,
+    ) -> AsyncIterator[StarRailDiaryAction]:
+        """Get every StarRail diary action of several diary types and months.
+
+        Args:
+            player_id (int, optional): The player's ID. Defaults to None.
+            diary_types (Sequence[int], optional): The diary types to get. Defaults to stellar jade.
+            months (Sequence[Optional[str]], optional): The months to get. Defaults to the current month.
+            lang (str, optional): The language to get the diary in. Defaults to None.
+            concurrency (int, optional): The maximum number of pages requested at once.
+            prefetch (int, optional): The number of pages of a diary type and month requested at once.
+
+        Returns:
+            AsyncIterator[StarRailDiaryAction]: The diary actions of every diary type and month, newest first.
+        """
+        return self.diary_log(
+            player_id,
+            game=Game.STARRAIL,
+            diary_types=diary_types,
+            months=months,
+            lang=lang,
+            concurrency=concurrency,
+            prefetch=prefetch,
+        )
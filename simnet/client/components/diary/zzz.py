@@ -1,7 +1,8 @@
+from collections.abc import AsyncIterator, Sequence
 from typing import Optional
 
 from simnet.client.components.diary.base import BaseDiaryClient
-from simnet.models.zzz.diary import ZZZDiary
+from simnet.models.zzz.diary import ZZZDiary, ZZZDiaryAction, ZZZDiaryType
 from simnet.utils.enums import Game
 
 
@@ -27,3 +28,36 @@ class ZZZDiaryClient(BaseDiaryClient):
         """
         data = await self.request_ledger(player_id, game=Game.ZZZ, month=month, lang=lang)
         return ZZZDiary(**data)
+
+    def get_zzz_diary_log(
+        self,
+        player_id: Optional[int] = None,
+        *,
+        diary_types: Sequence[str] = (ZZZDiaryType.POLYCHROMES,),
+        months: Sequence[Optional[str]] = (None,),
+        lang: Optional[str] = None,
+        concurrency: int = 4,
+        prefetch: int = 3,
+    ) -> AsyncIterator[ZZZDiaryAction]:
+        """Get every ZZZ diary action of several diary types and months.
+
+        Args:
+            player_id (int, optional): The player's ID. Defaults to None.
+            diary_types (Sequence[str], optional): The diary types to get. Defaults to polychromes.
+            months (Sequence[Optional[str]], optional): The months to get. Defaults to the current month.
+            lang (str, optional): The language to get the diary in. Defaults to None.
+            concurrency (int, optional): The maximum number of pages requested at once.
+            prefetch (int, optional): The number of pages of a diary type and month requested at once.
+
+        Returns:
+            AsyncIterator[ZZZDiaryAction]: The diary actions of every diary type and month, newest first.
+        """
+        return self.diary_log(
+            player_id,
+            game=Game.ZZZ,
+            diary_types=diary_types,
+            months=months,
+            lang=lang,
+            concurrency=concurrency,
+            prefetch=prefetch,
+        )
@@ -173,26 +173,30 @@ class LabClient(BaseClient):
             "lang": lang or self.lang,
         }
 
-        info, details = await asyncio.gather(
-            self.request_bbs(
-                HK4E_URL / "announcement/api/getAnnList",
-                lang=lang,
-                params=params,
-            ),
-            self.request_bbs(
-                HK4E_URL / "announcement/api/getAnnContent",
-                lang=lang,
-                params=params,
-            ),
-        )
+        async def fetch() -> list[Announcement]:
+            info, details = await asyncio.gather(
+                self.request_bbs(
+                    HK4E_URL / "announcement/api/getAnnList",
+                    lang=lang,
+                    params=params,
+                ),
+                self.request_bbs(
+                    HK4E_URL / "announcement/api/getAnnContent",
+                    lang=lang,
+                    params=params,
+                ),
+            )
+
+            announcements: list[dict[str, Any]] = []
+            for sublist in info["list"]:
+                for info in sublist["list"]:
+                    detail = next((i for i in details["list"] if i["ann_id"] == info["ann_id"]), None)
+                    announcements.append({**info, **(detail or {})})
 
-        announcements: list[dict[str, Any]] = []
-        for sublist in info["list"]:
-            for info in sublist["list"]:
-                detail = next((i for i in details["list"] if i["ann_id"] == info["ann_id"]), None)
-                announcements.append({**info, **(detail or {})})
+            return [Announcement(**i) for i in announcements]
 
-        return [Announcement(**i) for i in announcements]
+        # the announcements are the same for every player of the server, see `shared_cache`
+        return list(await self._get_shared(("genshin_announcements", params["region"], params["lang"]), fetch))
 
     async def redeem_code(
         self,
@@ -1,8 +1,11 @@
+from collections.abc import AsyncIterator, MutableMapping
+from functools import partial
 from typing import Any, Optional
 
 from simnet.client.base import BaseClient
 from simnet.client.routes import SELF_HELP_URL
 from simnet.utils.enums import Game
+from simnet.utils.paginator import AdaptivePacing, CursorPaginator
 
 __all__ = ("BaseSelfHelpClient",)
 
@@ -47,3 +50,65 @@ class BaseSelfHelpClient(BaseClient):
             params["end_id"] = end_id
 
         return await self.request_lab(url, params=params)
+
+    async def _iter_action_log(
+        self,
+        endpoint: str,
+        authkey: str,
+        *,
+        game: Game,
+        limit: Optional[int] = None,
+        end_id: int = 0,
+        min_id: int = 0,
+        resume: Optional[MutableMapping[int, int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        pacing: Optional[AdaptivePacing] = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the raw entries of an action log, from the newest to the oldest.
+
+        Args:
+            endpoint (str): The endpoint of the action log.
+            authkey (str): The authkey for the user.
+            game (Game): The game of the action log.
+            limit (Optional[int], optional): The maximum number of entries to yield.
+            end_id (int, optional): The ID of the entry to stop at.
+            min_id (int, optional): The ID below which entries are not fetched anymore.
+            resume (Optional[MutableMapping[int, int]], optional): The newest stored entry ID of each player.
+                Only newer entries are fetched, and the mapping is updated once the log has been fully read.
+            player_id (Optional[int], optional): The player ID the authkey belongs to, used as the key of `resume`.
+            lang (Optional[str], optional): The language code to use for the request.
+            pacing (Optional[AdaptivePacing], optional): The pacing of the page requests.
+                Defaults to a short delay which grows only while the API reports too frequent visits.
+
+        Yields:
+            Dict[str, Any]: The raw entries of the action log.
+        """
+        player_id = player_id or self.player_id
+        if resume is not None:
+            if player_id is None:
+                raise ValueError("player_id is required to resume an action log")
+            min_id = max(min_id, resume.get(player_id, 0))
+
+        paginator = CursorPaginator(
+            partial(
+                self.request_self_help,
+                endpoint=endpoint,
+                game=game,
+                lang=lang,
+                params={"authkey": authkey, "size": 100, "page_id": 0},
+            ),
+            end_id=end_id,
+            min_id=min_id,
+            limit=limit,
+            pacing=pacing or AdaptivePacing(0.2),
+        )
+        newest_id, count = 0, 0
+        async for item in paginator:
+            newest_id = newest_id or int(item["id"])
+            count += 1
+            yield item
+
+        # a log cut by the limit still has unread entries older than the stored ID
+        if resume is not None and newest_id and not (limit and count >= limit):
+            resume[player_id] = max(newest_id, resume.get(player_id, 0))
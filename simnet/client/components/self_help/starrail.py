@@ -1,10 +1,10 @@
-from functools import partial
+from collections.abc import AsyncIterator, MutableMapping
 from typing import Optional
 
 from simnet.client.components.self_help.base import BaseSelfHelpClient
 from simnet.models.starrail.self_help import StarRailSelfHelpActionLog
 from simnet.utils.enums import Game
-from simnet.utils.paginator import WishPaginator
+from simnet.utils.paginator import AdaptivePacing
 
 
 class StarrailSelfHelpClient(BaseSelfHelpClient):
@@ -32,20 +32,54 @@ class StarrailSelfHelpClient(BaseSelfHelpClient):
         Returns:
             List[StarRailSelfHelpActionLog]: The action logs.
         """
-        paginator = WishPaginator(
-            end_id,
-            min_id,
-            partial(
-                self.request_self_help,
-                endpoint="UserInfo/GetActionLog",
-                game=Game.STARRAIL,
-                lang=lang,
-                params={
-                    "authkey": authkey,
-                    "size": 100,
-                    "page_id": 0,
-                },
-            ),
-        )
-        items = await paginator.get(limit)
-        return [StarRailSelfHelpActionLog(**i) for i in items]
+        # the list methods keep their one second delay between the pages
+        pacing = AdaptivePacing(1.0)
+        return [
+            log async for log in self.iter_starrail_action_log(authkey, limit, end_id, min_id, lang=lang, pacing=pacing)
+        ]
+
+    async def iter_starrail_action_log(
+        self,
+        authkey: str,
+        limit: Optional[int] = None,
+        end_id: int = 0,
+        min_id: int = 0,
+        *,
+        resume: Optional[MutableMapping[int, int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        pacing: Optional[AdaptivePacing] = None,
+    ) -> AsyncIterator[StarRailSelfHelpActionLog]:
+        """
+        Iterate over the action log for a starrail user, from the newest to the oldest.
+
+        Entries are yielded as soon as their page is received, and the page requests are paced
+        adaptively, slowing down only while the API reports too frequent visits.
+
+        Args:
+            authkey: The authkey for the user.
+            limit: The number of logs to get.
+            end_id: The end ID for the logs.
+            min_id: The minimum ID for the logs.
+            resume: The newest stored log ID of each player. Only newer logs are fetched, and the
+                mapping is updated once the log has been fully read.
+            player_id: The player ID the authkey belongs to, used as the key of `resume`.
+            lang: The language to get the logs in.
+            pacing: The pacing of the page requests.
+
+        Yields:
+            StarRailSelfHelpActionLog: The action logs.
+        """
+        async for item in self._iter_action_log(
+            "UserInfo/GetActionLog",
+            authkey,
+            game=Game.STARRAIL,
+            limit=limit,
+            end_id=end_id,
+            min_id=min_id,
+            resume=resume,
+            player_id=player_id,
+            lang=lang,
+            pacing=pacing,
+        ):
+            yield StarRailSelfHelpActionLog(**item)
@@ -1,10 +1,10 @@
-from functools import partial
+from collections.abc import AsyncIterator, MutableMapping
 from typing import Optional
 
 from simnet.client.components.self_help.base import BaseSelfHelpClient
 from simnet.models.zzz.self_help import ZZZSelfHelpActionLog
 from simnet.utils.enums import Game
-from simnet.utils.paginator import WishPaginator
+from simnet.utils.paginator import AdaptivePacing
 
 
 class ZZZSelfHelpClient(BaseSelfHelpClient):
@@ -32,20 +32,52 @@ class ZZZSelfHelpClient(BaseSelfHelpClient):
         Returns:
             List[ZZZSelfHelpActionLog]: The action logs.
         """
-        paginator = WishPaginator(
-            end_id,
-            min_id,
-            partial(
-                self.request_self_help,
-                endpoint="LoginRecord/GetList",
-                game=Game.ZZZ,
-                lang=lang,
-                params={
-                    "authkey": authkey,
-                    "size": 100,
-                    "page_id": 0,
-                },
-            ),
-        )
-        items = await paginator.get(limit)
-        return [ZZZSelfHelpActionLog(**i) for i in items]
+        # the list methods keep their one second delay between the pages
+        pacing = AdaptivePacing(1.0)
+        return [log async for log in self.iter_zzz_action_log(authkey, limit, end_id, min_id, lang=lang, pacing=pacing)]
+
+    async def iter_zzz_action_log(
+        self,
+        authkey: str,
+        limit: Optional[int] = None,
+        end_id: int = 0,
+        min_id: int = 0,
+        *,
+        resume: Optional[MutableMapping[int, int]] = None,
+        player_id: Optional[int] = None,
+        lang: Optional[str] = None,
+        pacing: Optional[AdaptivePacing] = None,
+    ) -> AsyncIterator[ZZZSelfHelpActionLog]:
+        """
+        Iterate over the action log for a zzz user, from the newest to the oldest.
+
+        Entries are yielded as soon as their page is received, and the page requests are paced
+        adaptively, slowing down only while the API reports too frequent visits.
+
+        Args:
+            authkey: The authkey for the user.
+            limit: The number of logs to get.
+            end_id: The end ID for the logs.
+            min_id: The minimum ID for the logs.
+            resume: The newest stored log ID of each player. Only newer logs are fetched, and the
+                mapping is updated once the log has been fully read.
+            player_id: The player ID the authkey belongs to, used as the key of `resume`.
+            lang: The language to get the logs in.
+            pacing: The pacing of the page requests.
+
+        Yields:
+            ZZZSelfHelpActionLog: The action logs.
+        """
+        async for item in self._iter_action_log(
+            "LoginRecord/GetList",
+            authkey,
+            game=Game.ZZZ,
+            limit=limit,
+            end_id=end_id,
+            min_id=min_id,
+            resume=resume,
+            player_id=player_id,
+            lang=lang,
+            pacing=pacing,
+        ):
+            yield ZZZSelfHelpActionLog(**item)
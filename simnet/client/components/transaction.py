@@ -1,3 +1,5 @@
+from collections.abc import AsyncIterator, Mapping
+from functools import partial
 from typing import Any, Optional, Union
 from urllib import parse
 
@@ -9,7 +11,9 @@ from simnet.models.genshin.transaction import (
     Transaction,
     TransactionKind,
 )
+from simnet.utils.concurrency import merge_async_iterators
 from simnet.utils.lang import create_short_lang_code
+from simnet.utils.paginator import AdaptivePacing, CursorPaginator
 
 
 class TransactionClient(BaseClient):
@@ -45,6 +49,36 @@ class TransactionClient(BaseClient):
 
         return await self.request_lab(url, method=method, params=params)
 
+    async def _request_transaction_page(
+        self,
+        end_id: int,
+        kind: TransactionKind,
+        authkey: str,
+        *,
+        lang: Optional[str] = None,
+        size: int = 20,
+    ) -> dict[str, Any]:
+        """Request a single raw page of transactions.
+
+        Args:
+            end_id (int): The ID of the last transaction of the previous page.
+            kind (TransactionKind): The kind of transaction to get.
+            authkey (str): The authkey to use for the request.
+            lang (str, optional): The language to use for the request. Defaults to None.
+            size (int, optional): The number of transactions per page. Defaults to 20.
+        """
+        endpoint = "Get" + kind.value.capitalize() + "Log"
+        return await self.request_transaction(
+            endpoint,
+            lang=lang,
+            authkey=authkey,
+            params={"end_id": end_id, "size": size},
+        )
+
+    def _parse_transaction(self, data: dict[str, Any], kind: TransactionKind, lang: Optional[str]) -> BaseTransaction:
+        model = ItemTransaction if "name" in data else Transaction
+        return model(**data, kind=kind, lang=lang or self.lang)
+
     async def _get_transaction_page(
         self,
         end_id: int,
@@ -62,21 +96,94 @@ class TransactionClient(BaseClient):
             lang (str, optional): The language to use for the request. Defaults to None.
         """
         kind = TransactionKind(kind)
-        endpoint = "Get" + kind.value.capitalize() + "Log"
+        data = await self._request_transaction_page(end_id, kind, authkey, lang=lang)
+        return [self._parse_transaction(trans, kind, lang) for trans in data["list"]]
 
-        data = await self.request_transaction(
-            endpoint,
-            lang=lang,
-            authkey=authkey,
-            params={"end_id": end_id, "size": 20},
+    async def _iter_transaction_kind(
+        self,
+        kind: TransactionKind,
+        authkey: str,
+        *,
+        lang: Optional[str],
+        end_id: int,
+        min_id: int,
+        delay: float,
+    ) -> AsyncIterator[BaseTransaction]:
+        paginator = CursorPaginator(
+            partial(self._request_transaction_page, kind=kind, authkey=authkey, lang=lang),
+            min_id=min_id,
+            cursor=end_id,
+            pacing=AdaptivePacing(delay),
         )
+        async for item in paginator.iterate():
+            yield self._parse_transaction(item, kind, lang)
+
+    async def iter_transaction_log(
+        self,
+        authkey: str,
+        kind: Optional[Union[str, list[str]]] = None,
+        *,
+        limit: Optional[int] = None,
+        lang: Optional[str] = None,
+        end_id: int = 0,
+        min_id: Union[int, Mapping[str, int]] = 0,
+        concurrency: int = 2,
+        delay: float = 0.5,
+    ) -> AsyncIterator[BaseTransaction]:
+        """Stream the whole transaction log of a user.
+
+        Every kind is paginated with `end_id` until its oldest transaction, the kinds being
+        fetched concurrently. Transactions are yielded as soon as their page is received,
+        newest first within a kind and interleaved between kinds. With a `limit` the kinds
+        are fetched one after the other in the requested order instead, so that the same
+        transactions are returned on every call.
 
-        transactions: list[BaseTransaction] = []
-        for trans in data["list"]:
-            model = ItemTransaction if "name" in trans else Transaction
-            transactions.append(model(**trans, kind=kind, lang=lang or self.lang))
+        Args:
+            authkey (str): The authkey to use for the request.
+            kind (Union[str, List[str]], optional): The kind of transaction to get. Defaults to every kind.
+            limit (int, optional): The maximum number of transactions to get. Defaults to None.
+            lang (str, optional): The language to use for the request. Defaults to None.
+            end_id (int, optional): The ID of the transaction to start after. Defaults to 0.
+            min_id (Union[int, Mapping[str, int]], optional): The ID of the newest transaction already
+                stored, alone or by kind. Older transactions are not fetched, for incremental syncs.
+            concurrency (int, optional): The maximum number of kinds fetched at once, without a limit.
+                Defaults to 2.
+            delay (float, optional): The delay between two page requests of a kind, in seconds.
+
+        Yields:
+            BaseTransaction: The transactions.
+        """
+        kinds = kind or [i.value for i in TransactionKind]
 
-        return transactions
+        if isinstance(kinds, str):
+            kinds = [kinds]
+
+        iterators = [
+            self._iter_transaction_kind(
+                TransactionKind(value),
+                authkey,
+                lang=lang,
+                end_id=end_id,
+                min_id=min_id.get(value, 0) if isinstance(min_id, Mapping) else min_id,
+                delay=delay,
+            )
+            for value in kinds
+        ]
+        if not limit:
+            async for transaction in merge_async_iterators(iterators, concurrency):
+                yield transaction
+            return
+
+        count = 0
+        for iterator in iterators:
+            try:
+                async for transaction in iterator:
+                    yield transaction
+                    count += 1
+                    if count >= limit:
+                        return
+            finally:
+                await iterator.aclose()
 
     async def transaction_log(
         self,
@@ -86,6 +193,8 @@ class TransactionClient(BaseClient):
         limit: Optional[int] = None,
         lang: Optional[str] = None,
         end_id: int = 0,
+        min_id: Union[int, Mapping[str, int]] = 0,
+        concurrency: int = 2,
     ) -> list[BaseTransaction]:
         """Get the transaction log of a user.
 
@@ -95,15 +204,29 @@ class TransactionClient(BaseClient):
             limit (int, optional): The maximum number of transactions to get. Defaults to None.
             lang (str, optional): The language to use for the request. Defaults to None.
             end_id (int, optional): The ID of the last transaction to get. Defaults to 0.
+            min_id (Union[int, Mapping[str, int]], optional): The ID of the newest transaction already
+                stored, alone or by kind. Defaults to 0.
+            concurrency (int, optional): The maximum number of kinds fetched at once, without a limit.
+                Defaults to 2.
+
+        Returns:
+            List[BaseTransaction]: The transactions, grouped by kind in the requested order.
         """
-        kinds = kind or ["primogem", "crystal", "resin", "artifact", "weapon"]
+        kinds = kind or [i.value for i in TransactionKind]
 
         if isinstance(kinds, str):
             kinds = [kinds]
 
-        iterators: list[BaseTransaction] = []
-        for value in kinds:
-            iterator = await self._get_transaction_page(end_id, value, lang=lang, authkey=authkey)
-            iterators.extend(iterator)
+        iterators: dict[TransactionKind, list[BaseTransaction]] = {TransactionKind(value): [] for value in kinds}
+        async for transaction in self.iter_transaction_log(
+            authkey,
+            kinds,
+            limit=limit,
+            lang=lang,
+            end_id=end_id,
+            min_id=min_id,
+            concurrency=concurrency,
+        ):
+            iterators[transaction.kind].append(transaction)
 
-        return iterators[: min(len(iterators), limit)] if limit else iterators
+        return [transaction for transactions in iterators.values() for transaction in transactions]
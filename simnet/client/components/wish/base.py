@@ -3,6 +3,7 @@ from urllib.parse import unquote
 
 from simnet.client.base import BaseClient
 from simnet.client.routes import GACHA_INFO_URL
+from simnet.utils.cache import BaseCache, MemoryCache
 from simnet.utils.enums import Game
 from simnet.utils.lang import create_short_lang_code
 
@@ -10,7 +11,18 @@ __all__ = ("BaseWishClient",)
 
 
 class BaseWishClient(BaseClient):
-    """The base class for the Wish API client."""
+    """The base class for the Wish API client.
+
+    Attributes:
+        banner_names_cache (BaseCache): The process-wide cache of banner names, shared by every client.
+        banner_names_ttl (float): The time to live of cached banner names, in seconds.
+        wish_prefetch (int): The number of wish pages requested ahead of the page being processed.
+            0 disables pipelining of the page requests.
+    """
+
+    banner_names_cache: BaseCache = MemoryCache()
+    banner_names_ttl: float = 24 * 60 * 60
+    wish_prefetch: int = 0
 
     async def request_gacha_info(
         self,
@@ -127,6 +139,11 @@ class BaseWishClient(BaseClient):
         """
         Get a list of banner names.
 
+        Banner names only depend on the game, the region and the language, so they are
+        cached in `banner_names_cache` and shared by every client of the process. When the
+        concurrent request of another client fails, such as for an expired authkey, the
+        names are requested again with this client's authkey.
+
         Args:
             game (Game): The game to make the request for.
             lang (Optional[str], optional): The language code to use for the request.
@@ -136,10 +153,16 @@ class BaseWishClient(BaseClient):
         Returns:
             Dict[int, str]: A dictionary mapping banner type IDs to their corresponding names.
         """
-        data = await self.request_gacha_info(
-            "getConfigList",
-            game=game,
-            lang=lang,
-            authkey=authkey,
-        )
-        return {int(i["key"]): i["name"] for i in data["gacha_type_list"]}
+
+        async def fetch() -> dict[int, str]:
+            data = await self.request_gacha_info(
+                "getConfigList",
+                game=game,
+                lang=lang,
+                authkey=authkey,
+            )
+            return {int(i["key"]): i["name"] for i in data["gacha_type_list"]}
+
+        key = ("banner_names", game, self.region, create_short_lang_code(lang or self.lang))
+        banner_names = await self.banner_names_cache.get_or_set(key, fetch, self.banner_names_ttl, share_errors=False)
+        return dict(banner_names)
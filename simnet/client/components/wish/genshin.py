@@ -53,6 +53,7 @@ class GenshinWishClient(BaseWishClient):
                     game=Game.GENSHIN,
                     authkey=authkey,
                 ),
+                prefetch=self.wish_prefetch,
             )
             items = await paginator.get(limit)
             banner_name = (
@@ -104,6 +105,7 @@ class GenshinBeyondWishClient(BaseWishClient):
                     lang=lang,
                     authkey=authkey,
                 ),
+                prefetch=self.wish_prefetch,
             )
             items = await paginator.get(limit)
             wishes.extend([GenshinBeyondWish(**i, banner_type=banner_type) for i in items])
@@ -52,6 +52,7 @@ class StarRailWishClient(BaseWishClient):
                     lang=lang,
                     authkey=authkey,
                 ),
+                prefetch=self.wish_prefetch,
             )
             items = await paginator.get(limit)
             wishes.extend([StarRailWish(**i) for i in items])
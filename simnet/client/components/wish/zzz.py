@@ -1,3 +1,4 @@
+import asyncio
 from abc import abstractmethod
 from collections.abc import Mapping
 from functools import partial
@@ -7,6 +8,7 @@ from simnet.client.components.wish.base import BaseWishClient
 from simnet.models.zzz.wish import ZZZBannerTypeHoyolab, ZZZWish
 from simnet.utils.enums import Game
 from simnet.utils.paginator import WishPaginator
+from simnet.utils.wish_merge import merge_wishes
 
 __all__ = ("ZZZWishClient",)
 
@@ -54,11 +56,51 @@ class ZZZWishClient(BaseWishClient):
                     lang=lang,
                     authkey=authkey,
                 ),
+                prefetch=self.wish_prefetch,
             )
             items = await paginator.get(limit)
             wishes.extend([ZZZWish(**i) for i in items])
         return sorted(wishes, key=lambda wish: (wish.time, wish.id))
 
+    async def merged_wish_history(
+        self,
+        banner_types: Optional[list[int]] = None,
+        limit: Optional[int] = None,
+        lang: Optional[str] = None,
+        authkey: Optional[str] = None,
+        player_id: Optional[int] = None,
+        end_id: int = 0,
+        min_id: int = 0,
+    ) -> list[ZZZWish]:
+        """
+        Get the wish history from both the authkey and the HoYoLAB sources, merged by wish ID.
+
+        The authkey history takes precedence, fields missing from it are filled from the HoYoLAB history.
+
+        Args:
+            banner_types (Optional[List[int]], optional): The banner types to get the wish history for.
+            limit (Optional[int] , optional): The maximum number of wishes to retrieve from each source.
+                If not provided, all available wishes will be returned.
+            lang (Optional[str], optional): The language code to use for the request.
+                If not provided, the class default will be used.
+            authkey (Optional[str], optional): The authorization key for making the request.
+                If not provided, only the HoYoLAB history is fetched.
+            player_id (Optional[int], optional): The player ID to get the HoYoLAB history for.
+            end_id  (int, optional): The ending ID of the last wish to retrieve.
+            min_id (int, optional): The minimum ID of the first wish to retrieve
+
+        Returns:
+            List[ZZZWish]: A list of ZZZWish objects representing the retrieved wishes.
+        """
+        hoyolab = self.wish_history_by_hoyolab(banner_types, limit, player_id, lang, end_id, min_id)
+        if authkey is None:
+            return await hoyolab
+        histories = await asyncio.gather(
+            self.wish_history(banner_types, limit, lang, authkey, end_id, min_id),
+            hoyolab,
+        )
+        return merge_wishes(*(sorted(history, key=lambda wish: wish.id) for history in histories))
+
     @abstractmethod
     async def get_wish_page_by_hoyolab(
         self,
@@ -96,6 +138,7 @@ class ZZZWishClient(BaseWishClient):
                     lang=lang,
                 ),
                 list_key="gacha_item_list",
+                prefetch=self.wish_prefetch,
             )
             items = await paginator.get(limit)
             wishes.extend([ZZZWish.from_hoyolab(i, player_id, banner_type.value) for i in items])
@@ -1,10 +1,13 @@
 from enum import IntEnum
+from typing import Optional
 
 from simnet.models.base import APIModel, Field
+from simnet.utils.enums import Game
 
 __all__ = (
     "DiaryType",
     "BaseDiary",
+    "DiaryMonth",
 )
 
 
@@ -39,3 +42,28 @@ class BaseDiary(APIModel):
     server: str = Field(alias="region")
     nickname: str = ""
     month: int = Field(alias="data_month")
+
+
+class DiaryMonth(APIModel):
+    """The diary of a game and month, fetched as part of a series.
+
+    Attributes:
+        game: The game of the diary.
+        player_id: The player ID of the diary.
+        year: The year of the diary.
+        month: The month of the diary.
+        diary: The diary, None if it could not be fetched.
+        error: The exception raised while fetching the diary, if any.
+    """
+
+    game: Game
+    player_id: int
+    year: int
+    month: int
+    diary: Optional[BaseDiary] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the diary was fetched."""
+        return self.error is None
@@ -1,9 +1,11 @@
 import datetime
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 
+from simnet.errors import AlreadyClaimed
 from simnet.models.base import CN_TIMEZONE, APIModel, DateTimeField, Field
+from simnet.utils.enums import Game
 
-__all__ = ("ClaimedDailyReward", "DailyReward", "DailyRewardInfo")
+__all__ = ("ClaimedDailyReward", "DailyReward", "DailyRewardInfo", "DailyRewardResult")
 
 
 class DailyRewardInfo(NamedTuple):
@@ -54,3 +56,29 @@ class ClaimedDailyReward(APIModel):
     amount: int = Field(alias="cnt")
     icon: str = Field(alias="img")
     time: DateTimeField = Field(alias="created_at")
+
+
+class DailyRewardResult(NamedTuple):
+    """The result of claiming the daily reward of a game account.
+
+    Attributes:
+        game (Game): The game of the account.
+        player_id (int): The player ID of the account.
+        reward (Optional[DailyReward]): The claimed reward, if it was requested and claimed.
+        error (Optional[Exception]): The exception raised while claiming the reward, if any.
+    """
+
+    game: Game
+    player_id: int
+    reward: Optional[DailyReward] = None
+    error: Optional[Exception] = None
+
+    @property
+    def claimed(self) -> bool:
+        """Whether the reward was claimed by this request."""
+        return self.error is None
+
+    @property
+    def already_claimed(self) -> bool:
+        """Whether the reward had already been claimed today."""
+        return isinstance(self.error, AlreadyClaimed)
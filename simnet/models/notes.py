@@ -0,0 +1,155 @@
+from datetime import datetime, timedelta
+from typing import Literal, NamedTuple, Optional, Union
+
+from simnet.models.genshin.chronicle.notes import Notes, NotesOverseaWidget, NotesWidget
+from simnet.models.starrail.chronicle.notes import StarRailNote, StarRailNoteOverseaWidget, StarRailNoteWidget
+from simnet.models.zzz.chronicle.notes import ZZZNote
+from simnet.utils.enums import Game
+
+__all__ = (
+    "AnyNotesModel",
+    "NotesSummary",
+    "NotesPollResult",
+)
+
+AnyNotesModel = Union[
+    Notes,
+    NotesWidget,
+    NotesOverseaWidget,
+    StarRailNote,
+    StarRailNoteWidget,
+    StarRailNoteOverseaWidget,
+    ZZZNote,
+]
+
+
+class NotesSummary(NamedTuple):
+    """The fields shared by the real-time notes and the widget notes of every game.
+
+    Attributes:
+        game: The game of the notes.
+        player_id: The player ID, the player of the client when no player was requested.
+        source: Whether the notes were fetched from the `widget` endpoint or the full `notes` endpoint.
+        current_stamina: The current resin, trailblaze power or battery charge.
+        max_stamina: The maximum resin, trailblaze power or battery charge.
+        remaining_stamina_recovery_time: The remaining time until the stamina is full.
+        current_daily: The daily commissions, training or engagement done, None if not provided.
+        max_daily: The maximum daily commissions, training or engagement, None if not provided.
+        finished_expeditions: The number of finished expeditions, None if not provided.
+        max_expeditions: The maximum number of expeditions, None if not provided.
+        notes: The fetched notes.
+    """
+
+    game: Game
+    player_id: Optional[int]
+    source: Literal["widget", "notes"]
+    current_stamina: int
+    max_stamina: int
+    remaining_stamina_recovery_time: timedelta
+    current_daily: Optional[int]
+    max_daily: Optional[int]
+    finished_expeditions: Optional[int]
+    max_expeditions: Optional[int]
+    notes: AnyNotesModel
+
+    @property
+    def stamina_recovery_time(self) -> datetime:
+        """The time when the stamina will be full."""
+        return datetime.now().astimezone() + self.remaining_stamina_recovery_time
+
+    @classmethod
+    def from_notes(cls, player_id: Optional[int], notes: AnyNotesModel, source: str = "notes") -> "NotesSummary":
+        """Summarize real-time notes or widget notes.
+
+        Args:
+            player_id: The player ID of the notes.
+            notes: The notes of any game, from the widget or the full notes endpoint.
+            source: The endpoint the notes were fetched from, `widget` or `notes`.
+
+        Returns:
+            The summary of the notes.
+
+        Raises:
+            TypeError: If the notes are not a supported notes model.
+        """
+        if isinstance(notes, (Notes, NotesWidget)):
+            finished = sum(expedition.status == "Finished" for expedition in notes.expeditions)
+            return cls(
+                Game.GENSHIN,
+                player_id,
+                source,
+                notes.current_resin,
+                notes.max_resin,
+                notes.remaining_resin_recovery_time,
+                notes.completed_commissions,
+                notes.max_commissions,
+                finished,
+                notes.max_expeditions,
+                notes,
+            )
+        if isinstance(notes, NotesOverseaWidget):
+            resin = notes.resin
+            return cls(
+                Game.GENSHIN,
+                player_id,
+                source,
+                resin.current_val,
+                resin.max_val,
+                resin.remaining_resin_recovery_time,
+                None,
+                None,
+                None,
+                None,
+                notes,
+            )
+        if isinstance(notes, (StarRailNote, StarRailNoteWidget, StarRailNoteOverseaWidget)):
+            finished = sum(expedition.status == "Finished" for expedition in notes.expeditions)
+            return cls(
+                Game.STARRAIL,
+                player_id,
+                source,
+                notes.current_stamina,
+                notes.max_stamina,
+                notes.stamina_recover_time,
+                notes.current_train_score,
+                notes.max_train_score,
+                finished,
+                notes.total_expedition_num,
+                notes,
+            )
+        if isinstance(notes, ZZZNote):
+            return cls(
+                Game.ZZZ,
+                player_id,
+                source,
+                notes.energy.progress.current,
+                notes.energy.progress.max,
+                notes.energy.restore,
+                notes.vitality.current,
+                notes.vitality.max,
+                None,
+                None,
+                notes,
+            )
+        raise TypeError(f"{type(notes).__name__} is not a supported notes model.")
+
+
+class NotesPollResult(NamedTuple):
+    """The result of polling the real-time notes of an account.
+
+    Attributes:
+        game: The game of the notes.
+        player_id: The player ID, the player of the client when no player was requested.
+        summary: The summary of the notes, None if they could not be fetched.
+        error: The exception raised while fetching the full notes, None if the notes were fetched.
+    """
+
+    game: Game
+    player_id: Optional[int]
+    summary: Optional[NotesSummary] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the notes were fetched."""
+        return self.error is None
@@ -0,0 +1,40 @@
+from typing import Any, Optional
+
+from simnet.models.base import APIModel, Field
+from simnet.utils.enums import Game
+
+__all__ = ("ProfileSnapshot",)
+
+
+class ProfileSnapshot(APIModel):
+    """A snapshot of several battle chronicle sections of a player.
+
+    Attributes:
+        game: The game of the player.
+        player_id: The player ID.
+        sections: The fetched sections, by section name.
+        errors: The errors of the sections that could not be fetched, by section name, whatever their type.
+            A section that took too long is reported as `TimedOut`.
+    """
+
+    game: Game
+    player_id: Optional[int]
+    sections: dict[str, Any] = Field(default_factory=dict)
+    errors: dict[str, Exception] = Field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """Whether every requested section was fetched."""
+        return not self.errors
+
+    def get(self, section: str, default: Any = None) -> Any:
+        """Get a fetched section.
+
+        Args:
+            section: The name of the section.
+            default: The value to return if the section was not fetched.
+
+        Returns:
+            The section, or the default.
+        """
+        return self.sections.get(section, default)
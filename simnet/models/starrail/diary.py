@@ -1,17 +1,36 @@
-from simnet.models.base import APIModel, Field
+from enum import IntEnum
+
+from simnet.models.base import APIModel, DateTimeField, Field
 from simnet.models.diary import BaseDiary
 from simnet.models.starrail.chronicle.base import PartialTime
 
 __all__ = (
+    "StarRailDiaryType",
     "DiaryActionCategory",
     "StarRailMonthDiaryDataBase",
     "MonthDiaryData",
     "DayDiaryData",
     "StarRailDiary",
     "StarRailLedgerMonthInfo",
+    "StarRailDiaryAction",
+    "StarRailDiaryPage",
 )
 
 
+class StarRailDiaryType(IntEnum):
+    """Type of diary pages.
+
+    1: Stellar jade
+    2: Rails pass
+    """
+
+    HCOIN = 1
+    """Stellar jade."""
+
+    RAILS_PASS = 2
+    """Rails pass."""
+
+
 class DiaryActionCategory(APIModel):
     """Diary category for rails_pass .
 
@@ -120,3 +139,29 @@ class StarRailLedgerMonthInfo(StarRailMonthDiaryDataBase):
     """
 
     time: PartialTime
+
+
+class StarRailDiaryAction(APIModel):
+    """Action which earned currency.
+
+    Attributes:
+        action: Action ID.
+        action_name: Action name.
+        time: Time of the action.
+        amount: Amount of the action.
+    """
+
+    action: str
+    action_name: str
+    time: DateTimeField
+    amount: int = Field(alias="num")
+
+
+class StarRailDiaryPage(BaseDiary):
+    """Page of a diary.
+
+    Attributes:
+        actions: List of diary actions.
+    """
+
+    actions: list[StarRailDiaryAction] = Field(alias="list")
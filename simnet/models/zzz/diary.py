@@ -1,14 +1,31 @@
-from simnet.models.base import APIModel, Field
+from enum import Enum
+
+from simnet.models.base import APIModel, DateTimeField, Field
 from simnet.models.diary import BaseDiary
 
 __all__ = (
+    "ZZZDiaryType",
     "ZZZDiaryDataList",
     "ZZZDiaryActionCategory",
     "ZZZMonthDiaryData",
     "ZZZDiary",
+    "ZZZDiaryAction",
+    "ZZZDiaryPage",
 )
 
 
+class ZZZDiaryType(str, Enum):
+    """Type of diary pages.
+
+    Attributes:
+        POLYCHROMES: Polychromes.
+        MASTER_TAPE: Master tapes.
+    """
+
+    POLYCHROMES = "PolychromesData"
+    MASTER_TAPE = "MatserTapeData"
+
+
 class ZZZDiaryDataList(APIModel):
     """List of diary data.
 
@@ -92,3 +109,29 @@ class ZZZDiary(BaseDiary):
     def month_data(self) -> ZZZMonthDiaryData:
         """Diary data for a month."""
         return self.data
+
+
+class ZZZDiaryAction(APIModel):
+    """Action which earned currency.
+
+    Attributes:
+        id: Record ID.
+        action: Action ID.
+        time: Time of the action.
+        amount: Amount of the action.
+    """
+
+    id: int = 0
+    action: str
+    time: DateTimeField = Field(alias="datetime")
+    amount: int = Field(alias="num")
+
+
+class ZZZDiaryPage(BaseDiary):
+    """Page of a diary.
+
+    Attributes:
+        actions: List of diary actions.
+    """
+
+    actions: list[ZZZDiaryAction] = Field(alias="list")
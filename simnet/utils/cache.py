@@ -0,0 +1,161 @@
+"""Asynchronous caches used to share API responses between requests."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Hashable
+from typing import Any, Callable, Optional, TypeVar, Union
+
+__all__ = ("BaseCache", "MemoryCache", "TTL")
+
+T = TypeVar("T")
+
+TTL = Union[Optional[float], Callable[[Any], Optional[float]]]
+"""A time to live in seconds, or a function computing it from the value to store, such as an expiry policy."""
+
+_MISSING = object()
+
+
+class BaseCache(ABC):
+    """The base class for caches.
+
+    Subclasses only need to implement the storage primitives, population of missing
+    entries through `get_or_set` is shared and single-flight: concurrent callers
+    asking for the same missing key wait for one single call of the factory.
+    The stored values are shared by every event loop, the pending calls are tracked per loop.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    @abstractmethod
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value from the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+            default (Any, optional): The value to return if the key is missing or expired.
+
+        Returns:
+            Any: The cached value, or the default.
+        """
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+            value (Any): The value to store.
+            ttl (Optional[float], optional): The time to live in seconds. None means the value never expires.
+        """
+
+    @abstractmethod
+    async def delete(self, key: Hashable) -> None:
+        """Remove a value from the cache.
+
+        Args:
+            key (Hashable): The key of the value.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every value from the cache."""
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+        ttl: TTL = None,
+        *,
+        share_errors: bool = True,
+    ) -> T:
+        """Get a value from the cache, populating it with the factory if missing.
+
+        Args:
+            key (Hashable): The key of the value.
+            factory (Callable[[], Awaitable[T]]): The coroutine function producing the value.
+            ttl (TTL, optional): The time to live in seconds, or a function computing it from the produced value.
+                None means the value never expires.
+            share_errors (bool, optional): Whether an error of the factory is raised to every waiting caller.
+                When False, the waiting callers take over with their own factory instead, for factories
+                depending on per-caller credentials.
+
+        Returns:
+            T: The cached or freshly produced value.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            value = await self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            pending = self._pending.get((loop, key))
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            # the caller producing the value was cancelled or failed, check again and take over if still missing
+            if value is not _MISSING:
+                return value
+
+        future = loop.create_future()
+        self._pending[(loop, key)] = future
+        try:
+            value = await factory()
+            await self.set(key, value, ttl(value) if callable(ttl) else ttl)
+        except asyncio.CancelledError:
+            future.set_result(_MISSING)
+            raise
+        except Exception as exc:
+            if share_errors:
+                future.set_exception(exc)
+                # the exception is re-raised below, do not report it as never retrieved
+                future.exception()
+            else:
+                future.set_result(_MISSING)
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            del self._pending[(loop, key)]
+        return value
+
+
+class MemoryCache(BaseCache):
+    """An in-memory cache with per-entry expiration and least recently used eviction.
+
+    Args:
+        maxsize (Optional[int], optional): The maximum number of entries. None means unbounded.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[Any, Optional[float]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (value, None if ttl is None else time.time() + ttl)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    async def delete(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
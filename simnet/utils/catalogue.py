@@ -0,0 +1,206 @@
+"""A persistent catalogue of the calculator items, indexed to answer filter queries locally."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import Awaitable, Collection, Hashable
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+__all__ = ("CATALOGUE_VERSION", "CatalogueEntry", "CalculatorCatalogue")
+
+CATALOGUE_VERSION = 1
+"""The version of the persisted catalogues, files of another version are ignored."""
+
+
+def _digest(items: list[dict[str, Any]]) -> str:
+    return hashlib.sha256(json.dumps(items, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+class CatalogueEntry:
+    """The items of a calculator catalogue, such as every character of a language, and their indexes.
+
+    Items are indexed by ID when the entry is built, indexes on other fields are built on their first use.
+
+    Attributes:
+        items (List[Dict[str, Any]]): The raw items, in the order of the API.
+        digest (str): The hash of the items, identifying the version of the catalogue.
+        fetched_at (float): The time at which the items were last fetched or found unchanged.
+        by_id (Dict[int, Dict[str, Any]]): The items by ID.
+    """
+
+    def __init__(self, items: list[dict[str, Any]], fetched_at: float, digest: Optional[str] = None) -> None:
+        self.items = items
+        self.digest = digest or _digest(items)
+        self.fetched_at = fetched_at
+        self.by_id = {int(item["id"]): item for item in items if "id" in item}
+        self._indexes: dict[str, dict[str, list[dict[str, Any]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def index(self, field: str) -> dict[str, list[dict[str, Any]]]:
+        """Get the items grouped by the value of a field, such as `element_attr_id` or `weapon_cat_id`.
+
+        Args:
+            field (str): The raw name of the field.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: The items by value of the field, as a string.
+        """
+        index = self._indexes.get(field)
+        if index is None:
+            index = self._indexes[field] = {}
+            for item in self.items:
+                if field in item:
+                    index.setdefault(str(item[field]), []).append(item)
+        return index
+
+    def filter(self, **criteria: Optional[Collection[Any]]) -> list[dict[str, Any]]:
+        """Get the items whose fields match every criterion.
+
+        Args:
+            **criteria (Optional[Collection[Any]]): The accepted values of each raw field name.
+                An empty or None criterion accepts every item, like the filters of the API.
+
+        Returns:
+            List[Dict[str, Any]]: The matching items, in the order of the API.
+        """
+        selected: Optional[set[int]] = None
+        for field, values in criteria.items():
+            if not values:
+                continue
+            index = self.index(field)
+            matching = {id(item) for value in values for item in index.get(str(value), ())}
+            selected = matching if selected is None else selected & matching
+        if selected is None:
+            return list(self.items)
+        return [item for item in self.items if id(item) in selected]
+
+
+class CalculatorCatalogue:
+    """A cache of the calculator catalogues, persisted to disk and revalidated by content hash.
+
+    The catalogues only change with game patches. After `ttl` seconds a catalogue is fetched again,
+    and when the hash of its items did not change the existing entry and its indexes are kept.
+
+    Args:
+        path (Optional[Union[str, os.PathLike]], optional): The directory persisting the catalogues.
+            None keeps them in memory only.
+        ttl (float, optional): The time after which a catalogue is revalidated, in seconds.
+    """
+
+    def __init__(self, path: Optional[Union[str, "os.PathLike[str]"]] = None, *, ttl: float = 24 * 60 * 60) -> None:
+        self.path = None if path is None else Path(path).expanduser()
+        self.ttl = ttl
+        self._entries: dict[Hashable, CatalogueEntry] = {}
+        # the locks are tracked per event loop and dropped once no call is waiting on them
+        self._locks: dict[tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Lock] = {}
+        self._waiters: dict[tuple[asyncio.AbstractEventLoop, Hashable], int] = {}
+
+    def _file(self, key: tuple[Any, ...]) -> Optional[Path]:
+        if self.path is None:
+            return None
+        name = "_".join(str(getattr(part, "value", part)) for part in key)
+        return self.path / f"calculator_{name}.json"
+
+    def _load(self, key: tuple[Any, ...]) -> Optional[CatalogueEntry]:
+        file = self._file(key)
+        if file is None or not file.is_file():
+            return None
+        try:
+            with file.open(encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != CATALOGUE_VERSION:
+            return None
+        try:
+            return CatalogueEntry(data["items"], data["fetched_at"], data["digest"])
+        except (KeyError, TypeError, ValueError):
+            # a truncated or hand-edited file, fetch the catalogue again
+            return None
+
+    def _dump(self, key: tuple[Any, ...], entry: CatalogueEntry) -> None:
+        file = self._file(key)
+        if file is None:
+            return
+        file.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CATALOGUE_VERSION,
+            "digest": entry.digest,
+            "fetched_at": entry.fetched_at,
+            "items": entry.items,
+        }
+        temp = file.with_suffix(".tmp")
+        with temp.open("w", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False)
+        os.replace(temp, file)
+
+    async def get(
+        self,
+        key: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> CatalogueEntry:
+        """Get a catalogue, loading it from disk or fetching it when missing or due for revalidation.
+
+        Args:
+            key (Tuple[Any, ...]): The key of the catalogue, such as its game, region, language and slug.
+            fetch (Callable[[], Awaitable[List[Dict[str, Any]]]]): The coroutine function fetching every item.
+
+        Returns:
+            CatalogueEntry: The catalogue.
+        """
+        lock_key = (asyncio.get_running_loop(), key)
+        lock = self._locks.get(lock_key)
+        if lock is None:
+            lock = self._locks[lock_key] = asyncio.Lock()
+        self._waiters[lock_key] = self._waiters.get(lock_key, 0) + 1
+        try:
+            async with lock:
+                return await self._get(key, fetch)
+        finally:
+            self._waiters[lock_key] -= 1
+            if not self._waiters[lock_key]:
+                del self._waiters[lock_key]
+                del self._locks[lock_key]
+
+    async def _get(
+        self,
+        key: tuple[Any, ...],
+        fetch: Callable[[], Awaitable[list[dict[str, Any]]]],
+    ) -> CatalogueEntry:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = await asyncio.to_thread(self._load, key)
+        if entry is not None and time.time() < entry.fetched_at + self.ttl:
+            self._entries[key] = entry
+            return entry
+
+        items = await fetch()
+        digest = _digest(items)
+        if entry is not None and entry.digest == digest:
+            entry.fetched_at = time.time()
+        else:
+            entry = CatalogueEntry(items, time.time(), digest)
+        self._entries[key] = entry
+        await asyncio.to_thread(self._dump, key, entry)
+        return entry
+
+    async def invalidate(self, key: Optional[tuple[Any, ...]] = None) -> None:
+        """Drop a catalogue, or every catalogue, from memory and disk.
+
+        Args:
+            key (Optional[Tuple[Any, ...]], optional): The key of the catalogue. None drops every catalogue.
+        """
+        keys = list(self._entries) if key is None else [key]
+        for item in keys:
+            self._entries.pop(item, None)
+            file = self._file(item)
+            if file is not None and file.is_file():
+                file.unlink()
+        if key is None and self.path is not None and self.path.is_dir():
+            for file in self.path.glob("calculator_*.json"):
+                file.unlink()
@@ -0,0 +1,254 @@
+"""Change detection between successive polls of chronicle data."""
+
+import asyncio
+import fnmatch
+from collections.abc import AsyncIterator, Collection, Hashable, Mapping, Sequence
+from typing import Any, NamedTuple, Optional, Union
+
+from pydantic import BaseModel
+
+from simnet.models.genshin.chronicle.notes import Notes
+from simnet.models.starrail.chronicle.notes import StarRailNote
+from simnet.models.zzz.chronicle.notes import ZZZNote
+
+__all__ = (
+    "ChangeEvent",
+    "ChangeTracker",
+    "FieldChanged",
+    "NewRecord",
+    "NOTES_FIELDS",
+    "ThresholdCrossed",
+)
+
+NOTES_FIELDS: dict[type[BaseModel], tuple[str, ...]] = {
+    Notes: (
+        "current_resin",
+        "current_realm_currency",
+        "completed_commissions",
+        "claimed_commission_reward",
+        "remaining_resin_discounts",
+        "expeditions.*.status",
+    ),
+    StarRailNote: (
+        "current_stamina",
+        "current_reserve_stamina",
+        "current_train_score",
+        "current_rogue_score",
+        "remaining_weekly_discounts",
+        "expeditions.*.status",
+    ),
+    ZZZNote: (
+        "energy.progress.current",
+        "vitality.current",
+        "vhs_sale.sale_state",
+        "card_sign",
+    ),
+}
+"""The fields of the real-time notes worth tracking, by notes model.
+
+The remaining times of the notes change on every poll and are left out."""
+
+
+class FieldChanged(NamedTuple):
+    """A tracked field changed.
+
+    Attributes:
+        key: The key of the tracked account.
+        path: The dotted path of the field, such as `expeditions.0.status`.
+        old: The previous value, None if the field is new.
+        new: The current value, None if the field disappeared.
+    """
+
+    key: Hashable
+    path: str
+    old: Any
+    new: Any
+
+
+class ThresholdCrossed(NamedTuple):
+    """A numeric field crossed a threshold.
+
+    Attributes:
+        key: The key of the tracked account.
+        path: The dotted path of the field.
+        threshold: The crossed threshold.
+        old: The previous value.
+        new: The current value.
+    """
+
+    key: Hashable
+    path: str
+    threshold: float
+    old: float
+    new: float
+
+    @property
+    def rising(self) -> bool:
+        """Whether the value rose to the threshold, rather than fell below it."""
+        return self.new > self.old
+
+
+class NewRecord(NamedTuple):
+    """A record field changed, such as the season of an endgame mode.
+
+    Attributes:
+        key: The key of the tracked account.
+        path: The dotted path of the record field.
+        old: The previous record, None on the first snapshot.
+        new: The current record.
+        model: The model holding the new record.
+    """
+
+    key: Hashable
+    path: str
+    old: Any
+    new: Any
+    model: BaseModel
+
+
+ChangeEvent = Union[FieldChanged, ThresholdCrossed, NewRecord]
+
+
+def _flatten(value: Any, prefix: str, into: dict[str, Any]) -> dict[str, Any]:
+    if isinstance(value, Mapping):
+        for name, item in value.items():
+            _flatten(item, f"{prefix}.{name}" if prefix else str(name), into)
+    elif isinstance(value, Sequence) and not isinstance(value, str):
+        for index, item in enumerate(value):
+            _flatten(item, f"{prefix}.{index}" if prefix else str(index), into)
+    else:
+        into[prefix] = value
+    return into
+
+
+class ChangeTracker:
+    """A tracker of the changes of polled models, per account.
+
+    Each new model is compared with the snapshot of the previous model of the same account and the
+    differences are emitted as typed events through an asynchronous queue. Snapshots only keep the
+    tracked fields, flattened to a mapping of dotted paths to JSON values.
+
+    Args:
+        fields (Optional[Collection[str]], optional): The patterns of the dotted paths to track, such as
+            `expeditions.*.status`. Defaults to the `NOTES_FIELDS` of the model, or every field.
+        thresholds (Optional[Mapping[str, Sequence[float]]], optional): The thresholds of numeric fields,
+            by dotted path, emitting `ThresholdCrossed` when crossed, such as `{"current_resin": [160, 200]}`.
+        records (Collection[str], optional): The dotted paths identifying a record, such as `season` for
+            the spiral abyss, emitting `NewRecord` when changed.
+        maxsize (int, optional): The maximum number of events waiting in the queue. 0 means unbounded.
+    """
+
+    def __init__(
+        self,
+        *,
+        fields: Optional[Collection[str]] = None,
+        thresholds: Optional[Mapping[str, Sequence[float]]] = None,
+        records: Collection[str] = (),
+        maxsize: int = 0,
+    ) -> None:
+        self.fields = fields
+        self.thresholds = thresholds or {}
+        self.records = records
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._snapshots: dict[Hashable, dict[str, Any]] = {}
+
+    def _compact(self, model: BaseModel) -> dict[str, Any]:
+        flat = _flatten(model.model_dump(mode="json"), "", {})
+        patterns = self.fields if self.fields is not None else NOTES_FIELDS.get(type(model))
+        if patterns is None:
+            return flat
+        patterns = [*patterns, *self.thresholds, *self.records]
+        return {path: value for path, value in flat.items() if any(fnmatch.fnmatchcase(path, p) for p in patterns)}
+
+    def snapshot(self, key: Hashable) -> Optional[dict[str, Any]]:
+        """Get the snapshot of the last model of an account.
+
+        Args:
+            key (Hashable): The key of the account.
+
+        Returns:
+            Optional[Dict[str, Any]]: The snapshot, None if no model was tracked for the account.
+        """
+        return self._snapshots.get(key)
+
+    def restore(self, key: Hashable, snapshot: dict[str, Any]) -> None:
+        """Restore the snapshot of an account, such as one persisted by a previous process.
+
+        Args:
+            key (Hashable): The key of the account.
+            snapshot (Dict[str, Any]): The snapshot, as returned by `snapshot`.
+        """
+        self._snapshots[key] = snapshot
+
+    def forget(self, key: Hashable) -> None:
+        """Forget the snapshot of an account.
+
+        Args:
+            key (Hashable): The key of the account.
+        """
+        self._snapshots.pop(key, None)
+
+    def diff(self, key: Hashable, model: BaseModel) -> list[ChangeEvent]:
+        """Compare a model with the snapshot of the account and store its snapshot.
+
+        No event is emitted for the first model of an account, except for `NewRecord`.
+
+        Args:
+            key (Hashable): The key of the account.
+            model (BaseModel): The new model.
+
+        Returns:
+            List[ChangeEvent]: The changes since the previous model.
+        """
+        current = self._compact(model)
+        previous = self._snapshots.get(key)
+        self._snapshots[key] = current
+
+        events: list[ChangeEvent] = []
+        for path in self.records:
+            old = previous.get(path) if previous is not None else None
+            new = current.get(path)
+            if new is not None and new != old:
+                events.append(NewRecord(key, path, old, new, model))
+        if previous is None:
+            return events
+
+        for path in sorted(previous.keys() | current.keys()):
+            old, new = previous.get(path), current.get(path)
+            if old == new or path in self.records:
+                continue
+            events.append(FieldChanged(key, path, old, new))
+            if not isinstance(old, (int, float)) or not isinstance(new, (int, float)):
+                continue
+            events.extend(
+                ThresholdCrossed(key, path, threshold, old, new)
+                for threshold in self.thresholds.get(path, ())
+                if old < threshold <= new or new < threshold <= old
+            )
+        return events
+
+    async def update(self, key: Hashable, model: BaseModel) -> list[ChangeEvent]:
+        """Compare a model with the snapshot of the account and put the changes in the queue.
+
+        Args:
+            key (Hashable): The key of the account.
+            model (BaseModel): The new model.
+
+        Returns:
+            List[ChangeEvent]: The changes since the previous model.
+        """
+        events = self.diff(key, model)
+        for event in events:
+            await self.queue.put(event)
+        return events
+
+    async def events(self) -> AsyncIterator[ChangeEvent]:
+        """Iterate over the events of the queue, waiting for new ones.
+
+        Yields:
+            ChangeEvent: The change events, in emission order.
+        """
+        while True:
+            event = await self.queue.get()
+            self.queue.task_done()
+            yield event
@@ -0,0 +1,248 @@
+"""Scheduling of daily check-ins for large numbers of accounts."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import AsyncIterable, Iterable
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, Union
+
+from simnet.client.routes import REWARD_URL
+from simnet.errors import AlreadyClaimed, NeedChallenge
+from simnet.models.lab.daily import DailyRewardResult
+from simnet.utils.enums import Game
+
+if TYPE_CHECKING:
+    from simnet.client.components.daily import DailyRewardClient
+
+__all__ = ("CheckInTask", "CheckInMetrics", "CheckInScheduler")
+
+_LOGGER = logging.getLogger("SIMNet.CheckInScheduler")
+
+
+class CheckInTask(NamedTuple):
+    """A daily check-in to perform.
+
+    Attributes:
+        client (DailyRewardClient): The client of the account, holding its cookies.
+        game (Optional[Game]): The game to check in, defaults to the game of the client.
+        player_id (Optional[int]): The player to check in, defaults to the player of the client.
+    """
+
+    client: "DailyRewardClient"
+    game: Optional[Game] = None
+    player_id: Optional[int] = None
+
+
+class CheckInMetrics:
+    """The progress of a check-in run.
+
+    Attributes:
+        scheduled (int): The number of check-ins started.
+        claimed (int): The number of rewards claimed.
+        already_claimed (int): The number of rewards that had already been claimed today.
+        parked (int): The number of check-ins parked because a challenge must be solved.
+        failed (int): The number of check-ins that failed with another error.
+        started_at (float): The monotonic time at which the run started.
+    """
+
+    def __init__(self) -> None:
+        self.scheduled = 0
+        self.claimed = 0
+        self.already_claimed = 0
+        self.parked = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        """The number of finished check-ins."""
+        return self.claimed + self.already_claimed + self.parked + self.failed
+
+    @property
+    def in_flight(self) -> int:
+        """The number of check-ins started but not finished yet."""
+        return self.scheduled - self.done
+
+    @property
+    def elapsed(self) -> float:
+        """The time elapsed since the start of the run, in seconds."""
+        return time.monotonic() - self.started_at
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(scheduled={self.scheduled}, claimed={self.claimed}, "
+            f"already_claimed={self.already_claimed}, parked={self.parked}, failed={self.failed})"
+        )
+
+
+class CheckInScheduler:
+    """A scheduler of daily check-ins for large numbers of accounts.
+
+    The check-ins are spread evenly over a time window, each start being delayed by a random jitter,
+    and run under a global and a per-host concurrency limit. Rewards already claimed today only cost
+    the sign request. Check-ins raising `NeedChallenge`, such as `GeetestTriggered`, are parked in
+    `parked` so that they can be run again once the challenge is solved. Any other exception only
+    fails its own check-in, and exceptions raised by the callbacks are logged.
+
+    Args:
+        window (float, optional): The duration over which the check-ins are spread, in seconds.
+            0 starts them as fast as the concurrency limits allow.
+        jitter (float, optional): The maximum random delay added to the start of each check-in, in seconds.
+        concurrency (int, optional): The maximum number of check-ins running at once.
+        per_host_concurrency (Optional[int], optional): The maximum number of check-ins running at once
+            against the same host. None means only the global limit applies.
+        reward (bool, optional): Whether to fetch the claimed rewards, which costs two requests per check-in.
+        on_result (Optional[Callable[[CheckInTask, DailyRewardResult], None]], optional): A callback called
+            with the result of every check-in.
+        on_progress (Optional[Callable[[CheckInMetrics], None]], optional): A callback called with the
+            metrics after every check-in.
+
+    Attributes:
+        metrics (CheckInMetrics): The progress of the current or last run.
+        parked (List[Tuple[CheckInTask, NeedChallenge]]): The parked check-ins and their challenges.
+    """
+
+    def __init__(
+        self,
+        *,
+        window: float = 0.0,
+        jitter: float = 0.0,
+        concurrency: int = 50,
+        per_host_concurrency: Optional[int] = None,
+        reward: bool = False,
+        on_result: Optional[Callable[[CheckInTask, DailyRewardResult], None]] = None,
+        on_progress: Optional[Callable[[CheckInMetrics], None]] = None,
+    ) -> None:
+        self.window = window
+        self.jitter = jitter
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.reward = reward
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.metrics = CheckInMetrics()
+        self.parked: list[tuple[CheckInTask, NeedChallenge]] = []
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _get_host_semaphore(self, task: CheckInTask) -> Optional[asyncio.Semaphore]:
+        if self.per_host_concurrency is None:
+            return None
+        client = task.client
+        host = REWARD_URL.get_url(client.region, task.game or client.game).host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return semaphore
+
+    async def _check_in(self, task: CheckInTask) -> None:
+        client = task.client
+        game = task.game or client.game
+        player_id = task.player_id or client.player_id
+        host_semaphore = self._get_host_semaphore(task)
+        try:
+            if host_semaphore is None:
+                reward = await client.claim_daily_reward(game=game, player_id=player_id, reward=self.reward)
+            else:
+                async with host_semaphore:
+                    reward = await client.claim_daily_reward(game=game, player_id=player_id, reward=self.reward)
+        except AlreadyClaimed as exc:
+            self.metrics.already_claimed += 1
+            result = DailyRewardResult(game, player_id, error=exc)
+        except NeedChallenge as exc:
+            self.metrics.parked += 1
+            self.parked.append((task, exc))
+            result = DailyRewardResult(game, player_id, error=exc)
+        except Exception as exc:  # skipcq: PYL-W0703
+            self.metrics.failed += 1
+            result = DailyRewardResult(game, player_id, error=exc)
+        else:
+            self.metrics.claimed += 1
+            result = DailyRewardResult(game, player_id, reward=reward)
+
+        try:
+            if self.on_result is not None:
+                self.on_result(task, result)
+            if self.on_progress is not None:
+                self.on_progress(self.metrics)
+        except Exception:  # skipcq: PYL-W0703
+            _LOGGER.exception("Check-in callback failed for player %s", player_id)
+
+    async def run(
+        self,
+        tasks: Union[Iterable[CheckInTask], AsyncIterable[CheckInTask]],
+        total: Optional[int] = None,
+    ) -> CheckInMetrics:
+        """Run the check-ins of an account source.
+
+        The source is consumed lazily: a check-in is only taken from it once it is due and a
+        concurrency slot is free.
+
+        Args:
+            tasks (Union[Iterable[CheckInTask], AsyncIterable[CheckInTask]]): The source of the check-ins.
+            total (Optional[int], optional): The number of check-ins of the source, used to spread them
+                over the window. Defaults to the length of the source.
+
+        Returns:
+            CheckInMetrics: The metrics of the run.
+
+        Raises:
+            ValueError: If a window is set and the number of check-ins is unknown.
+        """
+        if total is None and self.window > 0:
+            try:
+                total = len(tasks)  # type: ignore[arg-type]
+            except TypeError:
+                raise ValueError("total is required to spread the check-ins of an iterator") from None
+        interval = self.window / total if self.window > 0 and total else 0.0
+
+        self.metrics = CheckInMetrics()
+        self.parked = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        running: set[asyncio.Task] = set()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        async def release(task: CheckInTask) -> None:
+            try:
+                await self._check_in(task)
+            finally:
+                semaphore.release()
+
+        async def source() -> AsyncIterable[CheckInTask]:
+            if isinstance(tasks, AsyncIterable):
+                async for task in tasks:
+                    yield task
+            else:
+                for task in tasks:
+                    yield task
+
+        try:
+            index = 0
+            async for task in source():
+                due = start + index * interval + (random.uniform(0, self.jitter) if self.jitter else 0)  # nosec  # noqa: S311
+                index += 1
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await semaphore.acquire()
+                self.metrics.scheduled += 1
+                running_task = asyncio.create_task(release(task))
+                running.add(running_task)
+                running_task.add_done_callback(running.discard)
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        finally:
+            for running_task in list(running):
+                running_task.cancel()
+        return self.metrics
+
+    def pop_parked(self) -> list[CheckInTask]:
+        """Take the parked check-ins, to run them again once their challenges are solved.
+
+        Returns:
+            List[CheckInTask]: The parked check-ins.
+        """
+        parked = [task for task, _ in self.parked]
+        self.parked = []
+        return parked
@@ -0,0 +1,195 @@
+"""Helpers to run requests concurrently with bounded parallelism."""
+
+import asyncio
+import contextlib
+import heapq
+from collections.abc import AsyncIterator, Awaitable, Iterable, Sequence
+from typing import Any, Callable, Optional, TypeVar
+
+__all__ = ("iter_chunked", "merge_async_iterators", "merge_sorted_async_iterators")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+async def merge_async_iterators(
+    iterators: Iterable[AsyncIterator[T]],
+    concurrency: Optional[int] = None,
+    buffer_size: int = 100,
+) -> AsyncIterator[T]:
+    """Consume several asynchronous iterators concurrently and yield their items as they arrive.
+
+    At most `concurrency` iterators are consumed at the same time, the other ones start when a
+    running one is exhausted. Items are passed through a bounded buffer, so fast iterators wait
+    for the consumer instead of piling up in memory. The first exception raised by an iterator
+    is propagated and every other iterator is cancelled.
+
+    Args:
+        iterators (Iterable[AsyncIterator[T]]): The iterators to consume.
+        concurrency (Optional[int], optional): The maximum number of iterators consumed at once.
+            None means all of them.
+        buffer_size (int, optional): The maximum number of items waiting for the consumer.
+
+    Yields:
+        T: The items of every iterator, in arrival order.
+    """
+    iterators = list(iterators)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+    semaphore = asyncio.Semaphore(concurrency or max(len(iterators), 1))
+
+    async def drain(iterator: AsyncIterator[T]) -> None:
+        try:
+            async with semaphore:
+                async for item in iterator:
+                    await queue.put((item, None))
+        except Exception as exc:  # skipcq: PYL-W0703
+            await queue.put((None, exc))
+        else:
+            await queue.put((_DONE, None))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    tasks = [asyncio.create_task(drain(iterator)) for iterator in iterators]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item, exc = await queue.get()
+            if exc is not None:
+                raise exc
+            if item is _DONE:
+                remaining -= 1
+                continue
+            yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+class _Descending:
+    """A sort key inverting the order of the wrapped value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+
+async def merge_sorted_async_iterators(
+    iterators: Iterable[AsyncIterator[T]],
+    key: Optional[Callable[[T], Any]] = None,
+    *,
+    reverse: bool = False,
+    buffer_size: int = 100,
+) -> AsyncIterator[T]:
+    """Merge several sorted asynchronous iterators into a single sorted stream, like `heapq.merge`.
+
+    Every iterator is consumed concurrently into its own bounded buffer, and the next item is taken
+    from the iterator whose head comes first, so an item is yielded as soon as the head of every
+    unfinished iterator is known. Items comparing equal keep the order of their iterators. The first
+    exception raised by an iterator is propagated and every other iterator is cancelled.
+
+    Args:
+        iterators (Iterable[AsyncIterator[T]]): The iterators to merge, each sorted by the key.
+        key (Optional[Callable[[T], Any]], optional): The function extracting the comparison key of an item.
+            None compares the items themselves.
+        reverse (bool, optional): Whether the iterators are sorted from the largest to the smallest key.
+        buffer_size (int, optional): The maximum number of items buffered per iterator.
+
+    Yields:
+        T: The items of every iterator, sorted by the key.
+    """
+    iterators = list(iterators)
+    queues: list[asyncio.Queue] = [asyncio.Queue(maxsize=buffer_size) for _ in iterators]
+
+    def sort_key(item: T) -> Any:
+        value = item if key is None else key(item)
+        return _Descending(value) if reverse else value
+
+    async def drain(iterator: AsyncIterator[T], queue: asyncio.Queue) -> None:
+        try:
+            async for item in iterator:
+                await queue.put((item, None))
+        except Exception as exc:  # skipcq: PYL-W0703
+            await queue.put((None, exc))
+        else:
+            await queue.put((_DONE, None))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    async def next_item(index: int) -> Any:
+        item, exc = await queues[index].get()
+        if exc is not None:
+            raise exc
+        return item
+
+    tasks = [asyncio.create_task(drain(iterator, queue)) for iterator, queue in zip(iterators, queues)]
+    try:
+        heads = await asyncio.gather(*(next_item(index) for index in range(len(iterators))))
+        heap = [(sort_key(item), index, item) for index, item in enumerate(heads) if item is not _DONE]
+        heapq.heapify(heap)
+        while heap:
+            _, index, item = heap[0]
+            yield item
+            following = await next_item(index)
+            if following is _DONE:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, (sort_key(following), index, following))
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
+async def iter_chunked(
+    items: Sequence[T],
+    fetch_chunk: Callable[[list[T]], Awaitable[R]],
+    *,
+    chunk_size: int,
+    concurrency: Optional[int] = None,
+) -> AsyncIterator[R]:
+    """Split items into chunks, fetch the chunks concurrently and yield their results in order.
+
+    At most `concurrency` chunks are fetched at the same time. The result of a chunk is yielded
+    as soon as it and every chunk before it are fetched. An exception raised by a chunk is
+    propagated in place of its result and the remaining chunks are cancelled.
+
+    Args:
+        items (Sequence[T]): The items to fetch.
+        fetch_chunk (Callable[[List[T]], Awaitable[R]]): The coroutine function fetching a chunk of items.
+        chunk_size (int): The maximum number of items of a chunk.
+        concurrency (Optional[int], optional): The maximum number of chunks fetched at once.
+            None means all of them.
+
+    Yields:
+        R: The results of the chunks, in the order of the items.
+    """
+    chunks = [list(items[index : index + chunk_size]) for index in range(0, len(items), chunk_size)]
+    semaphore = asyncio.Semaphore(concurrency or max(len(chunks), 1))
+
+    async def fetch(chunk: list[T]) -> R:
+        async with semaphore:
+            return await fetch_chunk(chunk)
+
+    tasks = [asyncio.create_task(fetch(chunk)) for chunk in chunks]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -6,6 +6,8 @@ import time
 from enum import Enum
 from typing import Any, Optional
 
+from httpx import QueryParams
+
 from simnet.utils.enums import Region
 from simnet.utils.types import QueryParamTypes
 
@@ -42,6 +44,26 @@ def hex_digest(text):
     return _md5.hexdigest()
 
 
+def dynamic_secret_query(params: Optional[QueryParamTypes]) -> str:
+    """
+    Builds the query string signed by the new dynamic secret.
+
+    The parameters are flattened and formatted the way httpx encodes them, a list being sent as
+    one repeated key per value, a boolean as `true` or `false` and None as an empty value, then
+    sorted by key. The values are not percent-encoded.
+
+    Args:
+        params (Optional[QueryParamTypes]): The query parameters of the request.
+
+    Returns:
+        str: The query string to sign.
+    """
+    if not params:
+        return ""
+    items = QueryParams(params).multi_items()
+    return "&".join(f"{k}={v}" for k, v in sorted(items, key=lambda item: item[0]))
+
+
 def generate_dynamic_secret(
     region: Region,
     ds_type: Optional[DSType] = None,
@@ -72,7 +94,7 @@ def generate_dynamic_secret(
         t = str(int(time.time()))
         r = str(random.randint(100001, 200000))  # nosec  # noqa: S311
         b = json.dumps(data) if data else ""
-        q = "&".join(f"{k}={v}" for k, v in sorted(params.items())) if params else ""
+        q = dynamic_secret_query(params)
         c = hex_digest(f"salt={salt}&t={t}&r={r}&b={b}&q={q}")
         return f"{t},{r},{c}"
 
@@ -0,0 +1,136 @@
+"""Cache expiry policies following the daily reset and the schedules of the game servers."""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+
+from simnet.utils.enums import Game
+from simnet.utils.player import recognize_server_timezone
+
+__all__ = (
+    "DAILY_RESET_HOUR",
+    "DailyResetExpiry",
+    "ScheduleExpiry",
+    "next_daily_reset",
+    "schedule_bounds",
+)
+
+DAILY_RESET_HOUR = 4
+"""The hour of the daily reset, in the time zone of the server."""
+
+
+def next_daily_reset(
+    player_id: int,
+    game: Game,
+    now: Optional[datetime] = None,
+    *,
+    hour: int = DAILY_RESET_HOUR,
+) -> datetime:
+    """Get the next daily reset of the server of a player.
+
+    Args:
+        player_id (int): The player ID, selecting the server.
+        game (Game): The game the player ID belongs to.
+        now (Optional[datetime], optional): The current time. Defaults to now.
+        hour (int, optional): The hour of the daily reset, in the time zone of the server.
+
+    Returns:
+        datetime: The next daily reset, in the time zone of the server.
+
+    Raises:
+        ValueError: If the player ID is not associated with any server.
+    """
+    timezone = recognize_server_timezone(player_id, game)
+    now = datetime.now(timezone) if now is None else now.astimezone(timezone)
+    reset = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    return reset if reset > now else reset + timedelta(days=1)
+
+
+def _iter_schedules(value: Any) -> Iterable[Any]:
+    if hasattr(value, "start_time") and hasattr(value, "end_time"):
+        yield value
+    schedule = getattr(value, "schedule", None)
+    if schedule is not None:
+        yield from _iter_schedules(schedule)
+    data = getattr(value, "data", None)
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_schedules(item)
+
+
+def schedule_bounds(value: Any) -> list[datetime]:
+    """Get the start and end times of the schedules of a chronicle model.
+
+    The schedules are looked up on the model itself, such as `SpiralAbyss`, on its `schedule` and on the
+    items of its `data`, such as the seasons of `ImgTheater` and `GenshinHardChallenge`.
+
+    Args:
+        value (Any): The chronicle model.
+
+    Returns:
+        List[datetime]: The start and end times of every schedule found.
+    """
+    return [bound for schedule in _iter_schedules(value) for bound in (schedule.start_time, schedule.end_time)]
+
+
+class DailyResetExpiry:
+    """An expiry policy keeping values until the next daily reset of the server of a player.
+
+    Instances are passed as the `ttl` of `BaseCache.get_or_set`, which calls them with the value to store.
+
+    Args:
+        player_id (int): The player ID, selecting the server.
+        game (Game): The game the player ID belongs to.
+        hour (int, optional): The hour of the daily reset, in the time zone of the server.
+    """
+
+    def __init__(self, player_id: int, game: Game, *, hour: int = DAILY_RESET_HOUR) -> None:
+        self.player_id = player_id
+        self.game = game
+        self.hour = hour
+
+    def expires_at(self, value: Any, now: datetime) -> datetime:  # skipcq: PYL-W0613  # noqa: ARG002
+        """Get the time at which a value expires.
+
+        Args:
+            value (Any): The value to store.
+            now (datetime): The current time.
+
+        Returns:
+            datetime: The expiry time of the value.
+        """
+        return next_daily_reset(self.player_id, self.game, now, hour=self.hour)
+
+    def __call__(self, value: Any) -> float:
+        now = datetime.now().astimezone()
+        return (self.expires_at(value, now) - now).total_seconds()
+
+
+class ScheduleExpiry(DailyResetExpiry):
+    """An expiry policy keeping values until the next daily reset or the next schedule boundary.
+
+    The boundaries are the start and end times of the schedules carried by the value, as found by
+    `schedule_bounds` or by a custom function, so a season ending before the daily reset is not served
+    past its end.
+
+    Args:
+        player_id (int): The player ID, selecting the server.
+        game (Game): The game the player ID belongs to.
+        bounds (Callable[[Any], Iterable[datetime]], optional): A function getting the schedule boundaries of a value.
+        hour (int, optional): The hour of the daily reset, in the time zone of the server.
+    """
+
+    def __init__(
+        self,
+        player_id: int,
+        game: Game,
+        bounds: Callable[[Any], Iterable[datetime]] = schedule_bounds,
+        *,
+        hour: int = DAILY_RESET_HOUR,
+    ) -> None:
+        super().__init__(player_id, game, hour=hour)
+        self.bounds = bounds
+
+    def expires_at(self, value: Any, now: datetime) -> datetime:
+        reset = super().expires_at(value, now)
+        return min((bound for bound in self.bounds(value) if now < bound < reset), default=reset)
@@ -0,0 +1,130 @@
+"""Bulk polling of real-time notes, preferring the cheaper widget endpoints."""
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from simnet.models.notes import NotesPollResult, NotesSummary
+from simnet.utils.enums import Game
+
+if TYPE_CHECKING:
+    from simnet.client.genshin import GenshinClient
+    from simnet.client.starrail import StarRailClient
+    from simnet.client.zzz import ZZZClient
+
+__all__ = ("NotesPollTask", "fetch_notes_summary", "poll_notes")
+
+_LOGGER = logging.getLogger("SIMNet.NotesPoller")
+
+AnyGameClient = Union["GenshinClient", "StarRailClient", "ZZZClient"]
+
+NOTES_METHODS: dict[Game, tuple[str, str]] = {
+    Game.GENSHIN: ("get_genshin_notes_by_stoken", "get_genshin_notes"),
+    Game.STARRAIL: ("get_starrail_notes_by_stoken", "get_starrail_notes"),
+    Game.ZZZ: ("get_zzz_notes_by_stoken", "get_zzz_notes"),
+}
+"""The widget and full notes methods of the clients, by game."""
+
+
+class NotesPollTask(NamedTuple):
+    """The real-time notes of an account to poll.
+
+    Attributes:
+        client (AnyGameClient): The client of the account, holding its cookies.
+        player_id (Optional[int]): The player to poll, defaults to the player of the client.
+    """
+
+    client: AnyGameClient
+    player_id: Optional[int] = None
+
+
+async def fetch_notes_summary(
+    client: AnyGameClient,
+    player_id: Optional[int] = None,
+    *,
+    widget: bool = True,
+    lang: Optional[str] = None,
+) -> NotesSummary:
+    """Fetch the real-time notes of an account, from the widget endpoint when possible.
+
+    The widget endpoint is lighter than the full notes endpoint, but it requires the `stoken` cookie and
+    only returns the notes of the default player of the account. The full notes are fetched instead when
+    the `stoken` is missing, another player is requested or the widget request fails for any reason.
+
+    Args:
+        client (AnyGameClient): The client of the account, its game selects the notes to fetch.
+        player_id (Optional[int], optional): The player to fetch, defaults to the player of the client.
+        widget (bool, optional): Whether to try the widget endpoint first.
+        lang (Optional[str], optional): The language of the data.
+
+    Returns:
+        NotesSummary: The summary of the notes.
+
+    Raises:
+        ValueError: If the game of the client has no real-time notes.
+        SIMNetException: If the full notes cannot be fetched.
+    """
+    methods = NOTES_METHODS.get(client.game)
+    if methods is None:
+        raise ValueError(f"{client.game} has no real-time notes.")
+    widget_method, notes_method = methods
+    default_player = player_id is None or player_id == client.player_id
+
+    if widget and default_player and client.cookies.get("stoken") is not None:
+        try:
+            notes = await getattr(client, widget_method)(lang=lang)
+        except Exception:  # skipcq: PYL-W0703
+            _LOGGER.debug("The widget notes of %s failed, falling back to the full notes", client.player_id)
+        else:
+            return NotesSummary.from_notes(player_id or client.player_id, notes, "widget")
+
+    notes = await getattr(client, notes_method)(player_id, lang=lang)
+    return NotesSummary.from_notes(player_id or client.player_id, notes, "notes")
+
+
+async def poll_notes(
+    tasks: Iterable[Union[AnyGameClient, NotesPollTask]],
+    *,
+    concurrency: int = 20,
+    widget: bool = True,
+    lang: Optional[str] = None,
+    on_result: Optional[Callable[[NotesPollResult], Any]] = None,
+) -> list[NotesPollResult]:
+    """Poll the real-time notes of many accounts at once.
+
+    Every account is fetched with `fetch_notes_summary`, so accounts holding a `stoken` only cost one widget
+    request. An account failing does not stop the others, whatever the exception, its error is reported in
+    its result. An exception raised by `on_result` is logged and does not stop the other accounts either.
+
+    Args:
+        tasks (Iterable[Union[AnyGameClient, NotesPollTask]]): The clients of the accounts to poll, or the
+            tasks selecting their players.
+        concurrency (int, optional): The maximum number of accounts polled at once.
+        widget (bool, optional): Whether to try the widget endpoints first.
+        lang (Optional[str], optional): The language of the data.
+        on_result (Optional[Callable[[NotesPollResult], Any]], optional): A callback called with the
+            result of every account as soon as it is polled.
+
+    Returns:
+        List[NotesPollResult]: The results, in the order of the tasks.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def poll(task: Union[AnyGameClient, NotesPollTask]) -> NotesPollResult:
+        client, player_id = task if isinstance(task, NotesPollTask) else (task, None)
+        async with semaphore:
+            try:
+                summary = await fetch_notes_summary(client, player_id, widget=widget, lang=lang)
+            except Exception as exc:  # skipcq: PYL-W0703
+                result = NotesPollResult(client.game, player_id or client.player_id, error=exc)
+            else:
+                result = NotesPollResult(summary.game, summary.player_id, summary=summary)
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception:  # skipcq: PYL-W0703
+                _LOGGER.exception("Notes callback failed for player %s", result.player_id)
+        return result
+
+    return list(await asyncio.gather(*(poll(task) for task in tasks)))
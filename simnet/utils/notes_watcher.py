@@ -0,0 +1,234 @@
+"""Polling of real-time notes, scheduled around the moments the notes change state."""
+
+import asyncio
+import contextlib
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Hashable
+from datetime import timedelta
+from typing import Any, Callable, Optional, Union
+
+from simnet.errors import SIMNetException
+from simnet.models.genshin.chronicle.notes import Notes
+from simnet.models.starrail.chronicle.notes import StarRailNote
+from simnet.models.zzz.chronicle.notes import ZZZNote
+
+__all__ = ("AnyNotes", "next_notes_event", "NotesWatcher")
+
+_LOGGER = logging.getLogger("SIMNet.NotesWatcher")
+
+AnyNotes = Union[Notes, StarRailNote, ZZZNote]
+
+RESERVE_STAMINA_MAX = 2400
+"""The maximum StarRail reserve stamina."""
+RESERVE_STAMINA_INTERVAL = timedelta(minutes=18)
+"""The time StarRail takes to store one reserve stamina, once the stamina is full."""
+
+
+def _notes_timers(notes: AnyNotes) -> list[timedelta]:
+    """Get the remaining times until each state change of the notes."""
+    if isinstance(notes, Notes):
+        timers = [
+            notes.remaining_resin_recovery_time,
+            notes.remaining_realm_currency_recovery_time,
+            *(expedition.remaining_time for expedition in notes.expeditions),
+        ]
+        if notes.remaining_transformer_recovery_time is not None:
+            timers.append(notes.remaining_transformer_recovery_time)
+        return timers
+    if isinstance(notes, StarRailNote):
+        stamina_full = notes.stamina_full_ts - notes.current_ts
+        timers = [stamina_full, *(expedition.remaining_time for expedition in notes.expeditions)]
+        if not notes.is_reserve_stamina_full:
+            missing = RESERVE_STAMINA_MAX - notes.current_reserve_stamina
+            timers.append(max(stamina_full, timedelta(0)) + missing * RESERVE_STAMINA_INTERVAL)
+        return timers
+    if isinstance(notes, ZZZNote):
+        return [notes.energy.restore]
+    raise TypeError(f"{type(notes).__name__} is not a supported notes model.")
+
+
+def next_notes_event(notes: AnyNotes) -> Optional[timedelta]:
+    """Get the time until the next interesting moment of real-time notes.
+
+    The interesting moments are the resin, stamina or energy being full, the realm currency being
+    full, the parametric transformer being ready, an expedition being done and the StarRail reserve
+    stamina being full.
+
+    Args:
+        notes (AnyNotes): The real-time notes of Genshin, StarRail or ZZZ.
+
+    Returns:
+        Optional[timedelta]: The time until the next interesting moment, None if nothing is pending.
+
+    Raises:
+        TypeError: If the notes are not a supported notes model.
+    """
+    pending = [timer for timer in _notes_timers(notes) if timer > timedelta(0)]
+    return min(pending) if pending else None
+
+
+class NotesWatcher:
+    """A watcher polling the real-time notes of many accounts.
+
+    Instead of polling every account at a fixed interval, the next poll of an account is scheduled at
+    the next interesting moment of its notes, as computed by `next_notes_event`, bounded by the minimal
+    and maximal intervals. Due polls are kept in a single heap over every watched account. A poll failing
+    with an unexpected exception, or whose callback raises, is logged and scheduled again like a failed poll.
+
+    Args:
+        min_interval (float, optional): The minimal time between two polls of an account, in seconds.
+        max_interval (float, optional): The maximal time between two polls of an account, in seconds.
+        error_interval (float, optional): The time before polling an account again after an error, in seconds.
+        margin (float, optional): The time added to the next interesting moment, so that the polled notes
+            reflect it, in seconds.
+        concurrency (int, optional): The maximum number of polls running at once.
+        on_notes (Optional[Callable[[Hashable, AnyNotes], Any]], optional): A function or coroutine function
+            called with the key of the account and its notes after every poll.
+        on_error (Optional[Callable[[Hashable, SIMNetException], Any]], optional): A function or coroutine
+            function called with the key of the account and the error of a failed poll.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_interval: float = 60.0,
+        max_interval: float = 3600.0,
+        error_interval: float = 600.0,
+        margin: float = 5.0,
+        concurrency: int = 20,
+        on_notes: Optional[Callable[[Hashable, AnyNotes], Any]] = None,
+        on_error: Optional[Callable[[Hashable, SIMNetException], Any]] = None,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.error_interval = error_interval
+        self.margin = margin
+        self.concurrency = concurrency
+        self.on_notes = on_notes
+        self.on_error = on_error
+        self._watched: dict[Hashable, tuple[Callable[[], Awaitable[AnyNotes]], int]] = {}
+        self._heap: list[tuple[float, int, Hashable, int]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._watched
+
+    def _schedule(self, key: Hashable, delay: float) -> None:
+        _, generation = self._watched[key]
+        due = time.monotonic() + delay
+        heapq.heappush(self._heap, (due, next(self._counter), key, generation))
+        if self._wakeup is not None and self._heap[0][2] == key:
+            self._wakeup.set()
+
+    def watch(self, key: Hashable, fetch: Callable[[], Awaitable[AnyNotes]], *, delay: float = 0.0) -> None:
+        """Start watching the notes of an account, replacing a previous watch of the same key.
+
+        Args:
+            key (Hashable): The key identifying the account, such as its player ID.
+            fetch (Callable[[], Awaitable[AnyNotes]]): The coroutine function fetching the notes,
+                such as `partial(client.get_genshin_notes, player_id)`.
+            delay (float, optional): The time before the first poll, in seconds.
+        """
+        previous = self._watched.get(key)
+        self._watched[key] = (fetch, previous[1] + 1 if previous else 0)
+        self._schedule(key, delay)
+
+    def unwatch(self, key: Hashable) -> None:
+        """Stop watching the notes of an account.
+
+        Args:
+            key (Hashable): The key identifying the account.
+        """
+        self._watched.pop(key, None)
+
+    def next_interval(self, notes: AnyNotes) -> float:
+        """Get the time before the next poll of notes, in seconds.
+
+        Args:
+            notes (AnyNotes): The last polled notes.
+
+        Returns:
+            float: The time before the next poll, in seconds.
+        """
+        event = next_notes_event(notes)
+        if event is None:
+            return self.max_interval
+        return min(max(event.total_seconds() + self.margin, self.min_interval), self.max_interval)
+
+    @staticmethod
+    async def _call(callback: Optional[Callable[..., Any]], *args: Any) -> None:
+        if callback is None:
+            return
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _poll(self, key: Hashable, fetch: Callable[[], Awaitable[AnyNotes]], generation: int) -> None:
+        interval = self.error_interval
+        try:
+            try:
+                notes = await fetch()
+            except SIMNetException as exc:
+                await self._call(self.on_error, key, exc)
+            else:
+                interval = self.next_interval(notes)
+                await self._call(self.on_notes, key, notes)
+        except Exception:  # skipcq: PYL-W0703
+            _LOGGER.exception("Polling the notes of %r failed", key)
+        finally:
+            watched = self._watched.get(key)
+            if watched is not None and watched[1] == generation:
+                self._schedule(key, interval)
+
+    async def run(self) -> None:
+        """Poll the watched accounts until `stop` is called or the task is cancelled."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks: set[asyncio.Task] = set()
+
+        async def poll(key: Hashable, fetch: Callable[[], Awaitable[AnyNotes]], generation: int) -> None:
+            try:
+                await self._poll(key, fetch, generation)
+            finally:
+                semaphore.release()
+
+        # created here so that the event belongs to the loop running the watcher
+        self._wakeup = asyncio.Event()
+        self._running = True
+        try:
+            while self._running:
+                delay = self._heap[0][0] - time.monotonic() if self._heap else None
+                if delay is None or delay > 0:
+                    self._wakeup.clear()
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    continue
+
+                _, _, key, generation = heapq.heappop(self._heap)
+                watched = self._watched.get(key)
+                if watched is None or watched[1] != generation:
+                    # the account was unwatched or watched again since this poll was scheduled
+                    continue
+                await semaphore.acquire()
+                task = asyncio.create_task(poll(key, watched[0], generation))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            self._running = False
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Stop the polling loop started by `run`."""
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
@@ -1,16 +1,395 @@
 import asyncio
 import contextlib
-from collections.abc import Awaitable
-from typing import Any, Callable
+import math
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from typing import Any, Callable, Generic, Optional, TypeVar
 
+from simnet.errors import VisitsTooFrequently
 
-class WishPaginator:
+__all__ = (
+    "AdaptivePacing",
+    "BasePaginator",
+    "CursorPaginator",
+    "PagePaginator",
+    "WishPaginator",
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AdaptivePacing:
+    """
+    Adaptive delay between two page requests.
+
+    The delay grows when the API answers with `VisitsTooFrequently` and the request is retried,
+    then shrinks back towards the minimal delay as requests succeed again.
+
+    Attributes:
+        delay (float): The current delay, in seconds.
+        min_delay (float): The lowest delay the pacing recovers to, in seconds.
+        max_delay (float): The highest delay the pacing backs off to, in seconds.
+        backoff (float): The factor applied to the delay when rate limited.
+        recovery (float): The factor applied to the delay after a successful request.
+        max_retries (int): The maximum number of retries of a rate limited request.
+    """
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        min_delay: Optional[float] = None,
+        max_delay: float = 30.0,
+        backoff: float = 2.0,
+        recovery: float = 0.8,
+        max_retries: int = 5,
+    ):
+        self.delay = delay
+        self.min_delay = delay if min_delay is None else min_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.recovery = recovery
+        self.max_retries = max_retries
+
+    async def wait(self, since: Optional[float] = None) -> None:
+        """
+        Waits for the current delay.
+
+        Args:
+            since (Optional[float], optional): The event loop time the delay started at, such as the start
+                of the previous request. If not provided, the delay starts now.
+        """
+        delay = self.delay
+        if since is not None:
+            delay -= asyncio.get_running_loop().time() - since
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def succeeded(self) -> None:
+        """Records a successful request."""
+        self.delay = max(self.min_delay, self.delay * self.recovery)
+
+    def throttled(self) -> None:
+        """Records a rate limited request."""
+        self.delay = min(self.max_delay, max(self.delay, 0.5) * self.backoff)
+
+    async def call(self, func: Callable[..., Awaitable[R]], *args: Any, **kwargs: Any) -> R:
+        """
+        Calls a request function, retrying it with a growing delay while rate limited.
+
+        Args:
+            func (Callable[..., Awaitable[R]]): The request function.
+            *args (Any): The positional arguments of the function.
+            **kwargs (Any): The keyword arguments of the function.
+
+        Returns:
+            R: The result of the function.
+        """
+        retries = 0
+        while True:
+            try:
+                result = await func(*args, **kwargs)
+            except VisitsTooFrequently:  # noqa: PERF203
+                if retries >= self.max_retries:
+                    raise
+                retries += 1
+                self.throttled()
+                await self.wait()
+            else:
+                self.succeeded()
+                return result
+
+
+class BasePaginator(ABC, Generic[T]):
+    """
+    The base class of paginators.
+
+    A paginator is an asynchronous iterator over the items of a paged endpoint. Subclasses provide
+    the pages, the base class takes care of filtering, limits and keeps a resumable cursor.
+
+    Attributes:
+        limit (Optional[int]): The maximum number of items to yield.
+        prefetch (int): The number of pages that may be requested ahead of the page being processed.
+            0 disables prefetching: the next page is only requested once the current one is processed.
+        pacing (AdaptivePacing): The pacing of the page requests.
+        cursor (Any): The position to resume the pagination from, updated as items are yielded.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        pacing: Optional[AdaptivePacing] = None,
+        cursor: Any = None,
+    ):
+        self.limit = limit
+        self.prefetch = prefetch
+        self.pacing = pacing or AdaptivePacing()
+        self.cursor = cursor
+
+    @abstractmethod
+    def _fetch_pages(self, limit: Optional[int] = None) -> AsyncIterator[Sequence[T]]:
+        """
+        Yields the pages in order, starting from the cursor.
+
+        Args:
+            limit (Optional[int], optional): The number of items to yield, no page is requested past it.
+        """
+
+    def _filter(self, item: T) -> tuple[bool, bool]:  # skipcq: PYL-R0201  # noqa: ARG002
+        """
+        Decides what to do with an item.
+
+        Returns:
+            Tuple[bool, bool]: Whether to yield the item, and whether to stop after the current page.
+        """
+        return True, False
+
+    def _advance(self, item: T) -> None:
+        """Updates the cursor after an item has been yielded."""
+
+    def _account_page(self, page: Sequence[T], remaining: Optional[int]) -> tuple[Optional[int], bool]:
+        """
+        Processes a page the way `iterate` does, without yielding it, to know whether a next page is needed.
+
+        Args:
+            page (Sequence[T]): The items of the page.
+            remaining (Optional[int]): The number of items still to yield, None if unlimited.
+
+        Returns:
+            Tuple[Optional[int], bool]: The number of items still to yield after the page,
+                and whether no page should be requested after it.
+        """
+        stop = False
+        for item in page:
+            keep, item_stop = self._filter(item)
+            stop = stop or item_stop
+            if keep and remaining is not None:
+                remaining -= 1
+                if remaining <= 0:
+                    return 0, True
+        return remaining, stop
+
+    async def iterate(self, limit: Optional[int] = None) -> AsyncIterator[T]:
+        """
+        Fetches the items page by page and yields them as soon as each page is processed.
+
+        Args:
+            limit (Optional[int], optional): The maximum number of items to yield.
+                If not provided, the paginator limit is used.
+
+        Yields:
+            T: The fetched items.
+        """
+        limit = limit or self.limit
+        count = 0
+        pages = self._fetch_pages(limit or None)
+
+        try:
+            async for page in pages:
+                need_break = False
+                for item in page:
+                    keep, stop = self._filter(item)
+                    need_break = need_break or stop
+                    if not keep:
+                        continue
+                    self._advance(item)
+                    yield item
+                    count += 1
+                    if limit and count >= limit:
+                        return
+                if need_break:
+                    return
+        finally:
+            await pages.aclose()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.iterate()
+
+    async def flatten(self) -> list[T]:
+        """
+        Fetches and returns all the items, up to the paginator limit.
+
+        Returns:
+            List[T]: The list of fetched items.
+        """
+        return [item async for item in self.iterate()]
+
+
+class CursorPaginator(BasePaginator[dict]):
+    """
+    A paginator for endpoints paged with the `end_id` of the last item of the previous page.
+
+    The `end_id` of the next page is known as soon as a page is received, so when prefetching is
+    enabled a background task requests the next pages while the consumer processes the previous ones.
+    The pacing delay then separates the starts of two requests, so the latency of a request is hidden
+    without sending the pages faster than the pacing allows.
+
+    Attributes:
+        fetch_data (Callable[..., Awaitable[Dict[str, Any]]]): An asynchronous function to fetch the raw data,
+            called with the `end_id` keyword argument.
+        list_key (str): The key of the items in the raw data.
+        end_id (int): The ID of the item to stop fetching at.
+        min_id (int): The ID below which items are not fetched anymore.
+        cursor (int): The `end_id` to request the next page with. 0 starts from the newest item.
+    """
+
+    def __init__(
+        self,
+        fetch_data: Callable[..., Awaitable[dict[str, Any]]],
+        *,
+        list_key: str = "list",
+        end_id: int = 0,
+        min_id: int = 0,
+        cursor: int = 0,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        pacing: Optional[AdaptivePacing] = None,
+    ):
+        super().__init__(limit=limit, prefetch=prefetch, pacing=pacing, cursor=cursor)
+        self.fetch_data = fetch_data
+        self.list_key = list_key
+        self.end_id = end_id
+        self.min_id = min_id
+
+    def _is_last_page(self, raw_data: dict[str, Any]) -> bool:
+        return not raw_data[self.list_key] or raw_data.get("has_more", True) is False
+
+    async def _request_pages(
+        self, limit: Optional[int] = None, *, from_start: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        current_end_id = self.cursor
+        remaining = limit
+        while True:
+            started = loop.time()
+            raw_data = await self.pacing.call(self.fetch_data, end_id=current_end_id)
+            yield raw_data
+            remaining, stop = self._account_page(raw_data[self.list_key], remaining)
+            if stop or self._is_last_page(raw_data):
+                return
+            current_end_id = raw_data[self.list_key][-1]["id"]
+            await self.pacing.wait(started if from_start else None)
+
+    async def _prefetch_pages(self, limit: Optional[int] = None) -> AsyncIterator[dict[str, Any]]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch)
+
+        async def producer() -> None:
+            try:
+                async for raw_data in self._request_pages(limit, from_start=True):
+                    await queue.put(raw_data)
+            except Exception as exc:  # skipcq: PYL-W0703
+                await queue.put(exc)
+            else:
+                await queue.put(None)
+
+        task = asyncio.create_task(producer())
+        try:
+            while True:
+                raw_data = await queue.get()
+                if raw_data is None:
+                    return
+                if isinstance(raw_data, Exception):
+                    raise raw_data
+                yield raw_data
+        finally:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _fetch_pages(self, limit: Optional[int] = None) -> AsyncIterator[Sequence[dict]]:
+        pages = self._prefetch_pages(limit) if self.prefetch > 0 else self._request_pages(limit)
+        try:
+            async for raw_data in pages:
+                yield raw_data[self.list_key]
+        finally:
+            await pages.aclose()
+
+    def _filter(self, item: dict) -> tuple[bool, bool]:
+        if int(item["id"]) == self.end_id:
+            return False, True
+        if self.min_id:
+            with contextlib.suppress(ValueError):
+                if int(item["id"]) <= self.min_id:
+                    return False, True
+        return True, False
+
+    def _advance(self, item: dict) -> None:
+        self.cursor = item["id"]
+
+
+class PagePaginator(BasePaginator[T]):
+    """
+    A paginator for endpoints paged with a page number.
+
+    Page numbers are known in advance, so when prefetching is enabled the pages are requested
+    concurrently in windows of `prefetch` pages. No new window is requested once an empty or
+    incomplete page is found, or once the limit is reached, and with a known `page_size` a window
+    never requests more pages than the limit needs.
+
+    Attributes:
+        fetch_page (Callable[[int], Awaitable[Sequence[T]]]): An asynchronous function to fetch the items of a page.
+        page_size (Optional[int]): The number of items of a full page. A shorter page is the last one.
+        max_page (Optional[int]): The last page to request.
+        cursor (int): The number of the next page to request.
+    """
+
+    def __init__(
+        self,
+        fetch_page: Callable[[int], Awaitable[Sequence[T]]],
+        *,
+        start_page: int = 1,
+        page_size: Optional[int] = None,
+        max_page: Optional[int] = None,
+        limit: Optional[int] = None,
+        prefetch: int = 0,
+        pacing: Optional[AdaptivePacing] = None,
+    ):
+        super().__init__(limit=limit, prefetch=prefetch, pacing=pacing or AdaptivePacing(0), cursor=start_page)
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.max_page = max_page
+
+    def _is_last_page(self, page: int, items: Sequence[T]) -> bool:
+        if not items or (self.page_size is not None and len(items) < self.page_size):
+            return True
+        return self.max_page is not None and page >= self.max_page
+
+    async def _fetch_pages(self, limit: Optional[int] = None) -> AsyncIterator[Sequence[T]]:
+        window = max(self.prefetch, 1)
+        page = self.cursor
+        remaining = limit
+        while self.max_page is None or page <= self.max_page:
+            if remaining is not None and self.page_size:
+                window = min(window, math.ceil(remaining / self.page_size))
+            numbers = range(page, page + window if self.max_page is None else min(page + window, self.max_page + 1))
+            pages = await asyncio.gather(*(self.pacing.call(self.fetch_page, number) for number in numbers))
+            for number, items in zip(numbers, pages):
+                # resuming from this page yields its items again, the cursor has a page granularity
+                self.cursor = number
+                yield items
+                self.cursor = number + 1
+                remaining, stop = self._account_page(items, remaining)
+                if stop or self._is_last_page(number, items):
+                    return
+            page += window
+            await self.pacing.wait()
+
+
+class WishPaginator(CursorPaginator):
     """
     A paginator for fetching and processing wish data.
 
     Attributes:
         end_id (int): The ID of the item to stop fetching at.
+        min_id (int): The ID below which items are not fetched anymore.
         fetch_data (Callable[..., Awaitable[Dict[str, Any]]]): An asynchronous function to fetch the raw data.
+        list_key (str): The key of the items in the raw data.
+        prefetch (int): The number of pages that may be requested ahead of the page being processed.
+            0 disables pipelining: the next page is only requested once the current one is processed.
+        delay (float): The delay between two page requests, in seconds.
+        cursor (int): The `end_id` the first page is requested with. 0 starts from the newest item.
     """
 
     def __init__(
@@ -19,11 +398,20 @@ class WishPaginator:
         min_id: int,
         fetch_data: Callable[..., Awaitable[dict[str, Any]]],
         list_key: str = "list",
+        prefetch: int = 0,
+        delay: float = 1.0,
+        cursor: int = 0,
     ):
-        self.end_id = end_id
-        self.min_id = min_id
-        self.fetch_data = fetch_data
-        self.list_key = list_key
+        super().__init__(
+            fetch_data,
+            list_key=list_key,
+            end_id=end_id,
+            min_id=min_id,
+            cursor=cursor,
+            prefetch=prefetch,
+            pacing=AdaptivePacing(delay),
+        )
+        self.delay = delay
 
     async def get(self, limit: int) -> list[dict]:
         """
@@ -35,38 +423,4 @@ class WishPaginator:
         Returns:
             List[Dict]: The list of fetched items.
         """
-        all_items = []
-        current_end_id = 0
-
-        while True:
-            raw_data = await self.fetch_data(end_id=current_end_id)
-            items = raw_data[self.list_key]
-            if not items:
-                break
-
-            current_end_id = items[-1]["id"]
-
-            filtered_items, need_break = [], False
-            for item in items:
-                if int(item["id"]) == self.end_id:
-                    need_break = True
-                    continue
-                if self.min_id:
-                    with contextlib.suppress(ValueError):
-                        if int(item["id"]) <= self.min_id:
-                            need_break = True
-                            continue
-                filtered_items.append(item)
-            all_items.extend(filtered_items)
-
-            if "has_more" in raw_data:
-                need_break = need_break or raw_data["has_more"] is False
-            if need_break:
-                break
-            if limit and len(all_items) >= limit:
-                break
-
-            await asyncio.sleep(1)
-
-        # Return up to the specified limit.
-        return all_items[: min(len(all_items), limit)] if limit else all_items
+        return [item async for item in self.iterate(limit)]
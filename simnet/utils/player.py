@@ -1,5 +1,6 @@
 """This module contains functions for recognizing servers associated with different player IDs."""
 
+import datetime
 from collections.abc import Mapping, Sequence
 from typing import Optional
 
@@ -28,6 +29,25 @@ UID_RANGE: Mapping[Game, Mapping[Region, Sequence[int]]] = {
         Region.OVERSEAS: (10, 13, 15, 17),
     },
 }
+SERVER_UTC_OFFSETS: Mapping[str, int] = {
+    "cn_gf01": 8,
+    "cn_qd01": 8,
+    "os_usa": -5,
+    "os_euro": 1,
+    "os_asia": 8,
+    "os_cht": 8,
+    "prod_gf_cn": 8,
+    "prod_qd_cn": 8,
+    "prod_official_usa": -5,
+    "prod_official_eur": 1,
+    "prod_official_asia": 8,
+    "prod_official_cht": 8,
+    "prod_gf_us": -5,
+    "prod_gf_eu": 1,
+    "prod_gf_jp": 8,
+    "prod_gf_sg": 8,
+}
+"""The UTC offsets of the game servers, in hours, which the daily reset and the schedules follow."""
 
 
 def recognize_game_uid_first_digit(player_id: int, game: Game) -> int:
@@ -181,6 +201,28 @@ def recognize_server(player_id: int, game: Game) -> str:
     raise ValueError(f"{game} is not a valid game")
 
 
+def recognize_server_timezone(player_id: int, game: Game) -> datetime.timezone:
+    """
+    Recognizes the time zone of the server of a player ID for a given game.
+
+    Args:
+        player_id (int): The player ID to recognize the time zone for.
+        game (Game): The game the player ID belongs to.
+
+    Returns:
+        datetime.timezone: The time zone of the server the player ID belongs to.
+
+    Raises:
+        ValueError: If the specified game is not supported, the player ID is not associated with any server
+            or the time zone of the server is unknown.
+    """
+    server = recognize_server(player_id, game)
+    offset = SERVER_UTC_OFFSETS.get(server)
+    if offset is None:
+        raise ValueError(f"The time zone of server {server} is unknown")
+    return datetime.timezone(datetime.timedelta(hours=offset))
+
+
 def recognize_genshin_game_biz(game_uid: int) -> str:
     """Recognizes the game biz of a player ID for a game biz.
 
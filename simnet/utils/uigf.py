@@ -0,0 +1,404 @@
+"""Streaming export and import of wish histories in the UIGF family of formats.
+
+Both directions work on one wish at a time, so the memory used does not depend on the
+size of the history. The writer produces UIGF v4.0 documents. The reader accepts UIGF v4.0
+as well as the legacy single account UIGF v3.0 and SRGF v1.0 documents.
+"""
+
+import json
+import time
+from collections.abc import AsyncIterable, Iterable, Iterator
+from datetime import datetime
+from types import TracebackType
+from typing import IO, Any, NamedTuple, Optional, Union
+
+from simnet.models.genshin.wish import Wish
+from simnet.models.starrail.wish import StarRailWish
+from simnet.models.zzz.wish import ZZZWish
+from simnet.version import __version__
+
+__all__ = (
+    "UIGFEntry",
+    "UIGFWriter",
+    "iter_uigf",
+    "uigf_item_to_wish",
+    "wish_to_uigf_item",
+)
+
+UIGFWish = Union[Wish, StarRailWish, ZZZWish]
+
+UIGF_VERSION = "v4.0"
+UIGF_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+UIGF_GAMES: dict[str, type] = {
+    "hk4e": Wish,
+    "hkrpg": StarRailWish,
+    "nap": ZZZWish,
+}
+"""Wish models by UIGF game key."""
+
+_CHUNK_SIZE = 64 * 1024
+
+
+class UIGFEntry(NamedTuple):
+    """A wish read from a UIGF document.
+
+    Attributes:
+        game (str): The UIGF game key of the account, one of `hk4e`, `hkrpg` or `nap`.
+        uid (int): The user ID of the account.
+        lang (str): The language of the account records.
+        wish (UIGFWish): The wish.
+    """
+
+    game: str
+    uid: int
+    lang: str
+    wish: UIGFWish
+
+
+def _get_game(wish: UIGFWish) -> str:
+    for game, model in UIGF_GAMES.items():
+        if type(wish) is model:
+            return game
+    raise TypeError(f"{type(wish).__name__} cannot be exported to UIGF.")
+
+
+def wish_to_uigf_item(wish: UIGFWish) -> dict[str, str]:
+    """Convert a wish to a UIGF record.
+
+    Args:
+        wish (UIGFWish): The wish to convert.
+
+    Returns:
+        Dict[str, str]: The UIGF record.
+
+    Raises:
+        TypeError: If the wish model is not supported by UIGF.
+    """
+    game = _get_game(wish)
+    item = {
+        "gacha_type": str(int(wish.banner_type)),
+        "item_id": str(getattr(wish, "item_id", "")),
+        "count": "1",
+        "time": wish.time.strftime(UIGF_TIME_FORMAT),
+        "name": wish.name,
+        "item_type": wish.type,
+        "rank_type": str(wish.rarity - 1 if game == "nap" else wish.rarity),
+        "id": str(wish.id),
+    }
+    if game == "hk4e":
+        item["uigf_gacha_type"] = "301" if item["gacha_type"] == "400" else item["gacha_type"]
+    else:
+        item["gacha_id"] = str(wish.banner_id)
+    return item
+
+
+def uigf_item_to_wish(item: dict[str, Any], game: str, uid: int, banner_name: str = "") -> UIGFWish:
+    """Convert a UIGF record to a wish.
+
+    Args:
+        item (Dict[str, Any]): The UIGF record.
+        game (str): The UIGF game key of the record.
+        uid (int): The user ID of the account the record belongs to.
+        banner_name (str, optional): The banner name to use for Genshin wishes, UIGF does not carry it.
+
+    Returns:
+        UIGFWish: The wish.
+
+    Raises:
+        ValueError: If the game key is not supported.
+    """
+    model = UIGF_GAMES.get(game)
+    if model is None:
+        raise ValueError(f"{game!r} is not a valid UIGF game.")
+    data = dict(item, uid=item.get("uid") or uid, time=datetime.strptime(item["time"], UIGF_TIME_FORMAT))  # noqa: DTZ007
+    if model is Wish:
+        data.setdefault("banner_name", banner_name)
+    else:
+        data.setdefault("gacha_id", 0)
+    return model(**data)
+
+
+class UIGFWriter:
+    """Incremental writer of UIGF v4.0 documents.
+
+    Accounts are written one at a time and their wishes are serialized as they are consumed,
+    so wishes can be piped straight from `WishPaginator.iterate` or any other stream.
+    All accounts of a game must be written consecutively.
+
+    Example:
+        >>> with open("uigf.json", "w", encoding="utf-8") as fp, UIGFWriter(fp) as writer:
+        ...     writer.write_account(uid, wishes)
+
+    Args:
+        fp (IO[str]): The text stream to write the document to.
+        export_app (str, optional): The name of the exporting application.
+        export_app_version (str, optional): The version of the exporting application.
+        export_timestamp (Optional[int], optional): The export time. Defaults to now.
+    """
+
+    def __init__(
+        self,
+        fp: IO[str],
+        export_app: str = "SIMNet",
+        export_app_version: str = __version__,
+        export_timestamp: Optional[int] = None,
+    ) -> None:
+        self.fp = fp
+        self.info = {
+            "export_timestamp": export_timestamp or int(time.time()),
+            "export_app": export_app,
+            "export_app_version": export_app_version,
+            "version": UIGF_VERSION,
+        }
+        self._game: Optional[str] = None
+        self._written_games: set[str] = set()
+        self._started = False
+        self._first_account = True
+
+    def __enter__(self) -> "UIGFWriter":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+    def start(self) -> None:
+        """Write the document header."""
+        if not self._started:
+            self.fp.write('{"info":' + json.dumps(self.info, ensure_ascii=False))
+            self._started = True
+
+    def close(self) -> None:
+        """Write the document footer."""
+        self.start()
+        if self._game is not None:
+            self.fp.write("]")
+        self.fp.write("}")
+
+    def _begin_account(self, game: str, uid: int, timezone: int, lang: str) -> None:
+        self.start()
+        if game != self._game:
+            if game in self._written_games:
+                raise ValueError(f"Accounts of {game!r} must be written consecutively.")
+            if self._game is not None:
+                self.fp.write("]")
+            self.fp.write(f',"{game}":[')
+            self._game = game
+            self._written_games.add(game)
+            self._first_account = True
+        if not self._first_account:
+            self.fp.write(",")
+        self._first_account = False
+        header = json.dumps({"uid": str(uid), "timezone": timezone, "lang": lang}, ensure_ascii=False)
+        self.fp.write(header[:-1] + ',"list":[')
+
+    def _write_wish(self, wish: UIGFWish, game: Optional[str], first: bool) -> str:
+        item_game = _get_game(wish)
+        if game is not None and item_game != game:
+            raise ValueError(f"Cannot mix {game!r} and {item_game!r} wishes in one account.")
+        self.fp.write(("" if first else ",") + json.dumps(wish_to_uigf_item(wish), ensure_ascii=False))
+        return item_game
+
+    def write_account(
+        self,
+        uid: int,
+        wishes: Iterable[UIGFWish],
+        *,
+        game: Optional[str] = None,
+        timezone: int = 8,
+        lang: str = "zh-cn",
+    ) -> int:
+        """Write an account and all its wishes.
+
+        Args:
+            uid (int): The user ID of the account.
+            wishes (Iterable[UIGFWish]): The wishes of the account, all of the same game.
+            game (Optional[str], optional): The UIGF game key. Inferred from the first wish if not provided.
+            timezone (int, optional): The UTC offset of the account server, in hours.
+            lang (str, optional): The language of the records.
+
+        Returns:
+            int: The number of wishes written.
+        """
+        iterator = iter(wishes)
+        first = next(iterator, None)
+        if first is None:
+            return 0
+        self._begin_account(game or _get_game(first), uid, timezone, lang)
+        game = self._write_wish(first, game, True)
+        count = 1
+        for wish in iterator:
+            self._write_wish(wish, game, False)
+            count += 1
+        self.fp.write("]}")
+        return count
+
+    async def write_account_async(
+        self,
+        uid: int,
+        wishes: AsyncIterable[UIGFWish],
+        *,
+        game: Optional[str] = None,
+        timezone: int = 8,
+        lang: str = "zh-cn",
+    ) -> int:
+        """Write an account and all its wishes from an asynchronous stream.
+
+        Args:
+            uid (int): The user ID of the account.
+            wishes (AsyncIterable[UIGFWish]): The wishes of the account, all of the same game.
+            game (Optional[str], optional): The UIGF game key. Inferred from the first wish if not provided.
+            timezone (int, optional): The UTC offset of the account server, in hours.
+            lang (str, optional): The language of the records.
+
+        Returns:
+            int: The number of wishes written.
+        """
+        count = 0
+        async for wish in wishes:
+            if not count:
+                self._begin_account(game or _get_game(wish), uid, timezone, lang)
+            game = self._write_wish(wish, game, not count)
+            count += 1
+        if count:
+            self.fp.write("]}")
+        return count
+
+
+class _JSONStream:
+    """Minimal pull parser walking the structure of a JSON document read in chunks."""
+
+    def __init__(self, fp: IO[str]) -> None:
+        self.fp = fp
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.fp.read(_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of UIGF document.")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Malformed UIGF document: expected {char!r} at offset {self.pos}.")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # a number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Iterate over the keys of an object, leaving the stream positioned at each value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("}")
+            return
+
+    def elements(self) -> Iterator[None]:
+        """Iterate over the elements of an array, leaving the stream positioned at each element."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def _iter_account(stream: _JSONStream, game: str, banner_name: str) -> Iterator[UIGFEntry]:
+    uid, lang = 0, ""
+    for key in stream.members():
+        if key == "list":
+            for _ in stream.elements():
+                item = stream.value()
+                yield UIGFEntry(game, uid or int(item["uid"]), lang, uigf_item_to_wish(item, game, uid, banner_name))
+        elif key == "uid":
+            uid = int(stream.value())
+        elif key == "lang":
+            lang = stream.value()
+        else:
+            stream.value()
+
+
+def iter_uigf(fp: IO[str], banner_name: str = "") -> Iterator[UIGFEntry]:
+    """Read the wishes of a UIGF document one at a time.
+
+    Account fields placed after the `list` of an account are not taken into account, the
+    user ID then falls back to the one of each record, which UIGF writers always emit.
+
+    Args:
+        fp (IO[str]): The text stream to read the document from.
+        banner_name (str, optional): The banner name to use for Genshin wishes.
+
+    Yields:
+        UIGFEntry: The wishes with the account they belong to.
+
+    Raises:
+        ValueError: If the document is malformed.
+    """
+    stream = _JSONStream(fp)
+    legacy_game, legacy_uid, legacy_lang = "hk4e", 0, ""
+    for key in stream.members():
+        if key in UIGF_GAMES:
+            for _ in stream.elements():
+                yield from _iter_account(stream, key, banner_name)
+        elif key == "info":
+            info = stream.value()
+            if "srgf_version" in info:
+                legacy_game = "hkrpg"
+            legacy_uid = int(info.get("uid") or 0)
+            legacy_lang = info.get("lang", "")
+        elif key == "list":
+            for _ in stream.elements():
+                item = stream.value()
+                uid = legacy_uid or int(item["uid"])
+                yield UIGFEntry(legacy_game, uid, legacy_lang, uigf_item_to_wish(item, legacy_game, uid, banner_name))
+        else:
+            stream.value()
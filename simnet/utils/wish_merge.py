@@ -0,0 +1,69 @@
+"""Merging of wish histories fetched from several sources."""
+
+import heapq
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+__all__ = ("merge_wishes",)
+
+W = TypeVar("W", bound=BaseModel)
+
+EMPTY_VALUES: tuple[Any, ...] = (None, 0, "")
+"""Field values considered missing, which may be filled from a source of lower precedence."""
+
+
+def _fill_missing(wish: W, other: W) -> W:
+    """Fill the missing fields of a wish with the values of the same wish from another source."""
+    update = {}
+    for name in type(wish).model_fields:
+        value = getattr(wish, name)
+        if isinstance(value, bool) or value not in EMPTY_VALUES:
+            continue
+        other_value = getattr(other, name, None)
+        if other_value not in EMPTY_VALUES:
+            update[name] = other_value
+    return wish.model_copy(update=update) if update else wish
+
+
+def _keyed(precedence: int, source: Iterable[W]) -> Iterator[tuple[tuple[int, int], W]]:
+    for wish in source:
+        yield (wish.id, precedence), wish
+
+
+def merge_wishes(*sources: Iterable[W]) -> list[W]:
+    """Merge several wish histories into one, without duplicates.
+
+    Each source must be sorted by ID. Wish IDs grow with time, so this is the chronological
+    order, and unlike the times it does not depend on the time zone of the source. Sources are
+    merged in a single pass and wishes are deduplicated by ID through a hash index. When a
+    wish is present in several sources, the source given first takes precedence and its
+    missing fields (e.g. the banner ID of ZZZ wishes fetched from HoYoLAB) are filled from
+    the other sources.
+
+    Args:
+        *sources (Iterable[W]): The wish histories, from the highest to the lowest precedence.
+
+    Returns:
+        List[W]: The merged wish history, sorted by ID.
+    """
+    merged: list[W] = []
+    index: dict[int, tuple[int, int]] = {}
+    for (wish_id, precedence), wish in heapq.merge(
+        *(_keyed(precedence, source) for precedence, source in enumerate(sources)),
+        key=lambda pair: pair[0],
+    ):
+        entry = index.get(wish_id)
+        if entry is None:
+            index[wish_id] = (len(merged), precedence)
+            merged.append(wish)
+            continue
+        position, current_precedence = entry
+        current = merged[position]
+        if precedence < current_precedence:
+            index[wish_id] = (position, precedence)
+            merged[position] = _fill_missing(wish, current)
+        else:
+            merged[position] = _fill_missing(current, wish)
+    return merged
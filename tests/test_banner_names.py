@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from simnet.client.components.wish.base import BaseWishClient
+from simnet.errors import InvalidAuthkey
+from simnet.utils.cache import MemoryCache
+from simnet.utils.enums import Game
+
+
+class FakeWishClient(BaseWishClient):
+    banner_names_cache = MemoryCache()
+
+    def __init__(self, authkey: str):
+        super().__init__()
+        self.calls = 0
+        self.valid = authkey == "valid"
+
+    async def request_gacha_info(self, endpoint, game, lang=None, authkey=None, params=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if not self.valid:
+            raise InvalidAuthkey({"retcode": -100})
+        return {"gacha_type_list": [{"key": "301", "name": "Character Event Wish"}]}
+
+
+class TestBannerNames:
+    @staticmethod
+    async def test_failed_authkey_is_not_shared():
+        expired, valid = FakeWishClient("expired"), FakeWishClient("valid")
+        leader = asyncio.create_task(expired.get_banner_names(Game.GENSHIN))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(valid.get_banner_names(Game.GENSHIN))
+        with pytest.raises(InvalidAuthkey):
+            await leader
+        assert await waiter == {301: "Character Event Wish"}
+        assert (expired.calls, valid.calls) == (1, 1)
+        assert await FakeWishClient("valid").get_banner_names(Game.GENSHIN) == {301: "Character Event Wish"}
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from simnet.utils.cache import MemoryCache
+
+
+class TestMemoryCache:
+    @staticmethod
+    async def test_expiry_and_eviction():
+        cache = MemoryCache(maxsize=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2, ttl=-1)
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        await cache.set("d", 4)
+        assert await cache.get("a") is None
+        assert len(cache) == 2
+
+    @staticmethod
+    async def test_callable_ttl():
+        cache = MemoryCache()
+        assert await cache.get_or_set("key", lambda: asyncio.sleep(0, "value"), ttl=lambda value: -1) == "value"
+        assert await cache.get("key") is None
+
+
+class TestGetOrSet:
+    @staticmethod
+    async def test_single_flight():
+        cache = MemoryCache()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(cache.get_or_set("key", factory) for _ in range(5)))
+        assert results == [1] * 5
+        assert calls == 1
+        assert await cache.get_or_set("key", factory) == 1
+
+    @staticmethod
+    async def test_error_is_shared_and_not_cached():
+        cache = MemoryCache()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("failed")
+
+        results = await asyncio.gather(*(cache.get_or_set("key", factory) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert calls == 1
+        with pytest.raises(RuntimeError, match="failed"):
+            await cache.get_or_set("key", factory)
+        assert calls == 2
+
+    @staticmethod
+    async def test_unshared_error_hands_over():
+        cache = MemoryCache()
+        calls = []
+
+        def factory(name):
+            async def produce():
+                calls.append(name)
+                await asyncio.sleep(0.01)
+                if name == "expired":
+                    raise RuntimeError("expired")
+                return name
+
+            return produce
+
+        leader = asyncio.create_task(cache.get_or_set("key", factory("expired"), share_errors=False))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_set("key", factory("valid"), share_errors=False)) for _ in range(3)]
+        with pytest.raises(RuntimeError, match="expired"):
+            await leader
+        assert await asyncio.gather(*waiters) == ["valid"] * 3
+        assert calls == ["expired", "valid"]
+
+    @staticmethod
+    async def test_cancelled_leader_hands_over():
+        cache = MemoryCache()
+        started = asyncio.Event()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.01)
+            return calls
+
+        leader = asyncio.create_task(cache.get_or_set("key", factory))
+        await started.wait()
+        waiters = [asyncio.create_task(cache.get_or_set("key", factory)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await asyncio.gather(*waiters) == [2, 2, 2]
+        assert calls == 2
+
+    @staticmethod
+    async def test_cancelled_waiter_does_not_cancel_leader():
+        cache = MemoryCache()
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert await leader == "value"
@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+from simnet.utils.catalogue import CATALOGUE_VERSION, CalculatorCatalogue, CatalogueEntry
+
+ITEMS = [
+    {"id": 1, "element_attr_id": 1, "weapon_cat_id": 1},
+    {"id": 2, "element_attr_id": 2, "weapon_cat_id": 1},
+    {"id": 3, "element_attr_id": 1, "weapon_cat_id": 10},
+]
+KEY = ("genshin", "os", "en-us", "avatar", False)
+
+
+class FakeEndpoint:
+    def __init__(self, items=None):
+        self.items = ITEMS if items is None else items
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return [dict(item) for item in self.items]
+
+
+class TestCatalogueEntry:
+    @staticmethod
+    def test_filter_and_index():
+        entry = CatalogueEntry(ITEMS, 0)
+        assert entry.by_id[2] is ITEMS[1]
+        assert [item["id"] for item in entry.index("element_attr_id")["1"]] == [1, 3]
+        assert entry.filter(element_attr_id=[1], weapon_cat_id=[1]) == [ITEMS[0]]
+        assert entry.filter(element_attr_id=[1, 2], weapon_cat_id=None) == ITEMS
+        assert entry.filter(weapon_cat_id=[]) == ITEMS
+
+
+class TestCalculatorCatalogue:
+    @staticmethod
+    async def test_single_fetch():
+        catalogue = CalculatorCatalogue()
+        endpoint = FakeEndpoint()
+        entries = await asyncio.gather(*(catalogue.get(KEY, endpoint) for _ in range(5)))
+        assert endpoint.calls == 1
+        assert all(entry is entries[0] for entry in entries)
+        assert not catalogue._locks
+        assert not catalogue._waiters
+
+    @staticmethod
+    async def test_revalidation():
+        catalogue = CalculatorCatalogue(ttl=0)
+        endpoint = FakeEndpoint()
+        entry = await catalogue.get(KEY, endpoint)
+        entry.index("element_attr_id")
+        fetched_at = entry.fetched_at
+        assert await catalogue.get(KEY, endpoint) is entry
+        assert endpoint.calls == 2
+        assert entry.fetched_at >= fetched_at
+        assert "element_attr_id" in entry._indexes
+
+        endpoint.items = ITEMS[:2]
+        changed = await catalogue.get(KEY, endpoint)
+        assert changed is not entry
+        assert len(changed) == 2
+
+    @staticmethod
+    async def test_persistence(tmp_path):
+        endpoint = FakeEndpoint()
+        entry = await CalculatorCatalogue(tmp_path).get(KEY, endpoint)
+        assert [file.name for file in tmp_path.iterdir()] == ["calculator_genshin_os_en-us_avatar_False.json"]
+
+        loaded = await CalculatorCatalogue(tmp_path).get(KEY, endpoint)
+        assert endpoint.calls == 1
+        assert loaded.items == entry.items
+        assert loaded.digest == entry.digest
+
+        catalogue = CalculatorCatalogue(tmp_path)
+        await catalogue.invalidate(KEY)
+        assert not list(tmp_path.iterdir())
+        await catalogue.get(KEY, endpoint)
+        assert endpoint.calls == 2
+
+    @staticmethod
+    async def test_broken_files_are_misses(tmp_path):
+        catalogue = CalculatorCatalogue(tmp_path)
+        file = catalogue._file(KEY)
+        endpoint = FakeEndpoint()
+        for content in ("{", json.dumps([]), json.dumps({"version": CATALOGUE_VERSION, "items": ITEMS})):
+            file.write_text(content, encoding="utf-8")
+            catalogue._entries.clear()
+            assert (await catalogue.get(KEY, endpoint)).items == ITEMS
+        assert endpoint.calls == 3
@@ -0,0 +1,75 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from simnet.utils.changes import ChangeTracker, FieldChanged, NewRecord, ThresholdCrossed
+
+
+class Expedition(BaseModel):
+    status: str
+    remaining_time: int = 0
+
+
+class FakeNotes(BaseModel):
+    current_resin: int
+    season: Optional[int] = None
+    expeditions: list[Expedition] = []
+
+
+class TestChangeTracker:
+    @staticmethod
+    def test_first_snapshot_emits_nothing():
+        tracker = ChangeTracker(fields=["current_resin"])
+        assert tracker.diff("account", FakeNotes(current_resin=10)) == []
+        assert tracker.snapshot("account") == {"current_resin": 10}
+
+    @staticmethod
+    def test_field_changes_and_thresholds():
+        tracker = ChangeTracker(fields=["expeditions.*.status"], thresholds={"current_resin": [100, 160]})
+        tracker.diff("account", FakeNotes(current_resin=90, expeditions=[Expedition(status="Ongoing")]))
+        events = tracker.diff(
+            "account", FakeNotes(current_resin=170, expeditions=[Expedition(status="Finished", remaining_time=5)])
+        )
+        assert events == [
+            FieldChanged("account", "current_resin", 90, 170),
+            ThresholdCrossed("account", "current_resin", 100, 90, 170),
+            ThresholdCrossed("account", "current_resin", 160, 90, 170),
+            FieldChanged("account", "expeditions.0.status", "Ongoing", "Finished"),
+        ]
+        assert events[1].rising
+
+        (changed, crossed) = tracker.diff(
+            "account", FakeNotes(current_resin=150, expeditions=[Expedition(status="Finished")])
+        )
+        assert changed.path == "current_resin"
+        assert crossed == ThresholdCrossed("account", "current_resin", 160, 170, 150)
+        assert not crossed.rising
+
+    @staticmethod
+    def test_new_records():
+        tracker = ChangeTracker(fields=[], records=["season"])
+        first = FakeNotes(current_resin=0, season=1)
+        assert tracker.diff("account", first) == [NewRecord("account", "season", None, 1, first)]
+        assert tracker.diff("account", FakeNotes(current_resin=10, season=1)) == []
+        second = FakeNotes(current_resin=0, season=2)
+        assert tracker.diff("account", second) == [NewRecord("account", "season", 1, 2, second)]
+
+    @staticmethod
+    def test_accounts_are_independent():
+        tracker = ChangeTracker(fields=["current_resin"])
+        tracker.diff(1, FakeNotes(current_resin=10))
+        tracker.diff(2, FakeNotes(current_resin=20))
+        assert tracker.diff(1, FakeNotes(current_resin=20)) == [FieldChanged(1, "current_resin", 10, 20)]
+        tracker.forget(2)
+        assert tracker.diff(2, FakeNotes(current_resin=30)) == []
+        tracker.restore(2, {"current_resin": 0})
+        assert tracker.diff(2, FakeNotes(current_resin=30)) == [FieldChanged(2, "current_resin", 0, 30)]
+
+    @staticmethod
+    async def test_queue():
+        tracker = ChangeTracker(fields=["current_resin"])
+        await tracker.update("account", FakeNotes(current_resin=10))
+        events = await tracker.update("account", FakeNotes(current_resin=20))
+        iterator = tracker.events()
+        assert [await iterator.__anext__()] == events
+        await iterator.aclose()
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Optional
+
+from simnet.errors import AlreadyClaimed, GeetestTriggered, VisitsTooFrequently
+from simnet.utils.checkin import CheckInScheduler, CheckInTask
+from simnet.utils.enums import Game, Region
+
+
+class FakeClient:
+    region = Region.OVERSEAS
+    game = Game.GENSHIN
+
+    def __init__(self, player_id: int, error: Optional[BaseException] = None):
+        self.player_id = player_id
+        self.error = error
+        self.calls = 0
+
+    async def claim_daily_reward(self, *, game=None, player_id=None, reward=True):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+
+
+class TestCheckInScheduler:
+    @staticmethod
+    async def test_metrics():
+        clients = [
+            FakeClient(1),
+            FakeClient(2, AlreadyClaimed({"retcode": -5003})),
+            FakeClient(3, GeetestTriggered("gt", "challenge")),
+            FakeClient(4, VisitsTooFrequently({"retcode": -110})),
+            FakeClient(5, KeyError("data")),
+        ]
+        results = []
+        scheduler = CheckInScheduler(concurrency=2, on_result=lambda task, result: results.append(result))
+        metrics = await scheduler.run(CheckInTask(client) for client in clients)
+        assert (metrics.scheduled, metrics.claimed, metrics.already_claimed) == (5, 1, 1)
+        assert (metrics.parked, metrics.failed, metrics.in_flight) == (1, 2, 0)
+        assert [client.calls for client in clients] == [1] * 5
+        assert sorted(result.player_id for result in results if result.claimed) == [1]
+        assert scheduler.pop_parked() == [CheckInTask(clients[2])]
+        assert scheduler.parked == []
+
+    @staticmethod
+    async def test_failing_callback_does_not_stop_the_run():
+        def on_progress(metrics):
+            raise RuntimeError("callback")
+
+        scheduler = CheckInScheduler(on_progress=on_progress)
+        metrics = await scheduler.run([CheckInTask(FakeClient(1)), CheckInTask(FakeClient(2))])
+        assert (metrics.claimed, metrics.failed) == (2, 0)
+
+    @staticmethod
+    async def test_concurrency_limit():
+        running = peak = 0
+
+        class SlowClient(FakeClient):
+            async def claim_daily_reward(self, **kwargs):
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        metrics = await CheckInScheduler(concurrency=3).run([CheckInTask(SlowClient(i)) for i in range(10)])
+        assert metrics.claimed == 10
+        assert peak == 3
+
+    @staticmethod
+    async def test_window_spreads_starts():
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        class TimedClient(FakeClient):
+            async def claim_daily_reward(self, **kwargs):
+                starts.append(loop.time())
+
+        await CheckInScheduler(window=0.1).run([CheckInTask(TimedClient(i)) for i in range(4)])
+        assert starts[-1] - starts[0] >= 0.07
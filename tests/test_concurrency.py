@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from simnet.utils.concurrency import iter_chunked, merge_async_iterators, merge_sorted_async_iterators
+
+
+async def numbers(start: int, count: int, delay: float = 0):
+    for number in range(start, start + count):
+        await asyncio.sleep(delay)
+        yield number
+
+
+class TestMergeAsyncIterators:
+    @staticmethod
+    async def test_merges_every_item():
+        items = [item async for item in merge_async_iterators([numbers(0, 5), numbers(10, 5), numbers(20, 5)], 2)]
+        assert sorted(items) == [*range(5), *range(10, 15), *range(20, 25)]
+
+    @staticmethod
+    async def test_concurrency_limit():
+        running = peak = 0
+
+        async def tracked(start: int):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            async for number in numbers(start, 3, 0.001):
+                yield number
+            running -= 1
+
+        items = [item async for item in merge_async_iterators([tracked(index * 10) for index in range(5)], 2)]
+        assert len(items) == 15
+        assert peak == 2
+
+    @staticmethod
+    async def test_error_cancels_the_others():
+        async def failing():
+            yield 1
+            raise RuntimeError("failed")
+
+        slow = numbers(100, 100, 0.01)
+        with pytest.raises(RuntimeError, match="failed"):
+            async for _ in merge_async_iterators([failing(), slow]):
+                pass
+        assert slow.ag_frame is None
+
+    @staticmethod
+    async def test_early_exit_closes_the_iterators():
+        iterators = [numbers(0, 100, 0.001), numbers(100, 100, 0.001)]
+        merged = merge_async_iterators(iterators)
+        await merged.__anext__()
+        await merged.aclose()
+        assert all(iterator.ag_frame is None for iterator in iterators)
+
+
+class TestMergeSortedAsyncIterators:
+    @staticmethod
+    async def test_sorted_output():
+        async def values(items, delay):
+            for item in items:
+                await asyncio.sleep(delay)
+                yield item
+
+        iterators = [values([9, 6, 3], 0.003), values([8, 7, 2, 1], 0), values([], 0), values([6, 5], 0.001)]
+        merged = [item async for item in merge_sorted_async_iterators(iterators, reverse=True)]
+        assert merged == [9, 8, 7, 6, 6, 5, 3, 2, 1]
+
+    @staticmethod
+    async def test_key_and_error():
+        async def failing():
+            yield {"time": 1}
+            raise RuntimeError("failed")
+
+        slow = numbers(100, 100, 0.01)
+        merged = merge_sorted_async_iterators(
+            [failing(), slow], key=lambda item: item["time"] if isinstance(item, dict) else item
+        )
+        assert await merged.__anext__() == {"time": 1}
+        with pytest.raises(RuntimeError, match="failed"):
+            await merged.__anext__()
+        assert slow.ag_frame is None
+
+
+class TestIterChunked:
+    @staticmethod
+    async def test_results_in_order():
+        async def fetch(chunk):
+            await asyncio.sleep(0.001 * (10 - chunk[0]))
+            return sum(chunk)
+
+        results = [result async for result in iter_chunked(list(range(10)), fetch, chunk_size=3, concurrency=2)]
+        assert results == [3, 12, 21, 9]
+
+    @staticmethod
+    async def test_error_cancels_remaining_chunks():
+        fetched = []
+
+        async def fetch(chunk):
+            if chunk == [2]:
+                raise RuntimeError("failed")
+            await asyncio.sleep(0.01 * chunk[0])
+            fetched.append(chunk[0])
+            return chunk[0]
+
+        results = []
+        iterator = iter_chunked(list(range(10)), fetch, chunk_size=1, concurrency=3)
+        results.extend([await iterator.__anext__(), await iterator.__anext__()])
+        with pytest.raises(RuntimeError, match="failed"):
+            await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        assert results == [0, 1]
+        assert max(fetched) < 5
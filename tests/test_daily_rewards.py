@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+from simnet.client.components.daily import DailyRewardClient
+from simnet.errors import AlreadyClaimed
+from simnet.utils.enums import Game, Region
+
+
+class FakeDailyClient(DailyRewardClient):
+    def __init__(self, region: Region, errors):
+        super().__init__(region=region)
+        self.errors = errors
+        self.accounts = [
+            SimpleNamespace(game=Game.GENSHIN, uid=800000001),
+            SimpleNamespace(game=Game.GENSHIN, uid=800000002),
+            SimpleNamespace(game=Game.STARRAIL, uid=800000003),
+            SimpleNamespace(game=Game.ZZZ, uid=1300000001),
+            SimpleNamespace(game=Game.HONKAI, uid=100000001),
+        ]
+
+    async def get_game_accounts(self, *, lang=None):
+        return self.accounts
+
+    async def claim_daily_reward(self, *, game=None, lang=None, reward=True, player_id=None, **kwargs):
+        error = self.errors.get(game)
+        if error is not None:
+            raise error
+        return f"{game.value} reward"
+
+
+class TestClaimDailyRewards:
+    @staticmethod
+    async def test_errors_are_kept_per_game():
+        errors = {Game.STARRAIL: AlreadyClaimed({"retcode": -5003}), Game.ZZZ: KeyError("award")}
+        results = await FakeDailyClient(Region.OVERSEAS, errors).claim_daily_rewards()
+        assert [(result.game, result.player_id) for result in results] == [
+            (Game.GENSHIN, 800000001),
+            (Game.STARRAIL, 800000003),
+            (Game.ZZZ, 1300000001),
+        ]
+        genshin, starrail, zzz = results
+        assert genshin.claimed
+        assert genshin.reward == "genshin reward"
+        assert starrail.already_claimed
+        assert isinstance(zzz.error, KeyError)
+        assert not zzz.claimed
+
+    @staticmethod
+    async def test_every_chinese_player_is_claimed():
+        results = await FakeDailyClient(Region.CHINESE, {}).claim_daily_rewards(games=(Game.GENSHIN,))
+        assert [result.player_id for result in results] == [800000001, 800000002]
+        assert all(result.claimed for result in results)
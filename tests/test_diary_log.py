@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from simnet.client.components.diary.base import BaseDiaryClient
+from simnet.models.genshin.diary import DiaryPage
+from simnet.utils.enums import Game
+
+START = datetime(2024, 3, 1)
+
+
+class FakeDiaryClient(BaseDiaryClient):
+    def __init__(self, actions):
+        super().__init__(player_id=800000001)
+        self.actions = actions
+        self.running = self.peak = 0
+
+    async def _get_diary_page(self, page, *, game=None, player_id=None, diary_type=1, month=None, lang=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.001 * diary_type)
+        self.running -= 1
+        actions = self.actions.get((diary_type, month), [])[(page - 1) * 100 : page * 100]
+        return DiaryPage.model_validate({"uid": 800000001, "region": "os_asia", "data_month": 3, "list": actions})
+
+
+def make_actions(diary_type, minutes):
+    return [
+        {"action_id": diary_type, "action": "", "time": str(START - timedelta(minutes=minute)), "num": 1}
+        for minute in minutes
+    ]
+
+
+class TestDiaryLog:
+    @staticmethod
+    async def test_actions_in_time_order():
+        client = FakeDiaryClient(
+            {
+                (1, 3): make_actions(1, range(0, 300, 2)),
+                (2, 3): make_actions(2, range(1, 250, 2)),
+                (1, 2): make_actions(1, range(1000, 1020)),
+            }
+        )
+        actions = [
+            action
+            async for action in client.diary_log(game=Game.GENSHIN, diary_types=(1, 2), months=(3, 2), concurrency=2)
+        ]
+        assert len(actions) == 150 + 125 + 20
+        times = [action.time for action in actions]
+        assert times == sorted(times, reverse=True)
+        assert client.peak <= 2
@@ -0,0 +1,35 @@
+from urllib.parse import unquote
+
+import httpx
+import pytest
+
+from simnet.utils.ds import dynamic_secret_query
+
+
+def encoded_query(params) -> str:
+    query = httpx.Request("GET", "https://example.com/", params=params).url.query.decode()
+    return "&".join(sorted(unquote(query).split("&"), key=lambda item: item.split("=", 1)[0]))
+
+
+class TestDynamicSecretQuery:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"server": "prod_gf_cn", "role_id": 100000001},
+            {"need_wiki": "true", "id_list[]": 1001},
+            {"need_wiki": "true", "id_list[]": [1001, 1002, 1003], "role_id": 100000001},
+            {"need_wiki": True, "lang": None},
+        ],
+    )
+    def test_signed_query_matches_url(params):
+        assert dynamic_secret_query(params) == encoded_query(params)
+
+    @staticmethod
+    def test_values_are_formatted_like_httpx():
+        assert dynamic_secret_query({"need_wiki": True, "lang": None}) == "lang=&need_wiki=true"
+
+    @staticmethod
+    def test_empty():
+        assert dynamic_secret_query(None) == ""
+        assert dynamic_secret_query({}) == ""
@@ -0,0 +1,74 @@
+from simnet.client.components.chronicle.base import BaseChronicleClient
+from simnet.utils.cache import MemoryCache
+from simnet.utils.enums import Game
+
+PLAYER_ID = 800000001
+
+
+class FakeChronicleClient(BaseChronicleClient):
+    def __init__(self, account_id=1):
+        super().__init__(account_id=account_id, player_id=PLAYER_ID)
+
+
+class FakeEndpoint:
+    def __init__(self, seasons):
+        self.seasons = list(seasons)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return {"schedule_id": self.seasons[min(self.calls, len(self.seasons)) - 1], "call": self.calls}
+
+
+async def previous_season(client, endpoint, player_id=PLAYER_ID):
+    return await client._get_previous_season(
+        Game.GENSHIN, "spiralAbyss", player_id, ("en-us",), endpoint, lambda value: value["schedule_id"]
+    )
+
+
+class TestEndgameArchive:
+    @staticmethod
+    async def test_disabled_by_default():
+        endpoint = FakeEndpoint([10])
+        client = FakeChronicleClient()
+        await previous_season(client, endpoint)
+        await previous_season(client, endpoint)
+        assert endpoint.calls == 2
+
+    @staticmethod
+    async def test_archived_per_account(monkeypatch):
+        monkeypatch.setattr(BaseChronicleClient, "endgame_archive", MemoryCache())
+        endpoint = FakeEndpoint([10])
+        owner = FakeChronicleClient(1)
+        assert await previous_season(owner, endpoint) == {"schedule_id": 10, "call": 1}
+        assert await previous_season(owner, endpoint) == {"schedule_id": 10, "call": 1}
+        assert endpoint.calls == 1
+        assert await previous_season(FakeChronicleClient(2), endpoint) == {"schedule_id": 10, "call": 2}
+        await previous_season(FakeChronicleClient(None), endpoint)
+        await previous_season(owner, endpoint, None)
+        assert endpoint.calls == 4
+
+    @staticmethod
+    async def test_empty_seasons_are_not_archived(monkeypatch):
+        archive = MemoryCache()
+        monkeypatch.setattr(BaseChronicleClient, "endgame_archive", archive)
+        for season_id in (0, (), (0, 10)):
+            endpoint = FakeEndpoint([season_id])
+            client = FakeChronicleClient()
+            await previous_season(client, endpoint)
+            assert await previous_season(client, endpoint) == {"schedule_id": season_id, "call": 2}
+            # only the pointer to the previous season is kept, it points to no archived season
+            assert len(archive) == 1
+            await archive.clear()
+
+    @staticmethod
+    async def test_evicted_results_are_requested_again(monkeypatch):
+        archive = MemoryCache()
+        monkeypatch.setattr(BaseChronicleClient, "endgame_archive", archive)
+        endpoint = FakeEndpoint([10, 11])
+        client = FakeChronicleClient()
+        await previous_season(client, endpoint)
+        await archive.delete((Game.GENSHIN, "spiralAbyss", 1, PLAYER_ID, 10, "en-us"))
+        assert await previous_season(client, endpoint) == {"schedule_id": 11, "call": 2}
+        assert await previous_season(client, endpoint) == {"schedule_id": 11, "call": 2}
+        assert endpoint.calls == 2
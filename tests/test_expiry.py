@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from simnet.utils.enums import Game
+from simnet.utils.expiry import DailyResetExpiry, ScheduleExpiry, next_daily_reset, schedule_bounds
+from simnet.utils.player import recognize_server_timezone
+
+ASIA = timezone(timedelta(hours=8))
+PLAYER_IDS = {
+    Game.GENSHIN: [100000001, 200000001, 300000001, 500000001, 600000001, 700000001, 800000001, 900000001, 1800000001],
+    Game.STARRAIL: [100000001, 200000001, 500000001, 600000001, 700000001, 800000001, 900000001],
+    Game.ZZZ: [10000001, 1000000001, 1300000001, 1500000001, 1700000001],
+}
+
+
+class TestServerTimezone:
+    @staticmethod
+    @pytest.mark.parametrize(("game", "player_id"), [(game, uid) for game, uids in PLAYER_IDS.items() for uid in uids])
+    def test_every_server_has_a_timezone(game, player_id):
+        assert isinstance(recognize_server_timezone(player_id, game), timezone)
+
+    @staticmethod
+    def test_offsets():
+        assert recognize_server_timezone(600000001, Game.GENSHIN) == timezone(timedelta(hours=-5))
+        assert recognize_server_timezone(1500000001, Game.ZZZ) == timezone(timedelta(hours=1))
+
+    @staticmethod
+    def test_unknown_server():
+        with pytest.raises(ValueError, match="server"):
+            recognize_server_timezone(400000001, Game.GENSHIN)
+
+
+class TestNextDailyReset:
+    @staticmethod
+    def test_before_and_after_the_reset():
+        before = datetime(2024, 1, 1, 3, 0, tzinfo=ASIA)
+        assert next_daily_reset(800000001, Game.GENSHIN, before) == datetime(2024, 1, 1, 4, tzinfo=ASIA)
+        after = datetime(2024, 1, 1, 4, 0, tzinfo=ASIA)
+        assert next_daily_reset(800000001, Game.GENSHIN, after) == datetime(2024, 1, 2, 4, tzinfo=ASIA)
+
+    @staticmethod
+    def test_server_time_zone():
+        now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        reset = next_daily_reset(600000001, Game.GENSHIN, now)
+        assert reset == datetime(2024, 1, 2, 9, tzinfo=timezone.utc)
+
+    @staticmethod
+    def test_expiry_ttl():
+        ttl = DailyResetExpiry(800000001, Game.GENSHIN)(None)
+        assert 0 < ttl <= 24 * 60 * 60
+
+
+class TestScheduleExpiry:
+    @staticmethod
+    def test_schedule_bounds():
+        start, end = datetime(2024, 1, 1, tzinfo=ASIA), datetime(2024, 1, 16, tzinfo=ASIA)
+        season = SimpleNamespace(start_time=start, end_time=end)
+        assert schedule_bounds(season) == [start, end]
+        assert schedule_bounds(SimpleNamespace(data=[season, season])) == [start, end, start, end]
+        assert schedule_bounds(SimpleNamespace(schedule=season)) == [start, end]
+
+    @staticmethod
+    def test_boundary_before_the_reset():
+        now = datetime(2024, 1, 15, 23, 0, tzinfo=ASIA)
+        end = datetime(2024, 1, 16, 0, 0, tzinfo=ASIA)
+        season = SimpleNamespace(start_time=datetime(2024, 1, 1, tzinfo=ASIA), end_time=end)
+        expiry = ScheduleExpiry(800000001, Game.GENSHIN)
+        assert expiry.expires_at(season, now) == end
+        assert expiry.expires_at(season, end) == datetime(2024, 1, 16, 4, tzinfo=ASIA)
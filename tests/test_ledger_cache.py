@@ -0,0 +1,35 @@
+from simnet.client.components.diary.base import BaseDiaryClient
+from simnet.utils.cache import MemoryCache
+from simnet.utils.enums import Game
+
+
+class FakeLedgerClient(BaseDiaryClient):
+    def __init__(self, account_id=None):
+        super().__init__(account_id=account_id, player_id=800000001)
+        self.calls = []
+
+    async def request_lab(self, url, *, params=None, **kwargs):
+        self.calls.append(dict(params))
+        return {"account": self.account_id, "month": params["month"]}
+
+
+class TestLedgerCache:
+    @staticmethod
+    async def test_disabled_by_default():
+        client = FakeLedgerClient(1)
+        await client.request_ledger(game=Game.GENSHIN, month=1)
+        await client.request_ledger(game=Game.GENSHIN, month=1)
+        assert len(client.calls) == 2
+
+    @staticmethod
+    async def test_keyed_by_account(monkeypatch):
+        monkeypatch.setattr(BaseDiaryClient, "diary_cache", MemoryCache())
+        owner, other, anonymous = FakeLedgerClient(1), FakeLedgerClient(2), FakeLedgerClient()
+        assert await owner.request_ledger(game=Game.STARRAIL, month="202401") == {"account": 1, "month": "202401"}
+        assert await owner.request_ledger(game=Game.STARRAIL, month="202401") == {"account": 1, "month": "202401"}
+        assert len(owner.calls) == 1
+        assert await other.request_ledger(game=Game.STARRAIL, month="202401") == {"account": 2, "month": "202401"}
+        assert len(other.calls) == 1
+        await anonymous.request_ledger(game=Game.STARRAIL, month="202401")
+        await anonymous.request_ledger(game=Game.STARRAIL, month="202401")
+        assert len(anonymous.calls) == 2
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+from simnet.errors import DataNotPublic
+from simnet.models.zzz.chronicle.notes import ZZZNote
+from simnet.utils.enums import Game
+from simnet.utils.notes_poller import NotesPollTask, fetch_notes_summary, poll_notes
+
+
+def zzz_note(current: int) -> ZZZNote:
+    energy = SimpleNamespace(progress=SimpleNamespace(current=current, max=240), restore=timedelta(0))
+    return ZZZNote.model_construct(energy=energy, vitality=SimpleNamespace(current=0, max=400))
+
+
+class FakeZZZClient:
+    game = Game.ZZZ
+
+    def __init__(self, player_id, *, stoken=True, widget_error=None, notes_error=None):
+        self.player_id = player_id
+        self.cookies = {"stoken": "stoken"} if stoken else {}
+        self.widget_error = widget_error
+        self.notes_error = notes_error
+        self.calls = []
+
+    async def get_zzz_notes_by_stoken(self, lang=None):
+        self.calls.append("widget")
+        await asyncio.sleep(0)
+        if self.widget_error is not None:
+            raise self.widget_error
+        return zzz_note(100)
+
+    async def get_zzz_notes(self, player_id=None, lang=None):
+        self.calls.append("notes")
+        await asyncio.sleep(0)
+        if self.notes_error is not None:
+            raise self.notes_error
+        return zzz_note(200)
+
+
+class TestFetchNotesSummary:
+    @staticmethod
+    async def test_widget_then_notes():
+        client = FakeZZZClient(1300000001)
+        summary = await fetch_notes_summary(client)
+        assert (summary.source, summary.player_id, summary.current_stamina) == ("widget", 1300000001, 100)
+        assert client.calls == ["widget"]
+
+        for client in (
+            FakeZZZClient(1300000001, stoken=False),
+            FakeZZZClient(1300000001, widget_error=DataNotPublic({"retcode": 10102})),
+            FakeZZZClient(1300000001, widget_error=KeyError("data")),
+        ):
+            summary = await fetch_notes_summary(client)
+            assert (summary.source, summary.current_stamina) == ("notes", 200)
+
+        client = FakeZZZClient(1300000001)
+        summary = await fetch_notes_summary(client, 1300000002)
+        assert (summary.source, summary.player_id) == ("notes", 1300000002)
+        assert client.calls == ["notes"]
+
+
+class TestPollNotes:
+    @staticmethod
+    async def test_failures_are_isolated():
+        clients = [
+            FakeZZZClient(1300000001),
+            FakeZZZClient(1300000002, stoken=False, notes_error=DataNotPublic({"retcode": 10102})),
+            FakeZZZClient(1300000003, stoken=False, notes_error=KeyError("energy")),
+            FakeZZZClient(1300000004, stoken=False),
+        ]
+        seen = []
+
+        def on_result(result):
+            seen.append(result.player_id)
+            if result.player_id == 1300000001:
+                raise RuntimeError("callback")
+
+        tasks = [*clients[:3], NotesPollTask(clients[3], 1300000005)]
+        results = await poll_notes(tasks, concurrency=2, on_result=on_result)
+        assert [result.player_id for result in results] == [1300000001, 1300000002, 1300000003, 1300000005]
+        assert [result.ok for result in results] == [True, False, False, True]
+        assert isinstance(results[1].error, DataNotPublic)
+        assert isinstance(results[2].error, KeyError)
+        assert sorted(seen) == [1300000001, 1300000002, 1300000003, 1300000005]
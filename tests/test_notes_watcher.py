@@ -0,0 +1,123 @@
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+from simnet.errors import DataNotPublic
+from simnet.models.zzz.chronicle.notes import ZZZNote
+from simnet.utils.notes_watcher import NotesWatcher, next_notes_event
+
+
+def zzz_note(restore: timedelta) -> ZZZNote:
+    return ZZZNote.model_construct(energy=SimpleNamespace(restore=restore))
+
+
+class TestNextInterval:
+    @staticmethod
+    def test_next_notes_event():
+        assert next_notes_event(zzz_note(timedelta(minutes=30))) == timedelta(minutes=30)
+        assert next_notes_event(zzz_note(timedelta(0))) is None
+
+    @staticmethod
+    def test_bounds():
+        watcher = NotesWatcher(min_interval=60, max_interval=3600, margin=5)
+        assert watcher.next_interval(zzz_note(timedelta(minutes=30))) == 1805
+        assert watcher.next_interval(zzz_note(timedelta(seconds=10))) == 60
+        assert watcher.next_interval(zzz_note(timedelta(hours=5))) == 3600
+        assert watcher.next_interval(zzz_note(timedelta(0))) == 3600
+
+
+class TestNotesWatcher:
+    @staticmethod
+    async def test_polls_are_scheduled_from_the_notes():
+        polls = {"fast": 0, "slow": 0}
+
+        def fetcher(key, restore):
+            async def fetch():
+                polls[key] += 1
+                return zzz_note(restore)
+
+            return fetch
+
+        watcher = NotesWatcher(min_interval=0.02, max_interval=1, margin=0)
+        watcher.watch("fast", fetcher("fast", timedelta(seconds=0.02)))
+        watcher.watch("slow", fetcher("slow", timedelta(seconds=10)))
+        task = asyncio.create_task(watcher.run())
+        await asyncio.sleep(0.15)
+        watcher.stop()
+        await task
+        assert polls["fast"] >= 4
+        assert polls["slow"] == 1
+
+    @staticmethod
+    async def test_errors_are_rescheduled():
+        errors, calls = [], []
+
+        async def failing():
+            calls.append("failing")
+            raise DataNotPublic({"retcode": 10102})
+
+        async def broken():
+            calls.append("broken")
+            raise KeyError("data")
+
+        def on_notes(key, notes):
+            raise RuntimeError("callback")
+
+        async def working():
+            calls.append("working")
+            return zzz_note(timedelta(0))
+
+        watcher = NotesWatcher(
+            error_interval=0.02,
+            max_interval=0.02,
+            on_notes=on_notes,
+            on_error=lambda key, exc: errors.append(key),
+        )
+        for key, fetch in (("failing", failing), ("broken", broken), ("working", working)):
+            watcher.watch(key, fetch)
+        task = asyncio.create_task(watcher.run())
+        await asyncio.sleep(0.1)
+        watcher.stop()
+        await task
+        assert errors.count("failing") >= 2
+        assert calls.count("broken") >= 2
+        assert calls.count("working") >= 2
+
+    @staticmethod
+    async def test_unwatch_and_rewatch():
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return zzz_note(timedelta(0))
+
+        watcher = NotesWatcher(max_interval=0.01)
+        watcher.watch("account", fetch, delay=0.05)
+        watcher.unwatch("account")
+        assert "account" not in watcher
+        watcher.watch("account", fetch, delay=10)
+        watcher.watch("account", fetch)
+        assert len(watcher) == 1
+        task = asyncio.create_task(watcher.run())
+        await asyncio.sleep(0.005)
+        watcher.unwatch("account")
+        await asyncio.sleep(0.05)
+        watcher.stop()
+        await task
+        assert len(calls) == 1
+
+    @staticmethod
+    async def test_watch_wakes_up_a_running_watcher():
+        polled = asyncio.Event()
+
+        async def fetch():
+            polled.set()
+            return zzz_note(timedelta(0))
+
+        watcher = NotesWatcher()
+        task = asyncio.create_task(watcher.run())
+        await asyncio.sleep(0)
+        watcher.watch("account", fetch)
+        await asyncio.wait_for(polled.wait(), 1)
+        watcher.stop()
+        await task
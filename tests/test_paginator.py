@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from simnet.errors import VisitsTooFrequently
+from simnet.utils.paginator import AdaptivePacing, CursorPaginator, PagePaginator
+
+ITEMS = [{"id": str(item_id)} for item_id in range(100, 0, -1)]
+
+
+class FakeCursorEndpoint:
+    def __init__(self, page_size: int = 10, delay: float = 0):
+        self.page_size = page_size
+        self.delay = delay
+        self.calls = []
+
+    async def __call__(self, end_id: int = 0):
+        self.calls.append(int(end_id))
+        await asyncio.sleep(self.delay)
+        start = next((index + 1 for index, item in enumerate(ITEMS) if item["id"] == str(end_id)), 0)
+        return {"list": ITEMS[start : start + self.page_size]}
+
+
+def make_paginator(endpoint, **kwargs) -> CursorPaginator:
+    return CursorPaginator(endpoint, pacing=AdaptivePacing(0), **kwargs)
+
+
+class TestCursorPaginator:
+    @staticmethod
+    @pytest.mark.parametrize("prefetch", [0, 3])
+    async def test_all_items(prefetch):
+        endpoint = FakeCursorEndpoint()
+        assert await make_paginator(endpoint, prefetch=prefetch).flatten() == ITEMS
+        assert len(endpoint.calls) == 11
+
+    @staticmethod
+    @pytest.mark.parametrize("prefetch", [0, 3])
+    async def test_limit(prefetch):
+        endpoint = FakeCursorEndpoint()
+        items = await make_paginator(endpoint, limit=15, prefetch=prefetch).flatten()
+        await asyncio.sleep(0.01)
+        assert items == ITEMS[:15]
+        assert endpoint.calls == [0, 91]
+
+    @staticmethod
+    @pytest.mark.parametrize("prefetch", [0, 3])
+    async def test_end_and_min_id(prefetch):
+        endpoint = FakeCursorEndpoint()
+        items = await make_paginator(endpoint, end_id=85, prefetch=prefetch).flatten()
+        assert items == ITEMS[:15] + ITEMS[16:20]
+        await asyncio.sleep(0.01)
+        assert endpoint.calls == [0, 91]
+
+        endpoint = FakeCursorEndpoint()
+        assert await make_paginator(endpoint, min_id=75, prefetch=prefetch).flatten() == ITEMS[:25]
+        await asyncio.sleep(0.01)
+        assert endpoint.calls == [0, 91, 81]
+
+    @staticmethod
+    async def test_resume_from_cursor():
+        paginator = make_paginator(FakeCursorEndpoint())
+        assert await paginator.flatten() == ITEMS
+        paginator = make_paginator(FakeCursorEndpoint(), cursor=int(ITEMS[41]["id"]))
+        assert (await paginator.flatten())[0] == ITEMS[42]
+
+    @staticmethod
+    async def test_prefetch_paces_request_starts():
+        loop = asyncio.get_running_loop()
+        starts = []
+
+        async def fetch(end_id: int = 0):
+            starts.append(loop.time())
+            await asyncio.sleep(0.03)
+            start = next((index + 1 for index, item in enumerate(ITEMS) if item["id"] == str(end_id)), 0)
+            return {"list": ITEMS[start : start + 25]}
+
+        started = loop.time()
+        paginator = CursorPaginator(fetch, prefetch=2, pacing=AdaptivePacing(0.03))
+        assert await paginator.flatten() == ITEMS
+        assert all(later - earlier >= 0.029 for earlier, later in zip(starts, starts[1:]))
+        # the pacing delay overlaps the requests, 5 sequential requests would take 0.27s
+        assert loop.time() - started < 0.23
+
+    @staticmethod
+    async def test_prefetch_shutdown():
+        endpoint = FakeCursorEndpoint(delay=0.01)
+        iterator = make_paginator(endpoint, prefetch=2).iterate()
+        assert await iterator.__anext__() == ITEMS[0]
+        await iterator.aclose()
+        calls = len(endpoint.calls)
+        await asyncio.sleep(0.05)
+        assert len(endpoint.calls) == calls
+        assert not [task for task in asyncio.all_tasks() if "producer" in repr(task)]
+
+    @staticmethod
+    async def test_prefetch_error():
+        async def fetch(end_id: int = 0):
+            if end_id:
+                raise RuntimeError("failed")
+            return {"list": ITEMS[:10]}
+
+        iterator = make_paginator(fetch, prefetch=2).iterate()
+        assert [await iterator.__anext__() for _ in range(10)] == ITEMS[:10]
+        with pytest.raises(RuntimeError, match="failed"):
+            await iterator.__anext__()
+
+
+class TestPagePaginator:
+    @staticmethod
+    async def test_window_is_capped_by_limit():
+        calls = []
+
+        async def fetch(page: int):
+            calls.append(page)
+            return list(range((page - 1) * 10, page * 10))
+
+        items = await PagePaginator(fetch, page_size=10, limit=15, prefetch=5).flatten()
+        assert items == list(range(15))
+        assert calls == [1, 2]
+
+    @staticmethod
+    async def test_stops_at_incomplete_page():
+        async def fetch(page: int):
+            return [page] * (10 if page < 3 else 4)
+
+        paginator = PagePaginator(fetch, page_size=10, prefetch=2)
+        assert len(await paginator.flatten()) == 24
+        assert paginator.cursor == 4
+
+
+class TestAdaptivePacing:
+    @staticmethod
+    async def test_backoff_and_recovery():
+        pacing = AdaptivePacing(0, max_delay=0.01, max_retries=2)
+        attempts = 0
+
+        async def fetch():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise VisitsTooFrequently
+            return "ok"
+
+        assert await pacing.call(fetch) == "ok"
+        assert attempts == 3
+        assert 0 < pacing.delay <= 0.01
+
+        attempts = -10
+        with pytest.raises(VisitsTooFrequently):
+            await pacing.call(fetch)
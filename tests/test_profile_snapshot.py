@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from simnet.client.components.chronicle.base import BaseChronicleClient
+from simnet.errors import DataNotPublic, TimedOut
+from simnet.utils.enums import Game
+
+
+class FakeChronicleClient(BaseChronicleClient):
+    def __init__(self):
+        super().__init__(player_id=800000001)
+
+
+async def user():
+    return {"level": 60}
+
+
+async def private():
+    raise DataNotPublic({"retcode": 10102})
+
+
+async def changed_payload():
+    return {}["data"]
+
+
+async def slow():
+    await asyncio.sleep(1)
+
+
+class TestProfileSnapshot:
+    @staticmethod
+    async def test_one_failing_section_keeps_the_others():
+        fetchers = {"user": user, "notes": private, "characters": changed_payload, "abyss": slow}
+        snapshot = await FakeChronicleClient()._get_profile_snapshot(
+            Game.GENSHIN, None, fetchers, timeouts={"abyss": 0.01}
+        )
+        assert snapshot.player_id == 800000001
+        assert snapshot.sections == {"user": {"level": 60}}
+        assert isinstance(snapshot.errors["notes"], DataNotPublic)
+        assert isinstance(snapshot.errors["characters"], KeyError)
+        assert isinstance(snapshot.errors["abyss"], TimedOut)
+        assert not snapshot.complete
+
+    @staticmethod
+    async def test_unknown_section():
+        with pytest.raises(ValueError, match="spiral"):
+            await FakeChronicleClient()._get_profile_snapshot(Game.GENSHIN, None, {"user": user}, ["spiral"])
@@ -0,0 +1,41 @@
+from simnet.client.base import BaseClient
+from simnet.client.components.calculator.genshin import CalculatorClient
+from simnet.utils.cache import MemoryCache
+
+
+class FakeCalculatorClient(CalculatorClient):
+    def __init__(self):
+        super().__init__(player_id=800000001)
+        self.requests = []
+
+    async def request_calculator(self, endpoint, *, method="POST", lang=None, params=None, data=None):
+        self.requests.append((endpoint, dict(data or {})))
+        return {"list": [{"id": 1, "name": data.get("keywords", "Item")}]}
+
+
+class TestSharedCache:
+    @staticmethod
+    async def test_disabled_by_default():
+        client = FakeCalculatorClient()
+        await client._get_calculator_items("weapon", {"weapon_cat_ids": [1]})
+        await client._get_calculator_items("weapon", {"weapon_cat_ids": [1]})
+        assert len(client.requests) == 2
+
+    @staticmethod
+    async def test_shared_between_clients(monkeypatch):
+        monkeypatch.setattr(BaseClient, "shared_cache", MemoryCache())
+        first, second = FakeCalculatorClient(), FakeCalculatorClient()
+        await first._get_calculator_items("weapon", {"weapon_cat_ids": [1]})
+        await second._get_calculator_items("weapon", {"weapon_cat_ids": [1]})
+        assert (len(first.requests), len(second.requests)) == (1, 0)
+        await second._get_calculator_items("weapon", {"weapon_cat_ids": [2]})
+        assert len(second.requests) == 1
+
+    @staticmethod
+    async def test_keyword_queries_are_not_cached(monkeypatch):
+        monkeypatch.setattr(BaseClient, "shared_cache", MemoryCache())
+        client = FakeCalculatorClient()
+        weapons = await client._get_calculator_items("weapon", {"weapon_cat_ids": []}, "Sword")
+        await client._get_calculator_items("weapon", {"weapon_cat_ids": []}, "Sword")
+        assert weapons == [{"id": 1, "name": "Sword"}]
+        assert len(client.requests) == 2
@@ -0,0 +1,123 @@
+import io
+import json
+from datetime import datetime
+
+import pytest
+
+from simnet.models.genshin.wish import Wish
+from simnet.models.starrail.wish import StarRailWish
+from simnet.models.zzz.wish import ZZZWish
+from simnet.utils.uigf import UIGFWriter, iter_uigf
+
+TIME = datetime(2024, 1, 1, 12, 30)
+
+
+def genshin_wishes(uid: int, count: int) -> list[Wish]:
+    return [
+        Wish(
+            uid=uid,
+            id=1000 + index,
+            item_type="角色",
+            name=f"Item {index}",
+            rank_type=5 if index % 10 == 9 else 3,
+            time=TIME,
+            gacha_type=400 if index % 2 else 301,
+            banner_name="Banner",
+        )
+        for index in range(count)
+    ]
+
+
+def starrail_wish(uid: int) -> StarRailWish:
+    return StarRailWish(
+        uid=uid,
+        id=2000,
+        item_type="光锥",
+        item_id=20000,
+        name="Cone",
+        rank_type=4,
+        time=TIME,
+        gacha_id=1001,
+        gacha_type=11,
+    )
+
+
+def zzz_wish(uid: int) -> ZZZWish:
+    return ZZZWish(
+        uid=uid,
+        id=3000,
+        item_type="代理人",
+        item_id=1011,
+        name="Agent",
+        rank_type=3,
+        time=TIME,
+        gacha_id=2001,
+        gacha_type=2,
+    )
+
+
+class TestUIGF:
+    @staticmethod
+    def test_round_trip():
+        fp = io.StringIO()
+        wishes = genshin_wishes(100000001, 25)
+        with UIGFWriter(fp, export_timestamp=1) as writer:
+            assert writer.write_account(100000001, wishes) == 25
+            assert writer.write_account(100000002, genshin_wishes(100000002, 1)) == 1
+            writer.write_account(800000001, [starrail_wish(800000001)])
+            writer.write_account(10000001, [zzz_wish(10000001)])
+
+        document = json.loads(fp.getvalue())
+        assert document["info"]["version"] == "v4.0"
+        assert [account["uid"] for account in document["hk4e"]] == ["100000001", "100000002"]
+        assert document["hk4e"][0]["list"][1]["uigf_gacha_type"] == "301"
+        assert document["nap"][0]["list"][0]["rank_type"] == "3"
+
+        fp.seek(0)
+        entries = list(iter_uigf(fp, banner_name="Banner"))
+        assert [entry.wish for entry in entries[:25]] == wishes
+        assert entries[25].uid == 100000002
+        assert (entries[26].game, entries[26].wish) == ("hkrpg", starrail_wish(800000001))
+        assert (entries[27].game, entries[27].wish) == ("nap", zzz_wish(10000001))
+
+    @staticmethod
+    def test_games_must_be_consecutive():
+        writer = UIGFWriter(io.StringIO())
+        writer.write_account(100000001, genshin_wishes(100000001, 1))
+        writer.write_account(800000001, [starrail_wish(800000001)])
+        with pytest.raises(ValueError, match="consecutively"):
+            writer.write_account(100000002, genshin_wishes(100000002, 1))
+
+    @staticmethod
+    async def test_write_account_async():
+        async def stream():
+            for wish in genshin_wishes(100000001, 3):
+                yield wish
+
+        fp = io.StringIO()
+        with UIGFWriter(fp) as writer:
+            assert await writer.write_account_async(100000001, stream()) == 3
+        fp.seek(0)
+        assert [entry.wish.id for entry in iter_uigf(fp)] == [1000, 1001, 1002]
+
+    @staticmethod
+    def test_legacy_document():
+        document = {
+            "info": {"uid": "800000001", "lang": "zh-cn", "srgf_version": "v1.0"},
+            "list": [
+                {
+                    "gacha_id": "1001",
+                    "gacha_type": "11",
+                    "item_id": "20000",
+                    "count": "1",
+                    "time": "2024-01-01 12:30:00",
+                    "name": "Cone",
+                    "item_type": "光锥",
+                    "rank_type": "4",
+                    "id": "2000",
+                }
+            ],
+        }
+        (entry,) = iter_uigf(io.StringIO(json.dumps(document)))
+        assert (entry.game, entry.uid, entry.lang) == ("hkrpg", 800000001, "zh-cn")
+        assert entry.wish == starrail_wish(800000001)
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from simnet.models.zzz.wish import ZZZWish
+from simnet.utils.wish_merge import merge_wishes
+
+START = datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=8)))
+
+
+def make_wish(wish_id: int, banner_id: int = 0, name: str = "Agent", time: datetime = START) -> ZZZWish:
+    return ZZZWish(
+        uid=10000001,
+        id=wish_id,
+        item_type="代理人",
+        item_id=1011,
+        name=name,
+        rank_type=3,
+        time=time,
+        gacha_id=banner_id,
+        gacha_type=2,
+    )
+
+
+class TestMergeWishes:
+    @staticmethod
+    def test_deduplicates_by_id():
+        authkey = [make_wish(1, 2001), make_wish(3, 2001)]
+        hoyolab = [make_wish(1), make_wish(2), make_wish(3)]
+        assert [wish.id for wish in merge_wishes(authkey, hoyolab)] == [1, 2, 3]
+
+    @staticmethod
+    def test_precedence_and_missing_fields():
+        authkey = [make_wish(1, 0, "Authkey")]
+        hoyolab = [make_wish(1, 2001, "HoYoLAB")]
+        (wish,) = merge_wishes(authkey, hoyolab)
+        assert (wish.name, wish.banner_id) == ("Authkey", 2001)
+        (wish,) = merge_wishes(hoyolab, authkey)
+        assert (wish.name, wish.banner_id) == ("HoYoLAB", 2001)
+
+    @staticmethod
+    def test_times_in_another_time_zone():
+        utc = [make_wish(1, time=START.astimezone(timezone.utc).replace(tzinfo=None)), make_wish(3)]
+        local = [make_wish(1, time=START.replace(tzinfo=None)), make_wish(2)]
+        assert [wish.id for wish in merge_wishes(utc, local)] == [1, 2, 3]
@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from simnet.models.genshin.wish import BannerType, Wish
+from simnet.utils.enums import Game
+from simnet.utils.wish_stats import (
+    WishColumns,
+    analyze_wish_histories,
+    compute_banner_stats,
+    compute_pity,
+    luck_percentiles,
+)
+
+STANDARD_ITEMS = {(Game.GENSHIN, BannerType.CHARACTER): {"Diluc"}}
+
+
+def make_history(uid: int, rarities: list[int], banner_type: int = BannerType.CHARACTER, names=None) -> list[Wish]:
+    start = datetime(2024, 1, 1)
+    names = names or {}
+    return [
+        Wish(
+            uid=uid,
+            id=index + 1,
+            item_type="Character",
+            name=names.get(index, "Item"),
+            rank_type=rarity,
+            time=start + timedelta(minutes=index),
+            gacha_type=banner_type,
+            banner_name="",
+        )
+        for index, rarity in enumerate(rarities)
+    ]
+
+
+class TestWishStats:
+    @staticmethod
+    def test_compute_pity():
+        columns = WishColumns.from_wishes(make_history(1, [3, 4, 3, 5, 3]))
+        pity5, pity4 = compute_pity(columns)
+        assert list(pity5) == [1, 2, 3, 4, 1]
+        assert list(pity4) == [1, 2, 1, 2, 1]
+
+    @staticmethod
+    def test_shared_pity_pool():
+        history = make_history(1, [3, 3], BannerType.CHARACTER) + make_history(1, [3], BannerType.CHARACTER2)
+        columns = WishColumns.from_wishes(history)
+        assert set(columns.pool) == {BannerType.CHARACTER}
+        assert list(compute_pity(columns)[0]) == [1, 2, 3]
+
+    @staticmethod
+    def test_compute_banner_stats():
+        history = make_history(1, [3, 3, 5, 3, 4, 5, 3], names={2: "Diluc", 5: "Furina"})
+        stats = compute_banner_stats(WishColumns.from_wishes(history, STANDARD_ITEMS))
+        stat = stats[(1, BannerType.CHARACTER)]
+        assert stat.total == 7
+        assert stat.five_stars == 2
+        assert stat.four_stars == 1
+        assert stat.pity == 1
+        assert stat.four_star_pity == 1
+        assert stat.average_pity == pytest.approx(3.0)
+        assert (stat.won, stat.lost) == (1, 1)
+        assert stat.guaranteed is False
+
+    @staticmethod
+    def test_unknown_rate_up_without_standard_items():
+        stats = compute_banner_stats(WishColumns.from_wishes(make_history(1, [3, 5])))
+        stat = stats[(1, BannerType.CHARACTER)]
+        assert (stat.won, stat.lost) == (0, 0)
+        assert stat.guaranteed is None
+
+    @staticmethod
+    def test_luck_percentiles():
+        stats, percentiles = analyze_wish_histories(
+            [make_history(1, [3, 5]), make_history(2, [3, 3, 3, 5]), make_history(3, [3, 3])]
+        )
+        assert percentiles == {(1, BannerType.CHARACTER): 75.0, (2, BannerType.CHARACTER): 25.0}
+        assert luck_percentiles(stats.values()) == percentiles
+
+    @staticmethod
+    def test_standard_items_by_pool():
+        history = make_history(1, [5], names={0: "Diluc"}) + make_history(1, [5], BannerType.WEAPON, names={0: "Diluc"})
+        stats = compute_banner_stats(WishColumns.from_wishes(history, STANDARD_ITEMS))
+        assert stats[(1, BannerType.CHARACTER)].lost == 1
+        weapon = stats[(1, BannerType.WEAPON)]
+        assert (weapon.won, weapon.lost, weapon.guaranteed) == (0, 0, None)
+
+    @staticmethod
+    def test_interleaved_users_and_pools():
+        first, second = make_history(1, [3, 5, 3, 4, 3]), make_history(2, [4, 3, 5])
+        weapon = make_history(1, [3, 3, 4], BannerType.WEAPON)
+        rows = [first[0], second[0], weapon[0], first[1], second[1], first[2], weapon[1], second[2]]
+        rows += [first[3], weapon[2], first[4]]
+        pity5, pity4 = compute_pity(WishColumns.from_wishes(rows))
+        assert list(pity5) == [1, 1, 1, 2, 2, 1, 2, 3, 2, 3, 3]
+        assert list(pity4) == [1, 1, 1, 2, 1, 1, 2, 2, 2, 3, 1]
+        stats = compute_banner_stats(WishColumns.from_wishes(rows))
+        assert (stats[(1, BannerType.CHARACTER)].pity, stats[(1, BannerType.CHARACTER)].four_star_pity) == (3, 1)
+        assert (stats[(2, BannerType.CHARACTER)].pity, stats[(2, BannerType.CHARACTER)].average_pity) == (0, 3.0)
+        assert stats[(1, BannerType.WEAPON)].four_stars == 1